@@ -2,6 +2,8 @@ import csv
 import datetime 
 import os
 
+from price_history import record_export
+
 class CSVCreator:
     def __init__(self, data, website_scraped, output_folder, pc_part_selected, currency_symbol=""):
         self.data = data
@@ -15,7 +17,8 @@ class CSVCreator:
         self.filename = os.path.join(output_folder, f"{self.pc_part_selected}_Data_{timestamp}.csv")
 
         self.create_csv()
-        self.create_history_copy(timestamp)
+        record_export(self.data, self.website_scraped, self.pc_part_selected,
+                      write_file_copy=lambda: self.create_history_copy(timestamp))
 
     def create_csv(self):
         """Create the main CSV file"""
@@ -63,4 +66,5 @@ class CSVCreator:
                 row = {field: product.get(field, '') for field in fieldnames}
                 writer.writerow(row)
                 
-        print(f"History copy created: {history_filename}")
\ No newline at end of file
+        print(f"History copy created: {history_filename}")
+        return history_filename
\ No newline at end of file
@@ -2,6 +2,8 @@ import json
 import datetime 
 import os
 
+from price_history import record_export
+
 class JSONCreator:
     def __init__(self, data, website_scraped, output_folder, pc_part_selected, currency_symbol=""):
         self.data = data
@@ -15,7 +17,8 @@ class JSONCreator:
         self.filename = os.path.join(output_folder, f"{self.pc_part_selected}_Data_{timestamp}.json")
 
         self.create_json()
-        self.create_history_copy(timestamp)
+        record_export(self.data, self.website_scraped, self.pc_part_selected,
+                      write_file_copy=lambda: self.create_history_copy(timestamp))
 
     def create_json(self):
         """Create the main JSON file"""
@@ -32,4 +35,5 @@ class JSONCreator:
         
         with open(history_filename, "w") as json_file:
             json.dump(self.data, json_file, ensure_ascii=False, indent=4)
-        print(f"History copy created: {history_filename}")
\ No newline at end of file
+        print(f"History copy created: {history_filename}")
+        return history_filename
\ No newline at end of file
@@ -0,0 +1,35 @@
+import datetime
+import os
+
+from parquet_history import products_frame
+from price_history import record_export
+
+
+class ParquetCreator:
+    def __init__(self, data, website_scraped, output_folder, pc_part_selected, currency_symbol=""):
+        self.data = data
+        self.website_scraped = website_scraped
+        self.currency_symbol = currency_symbol or "$"
+        self.pc_part_selected = pc_part_selected
+
+        os.makedirs(output_folder, exist_ok=True)
+
+        self.scraped_at = datetime.datetime.now()
+        timestamp = self.scraped_at.strftime("%Y%m%d_%H%M%S")
+        self.filename = os.path.join(output_folder, f"{self.pc_part_selected}_Data_{timestamp}.parquet")
+
+        self.create_parquet()
+        self.create_history_partition()
+
+    def create_parquet(self):
+        """Create the main Parquet file"""
+        if not self.data:
+            print("⚠️ No data to save to Parquet")
+            return
+
+        products_frame(self.data, self.scraped_at).to_parquet(self.filename, index=False, compression='zstd')
+        print(f"Parquet file created: {self.filename}")
+
+    def create_history_partition(self):
+        """Record the export in the price history (which also appends the Parquet history partition)"""
+        record_export(self.data, self.website_scraped, self.pc_part_selected)
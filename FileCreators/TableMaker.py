@@ -1,7 +1,11 @@
+import math
 import xlsxwriter
 from datetime import datetime
 import os
 
+from price_normalizer import parse_prices
+from price_history import record_export
+
 class TableMaker:
     def __init__(self, data, website_scraped, output_folder, pc_part_selected, currency_symbol=""):
         self.data = data
@@ -14,11 +18,15 @@ class TableMaker:
         self.filename = os.path.join(output_folder, f"{self.pc_part_selected}_Data_{timestamp}.xlsx")
         self.create_table(self.filename)
 
+        record_export(self.data, self.website_scraped, self.pc_part_selected,
+                      write_file_copy=lambda: self.create_history_copy(timestamp))
+
+    def create_history_copy(self, timestamp):
+        """Create a copy in the scrape-history folder"""
         history_dir = os.path.join("./scrape-history/data/excel", self.website_scraped, self.pc_part_selected)
-        os.makedirs(history_dir, exist_ok=True)
         history_filename = os.path.join(history_dir, f"{self.website_scraped}_{self.pc_part_selected}_{timestamp}.xlsx")
         self.create_table(history_filename)
-        self.create_table()
+        return history_filename
 
     def create_table(self, filename=None):
         if filename is None:
@@ -74,23 +82,17 @@ class TableMaker:
         for col, header in enumerate(headers):
             worksheet.write(0, col, header, header_format)
 
+        prices = parse_prices([product.get("price") for product in self.data]).tolist()
+
         for row, product in enumerate(self.data, start=1):
             worksheet.write(row, 0, product.get("title", "N/A"), text_format)
 
-            price_value = product.get("price", "N/A")
-            if isinstance(price_value, (int, float)):
-                worksheet.write(row, 1, price_value, currency_format)
-            elif price_value == "N/A":
-                worksheet.write(row, 1, "N/A", text_format)
+            price_num = prices[row - 1]
+            if not math.isnan(price_num):
+                worksheet.write(row, 1, price_num, currency_format)
             else:
-                price_str = str(price_value).split("/")[0].strip()
-                for symbol in ["лв", "$", "€", "£", "¥", "₩", "R$", "₹"]:
-                    price_str = price_str.replace(symbol, "")
-                try:
-                    price_num = float(price_str)
-                    worksheet.write(row, 1, price_num, currency_format)
-                except ValueError:
-                    worksheet.write(row, 1, str(price_value), text_format)
+                price_value = product.get("price")
+                worksheet.write(row, 1, "N/A" if price_value is None else str(price_value), text_format)
             
             worksheet.write(row, 2, product.get("url", "N/A"), url_format)
 
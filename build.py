@@ -90,15 +90,25 @@ def pyinstaller_cmd(name, entry_script, console=True, extra_data=None):
         "scrapers.ezona_bg_scraper",
         "scrapers.gt_computers",
         "scrapers.hits_bg_scraper",
+        "scrapers.http_fetcher",
+        "scrapers.incremental_state",
+        "scrapers.page_cache",
+        "scrapers.rate_limiter",
+        "scrapers.registry",
+        "scrapers.request_filter",
+        "scrapers.keyword_filter",
+        "scrapers.result_sink",
         "scrapers.jar_computers_scraper",
         "scrapers.optimal_computers_scraper",
         "scrapers.pc_tech_scraper",
         "scrapers.pic_bg_scraper",
         "scrapers.plasico_scraper",
         "scrapers.pro_bg_scraper",
+        "scrapers.product",
         "scrapers.scraper_container_class",
         "scrapers.scraper_utils",
         "scrapers.senetic_scraper",
+        "scrapers.session_journal",
         "scrapers.techno_mall_scraper",
         "scrapers.tehnik_store_scraper",
         "scrapers.thnx_bg_scraper",
@@ -128,8 +138,17 @@ def pyinstaller_cmd(name, entry_script, console=True, extra_data=None):
         "urllib3",
         "xlsxwriter",
         "currency_converter",
+        "price_normalizer",
+        "price_history",
+        "history_manifest",
+        "parquet_history",
+        "product_matcher",
+        "pyarrow",
         "matplotlib",
         "aiohttp",
+        "curl_cffi",
+        "bs4",
+        "lxml",
         "pandas",
         "numpy",
         "dotenv",
@@ -1,73 +1,215 @@
-import yfinance as yf
+import asyncio
+import json
+import os
+import threading
+import time
+
 import requests
-from datetime import datetime, timedelta
+
+# Currencies with a fixed rate to the euro, used when no live or stored rate exists
+EUR_PEGS = {
+    "EUR": 1.0,
+    "BGN": 1.95583,
+}
+
+
+class CurrencyRateStore:
+    """EUR-based rate table with a timestamp per currency, persisted to disk.
+    Any pair is derived from the table (from -> EUR -> to), so one batch fetch covers every pair."""
+
+    def __init__(self, rates_file=os.path.join("configs", "currency_rates.json"), ttl=3600, retry_after=300):
+        self.rates_file = rates_file
+        self.ttl = ttl
+        self.retry_after = retry_after
+
+        self.rates = {}
+        self._last_failed_refresh = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.rates_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.rates = {
+                currency: entry for currency, entry in data.get('rates', {}).items()
+                if isinstance(entry, dict) and entry.get('rate')
+            }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read stored currency rates: {e}")
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.rates_file) or ".", exist_ok=True)
+            tmp_file = self.rates_file + ".tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'base': 'EUR', 'rates': self.rates}, f, indent=4)
+            os.replace(tmp_file, self.rates_file)
+        except OSError as e:
+            print(f"⚠️ Could not save currency rates: {e}")
+
+    def is_fresh(self, currency):
+        if currency == "EUR":
+            return True
+        entry = self.rates.get(currency)
+        return bool(entry) and time.time() - entry['fetched_at'] < self.ttl
+
+    def per_eur(self, currency):
+        """Units of currency per 1 EUR from live/stored rates, then pegs; None if unknown"""
+        if currency == "EUR":
+            return 1.0
+        entry = self.rates.get(currency)
+        if entry:
+            return entry['rate']
+        return EUR_PEGS.get(currency)
+
+    def update(self, rates_per_eur, source):
+        """Store a batch of {currency: units per EUR}"""
+        now = time.time()
+        for currency, rate in rates_per_eur.items():
+            try:
+                rate = float(rate)
+            except (TypeError, ValueError):
+                continue
+            if rate > 0:
+                self.rates[currency.upper()] = {'rate': rate, 'fetched_at': now, 'source': source}
+        self._save()
+
+    def ensure_fresh(self, currencies, fetch_batch):
+        """Refresh the table in one batch when any of the currencies is missing or stale.
+        fetch_batch(currencies) returns ({currency: per EUR}, source) or (None, None).
+        After a failed refresh the stored (possibly stale) rates are served for retry_after seconds."""
+        with self._lock:
+            needed = [c for c in currencies if not self.is_fresh(c)]
+            if not needed:
+                return True
+            if time.time() - self._last_failed_refresh < self.retry_after:
+                return False
+
+            wanted = sorted(set(needed) | set(self.rates) - {"EUR"})
+            rates, source = fetch_batch(wanted)
+            if not rates:
+                self._last_failed_refresh = time.time()
+                print(f"⚠️ Currency rates unavailable, using stored rates for {', '.join(needed)}")
+                return False
+
+            self.update(rates, source)
+            return True
+
 
 class RealCurrencyConverter:
-    def __init__(self):
-        self.rates_cache = {}
-        self.cache_time = None
-        self.cache_duration = 3600  
-        
+    def __init__(self, rate_store=None):
+        self.rate_store = rate_store or CurrencyRateStore()
+        self.cache_duration = self.rate_store.ttl
+        self._inflight = {}
+
+    def prefetch(self, currencies):
+        """Fetch every currency a run will need in one batch before scraping starts"""
+        currencies = {c.upper() for c in currencies if c}
+        return self.rate_store.ensure_fresh(currencies, self._fetch_rate_table)
+
     def get_real_time_rate(self, from_currency, to_currency):
-        """Get real-time rate with fallback sources"""
+        """Rate for any pair, triangulated through the EUR table"""
         if from_currency == to_currency:
             return 1.0
-        
-        cache_key = f"{from_currency}_{to_currency}"
 
-        if (cache_key in self.rates_cache and 
-            self.cache_time and 
-            (datetime.now() - self.cache_time).seconds < self.cache_duration):
-            return self.rates_cache[cache_key]
+        from_currency = from_currency.upper()
+        to_currency = to_currency.upper()
+        self.rate_store.ensure_fresh([from_currency, to_currency], self._fetch_rate_table)
+
+        from_per_eur = self.rate_store.per_eur(from_currency)
+        to_per_eur = self.rate_store.per_eur(to_currency)
+        if from_per_eur and to_per_eur:
+            return to_per_eur / from_per_eur
 
-        rate = self._get_yahoo_rate(from_currency, to_currency)
-        if rate:
-            self.rates_cache[cache_key] = rate
-            self.cache_time = datetime.now()
-            return rate
-        
-        rate = self._get_exchangerate_api(from_currency, to_currency)
-        if rate:
-            self.rates_cache[cache_key] = rate
-            self.cache_time = datetime.now()
-            return rate
-        
         rate = self._get_fallback_rate(from_currency, to_currency)
         if rate:
             print(f"⚠️ Using fallback rate (may be outdated)")
             return rate
-        
+
         return None
-    
-    def _get_yahoo_rate(self, from_currency, to_currency):
-        """Get rate from Yahoo Finance"""
+
+    def get_cached_rate(self, from_currency, to_currency):
+        """Rate from the in-memory table (fresh or stale) or the pegs; never touches the network"""
+        if from_currency == to_currency:
+            return 1.0
+        from_per_eur = self.rate_store.per_eur(from_currency.upper())
+        to_per_eur = self.rate_store.per_eur(to_currency.upper())
+        if from_per_eur and to_per_eur:
+            return to_per_eur / from_per_eur
+        return self._get_fallback_rate(from_currency.upper(), to_currency.upper())
+
+    async def get_rate_async(self, from_currency, to_currency):
+        """Rate for a pair without blocking the event loop; concurrent callers for the same pair share one lookup"""
+        if from_currency == to_currency:
+            return 1.0
+        if self.rate_store.is_fresh(from_currency.upper()) and self.rate_store.is_fresh(to_currency.upper()):
+            return self.get_cached_rate(from_currency, to_currency)
+
+        loop = asyncio.get_running_loop()
+        key = (from_currency.upper(), to_currency.upper())
+        future = self._inflight.get(key)
+        if future is None or future.get_loop() is not loop:
+            future = loop.run_in_executor(None, self.get_real_time_rate, from_currency, to_currency)
+            self._inflight[key] = future
+            future.add_done_callback(lambda done, key=key: self._inflight.pop(key, None) if self._inflight.get(key) is done else None)
+
+        return await asyncio.shield(future)
+
+    def _get_fallback_rate(self, from_currency, to_currency):
+        """Fixed euro pegs, for when neither a live nor a stored rate exists"""
+        if from_currency in EUR_PEGS and to_currency in EUR_PEGS:
+            return EUR_PEGS[to_currency] / EUR_PEGS[from_currency]
+        return None
+
+    def _fetch_rate_table(self, currencies):
+        """One request for the whole EUR table, with Yahoo Finance as a batched fallback"""
+        rates = self._get_exchangerate_api_table()
+        if rates:
+            return rates, 'exchangerate-api'
+
+        rates = self._get_yahoo_table(currencies)
+        if rates:
+            return rates, 'yahoo'
+        return None, None
+
+    def _get_exchangerate_api_table(self):
+        """All rates against EUR from ExchangeRate-API in a single call"""
         try:
-            ticker = f"{from_currency}{to_currency}=X"
-            data = yf.download(ticker, period="1d", progress=False)
-            
-            if not data.empty:
-                rate = data['Close'].iloc[-1]
-
-                if hasattr(rate, 'item'):
-                    rate = rate.item()
-                else:
-                    rate = float(rate)
-                print(f"📊 Yahoo Finance {from_currency}/{to_currency}: {rate:.4f}")
-                return rate
+            response = requests.get("https://api.exchangerate-api.com/v4/latest/EUR", timeout=10)
+            rates = response.json()['rates']
+            print(f"📊 ExchangeRate-API: loaded {len(rates)} rates against EUR")
+            return rates
         except Exception as e:
-            print(f"Yahoo Finance failed: {e}")
-        return None
-    
-    def _get_exchangerate_api(self, from_currency, to_currency):
-        """Get rate from ExchangeRate-API"""
+            print(f"ExchangeRate-API failed: {e}")
+            return None
+
+    def _get_yahoo_table(self, currencies):
+        """EUR crosses for the requested currencies from Yahoo Finance in one download"""
+        tickers = {f"EUR{currency}=X": currency for currency in currencies if currency != "EUR"}
+        if not tickers:
+            return None
+
         try:
-            url = f"https://api.exchangerate-api.com/v4/latest/{from_currency}"
-            response = requests.get(url, timeout=10)
-            data = response.json()
-            rate = data['rates'][to_currency]
-            print(f"📊 ExchangeRate-API {from_currency}/{to_currency}: {rate:.4f}")
-            return rate
-        except:
+            import yfinance as yf
+
+            data = yf.download(list(tickers), period="5d", progress=False)
+            if data.empty:
+                return None
+
+            close = data['Close']
+            rates = {}
+            for ticker, currency in tickers.items():
+                series = close[ticker] if ticker in getattr(close, 'columns', []) else close
+                series = series.dropna()
+                if not series.empty:
+                    rates[currency] = float(series.iloc[-1])
+            print(f"📊 Yahoo Finance: loaded {len(rates)} EUR rates")
+            return rates or None
+        except Exception as e:
+            print(f"Yahoo Finance failed: {e}")
             return None
 
     def convert_currency(self, amount, from_currency, to_currency):
@@ -77,4 +219,4 @@ class RealCurrencyConverter:
             converted = amount * rate
             print(f"✅ Converted {amount} {from_currency} to {converted:.2f} {to_currency}")
             return converted
-        return None
\ No newline at end of file
+        return None
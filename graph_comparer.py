@@ -7,21 +7,32 @@ import customtkinter as ctk
 from pathlib import Path
 from datetime import datetime
 import os
-import re
+
+from price_normalizer import parse_prices
+from price_history import get_history_db
+from parquet_history import read_history
+from history_manifest import timestamp_from_filename
+
+# How many runs, files or dates a chart shows when no date range is given
+HISTORY_WINDOW = 10
 
 class GraphComparer:
-    def __init__(self, comparison_data, file_format, parent_window=None):
+    def __init__(self, comparison_data, file_format, parent_window=None, start_date=None, end_date=None):
         """
         Initialize GraphComparer with comparison data
         
         Args:
             comparison_data: Dictionary from HistoricalComparison.get_summary()['data']
-            file_format: 'CSV' or 'JSON'
+            file_format: 'CSV', 'JSON' or 'Parquet'
             parent_window: Parent CTk window for embedding plots
+            start_date / end_date: date range to chart (Parquet history only reads these partitions);
+                without one the last HISTORY_WINDOW dates are charted
         """
         self.comparison_data = comparison_data
         self.file_format = file_format.lower()
         self.parent_window = parent_window
+        self.start_date = start_date
+        self.end_date = end_date
         self.figures = []
         
         self.first_website_data = self._load_website_data('first_website')
@@ -36,12 +47,28 @@ class GraphComparer:
         """Load data for a specific website"""
         try:
             website_info = self.comparison_data[website_key]
+            if self.comparison_data.get('source') == 'parquet':
+                start_date, end_date = self.start_date, self.end_date
+                if start_date is None and end_date is None:
+                    recent_dates = website_info['files'][:HISTORY_WINDOW]
+                    start_date = recent_dates[-1] if recent_dates else None
+                frame = read_history(
+                    website_info['name'], self.comparison_data['part'],
+                    start_date=start_date, end_date=end_date,
+                )
+                frame = frame.rename(columns={'scraped_at': 'date'})
+                frame['website'] = website_info['name']
+                return frame
+
+            if self.comparison_data.get('source') == 'history_db':
+                return get_history_db().load_prices(website_info['run_ids'][:HISTORY_WINDOW])
+
             base_path = Path("./scrape-history/data") / self.file_format
             website_path = base_path / website_info['name'] / self.comparison_data['part']
         
             all_data = []
         
-            for filename in website_info['files'][:10]:  
+            for filename in website_info['files'][:HISTORY_WINDOW]:  
                 file_path = website_path / filename
                 data = self._read_file(file_path)
                 if data is not None:
@@ -72,15 +99,9 @@ class GraphComparer:
             return None
     
     def _extract_date_from_filename(self, filename):
-        """Extract date from filename"""
-        try:
-            date_pattern = r'(\d{4}-\d{2}-\d{2})'
-            match = re.search(date_pattern, filename)
-            if match:
-                return match.group()  
-            return "Unknown"
-        except:
-            return "Unknown"
+        """Extract the YYYYMMDD_HHMMSS timestamp from a history file name"""
+        when = timestamp_from_filename(filename)
+        return when.strftime("%Y-%m-%d %H:%M:%S") if when else "Unknown"
     
     def _prepare_price_data(self):
         """Prepare price data for visualization"""
@@ -125,20 +146,7 @@ class GraphComparer:
         Clean price column with various formats
         Handles: 'Ft24929.13', '24929.13 Ft', '24,929.13', etc.
         """
-        if price_series.empty:
-            return pd.Series([], dtype=float)
-    
-        prices = price_series.astype(str)
-    
-        prices = prices.str.replace(r'[^\d.,]', '', regex=True)
-    
-        if prices.str.contains(r'\d+,\d{2}$').any():
-            prices = prices.str.replace('.', '', regex=False)  
-            prices = prices.str.replace(',', '.', regex=False)  
-        else:
-            prices = prices.str.replace(',', '', regex=False)  
-    
-        return pd.to_numeric(prices, errors='coerce')   
+        return parse_prices(price_series)
     
     def create_basic_comparison_plot(self, parent_frame):
         """Create basic comparison plot that works without dates"""
@@ -3,6 +3,10 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+from price_history import get_history_db
+from history_manifest import HistoryManifest, timestamp_from_filename
+from parquet_history import history_dates, read_history
+
 class HistoricalComparison:
     def __init__(self, file_format, part_for_comparison, first_website, second_website):
         self.file_format = file_format
@@ -11,6 +15,9 @@ class HistoricalComparison:
         self.second_website = second_website
         self.first_website_files = []
         self.second_website_files = []
+        self.first_website_runs = []
+        self.second_website_runs = []
+        self.source = 'files'
         self.error_message = ""
         self.success = False
         self.comparison_data = {}
@@ -24,12 +31,47 @@ class HistoricalComparison:
             return
 
         format_lower = self.file_format.lower().strip()
-        if format_lower not in ['json', 'csv']:
+        if format_lower not in ['json', 'csv', 'parquet']:
             self.error_message = f"Unsupported file format: {self.file_format}"
             return
 
-        if self._check_file_availability():
+        if format_lower == 'parquet':
+            available = self._check_parquet_history()
+        else:
+            available = self._check_history_db() or self._check_file_availability()
+        if available:
             self._load_comparison_data()
+
+    def _check_parquet_history(self):
+        """Parquet history is partitioned by date; each date partition counts as one entry"""
+        self.first_website_files = history_dates(self.first_website, self.part_for_comparison)
+        self.second_website_files = history_dates(self.second_website, self.part_for_comparison)
+        for website, dates in ((self.first_website, self.first_website_files),
+                               (self.second_website, self.second_website_files)):
+            if not dates:
+                self.error_message = f"No Parquet history for {self.part_for_comparison} on {website}. Run a scrape on {website} for the particular part first"
+                return False
+        self.source = 'parquet'
+        return True
+
+    def _check_history_db(self):
+        """Use the price history store when it has runs for both websites"""
+        db = get_history_db()
+        if db is None:
+            return False
+
+        self.first_website_runs = db.runs(self.first_website, self.part_for_comparison)
+        self.second_website_runs = db.runs(self.second_website, self.part_for_comparison)
+        if not self.first_website_runs or not self.second_website_runs:
+            return False
+
+        self.first_website_files = [self._run_label(run) for run in self.first_website_runs]
+        self.second_website_files = [self._run_label(run) for run in self.second_website_runs]
+        self.source = 'history_db'
+        return True
+
+    def _run_label(self, run):
+        return datetime.fromtimestamp(run['scraped_at']).strftime("%Y-%m-%d %H:%M:%S")
     
     def _check_file_availability(self):
         """Check if both websites have historical files"""
@@ -39,19 +81,6 @@ class HistoricalComparison:
             first_path = base_path / self.file_format.lower() / self.first_website / self.part_for_comparison
             second_path = base_path / self.file_format.lower() / self.second_website / self.part_for_comparison
 
-            print(first_path)
-            print(second_path
-                  )
-            if base_path.exists():
-                print(f"\nDirectories in {base_path}:")
-                for item in base_path.iterdir():
-                    if item.is_dir():
-                        print(f"  - {item.name}")
-                    
-                    if self.first_website.lower() in item.name.lower():
-                        print(f"    ⚠️  Possible match for {self.first_website}: {item.name}")
-                    if self.second_website.lower() in item.name.lower():
-                        print(f"    ⚠️  Possible match for {self.second_website}: {item.name}")
             if not first_path.exists() and not second_path.exists():
                 self.error_message = f"Part information for {self.part_for_comparison} not found for {self.first_website} and {self.second_website}. Run a scrape on both wesbites for the particular part and then compare"
                 return False
@@ -64,20 +93,9 @@ class HistoricalComparison:
                 self.error_message = f"Part information for {self.part_for_comparison} not found for {self.second_website}. Run a scrape on {self.second_website} wesbite for the particular part and then compare"
                 return False
             
-            self.first_website_files = []
-            for f in first_path.iterdir():
-                if f.is_file() and not f.name.startswith('.'):
-                    if f.suffix.lower() in ['.csv', '.json']:
-                        self.first_website_files.append(f.name)
-        
-            self.second_website_files = []
-            for f in second_path.iterdir():
-                if f.is_file() and not f.name.startswith('.'):
-                    if f.suffix.lower() in ['.csv', '.json']:
-                        self.second_website_files.append(f.name)
-
-            self.first_website_files.sort(key=self._extract_date_from_filename, reverse=True)
-            self.second_website_files.sort(key=self._extract_date_from_filename, reverse=True)
+            suffix = f".{self.file_format.lower()}"
+            self.first_website_files = [entry['file'] for entry in HistoryManifest.load(first_path).latest(suffixes=(suffix,))]
+            self.second_website_files = [entry['file'] for entry in HistoryManifest.load(second_path).latest(suffixes=(suffix,))]
             
             if not self.first_website_files:
                 self.error_message = f"No files found for {self.first_website}"
@@ -94,16 +112,8 @@ class HistoricalComparison:
             return False
     
     def _extract_date_from_filename(self, filename):
-        """Extract date from filename for sorting"""
-        try:
-            import re
-            date_pattern = r'(\d{4})-(\d{2})-(\d{2})'
-            match = re.search(date_pattern, filename)
-            if match:
-                return datetime.strptime(match.group(), "%Y-%m-%d")
-            return datetime.min  
-        except:
-            return datetime.min
+        """Extract the YYYYMMDD_HHMMSS timestamp from a history file name for sorting"""
+        return timestamp_from_filename(filename) or datetime.min
     
     def _load_comparison_data(self):
         """Load and prepare data for comparison"""
@@ -113,14 +123,17 @@ class HistoricalComparison:
                     'name': self.first_website,
                     'files': self.first_website_files,
                     'latest_file': self.first_website_files[0] if self.first_website_files else None,
-                    'file_count': len(self.first_website_files)
+                    'file_count': len(self.first_website_files),
+                    'run_ids': [run['id'] for run in self.first_website_runs],
                 },
                 'second_website': {
                     'name': self.second_website,
                     'files': self.second_website_files,
                     'latest_file': self.second_website_files[0] if self.second_website_files else None,
-                    'file_count': len(self.second_website_files)
+                    'file_count': len(self.second_website_files),
+                    'run_ids': [run['id'] for run in self.second_website_runs],
                 },
+                'source': self.source,
                 'part': self.part_for_comparison,
                 'format': self.file_format,
                 'comparison_ready': True
@@ -153,6 +166,21 @@ class HistoricalComparison:
         
         latest_files = {}
         base_path = Path("./scrape-history/data")
+
+        if self.source == 'parquet':
+            latest_files['first_website'] = read_history(
+                self.first_website, self.part_for_comparison, start_date=self.first_website_files[0]
+            ).to_dict('records')
+            latest_files['second_website'] = read_history(
+                self.second_website, self.part_for_comparison, start_date=self.second_website_files[0]
+            ).to_dict('records')
+            return latest_files
+
+        if self.source == 'history_db':
+            db = get_history_db()
+            latest_files['first_website'] = db.load_prices([self.first_website_runs[0]['id']])
+            latest_files['second_website'] = db.load_prices([self.second_website_runs[0]['id']])
+            return latest_files
         
         try:
             if self.first_website_files:
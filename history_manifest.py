@@ -0,0 +1,118 @@
+import json
+import os
+import re
+from datetime import datetime
+
+MANIFEST_NAME = "manifest.json"
+HISTORY_SUFFIXES = ('.csv', '.json', '.xlsx')
+
+# Creators name files 'CPU_20260201_185951.csv' or 'Ardes.bg_CPU_20260201_185951.xlsx'
+HISTORY_FILE_TIMESTAMP = re.compile(r'(\d{8})_(\d{6})')
+
+
+def timestamp_from_filename(filename):
+    """'CPU_20260201_185951.csv' -> 2026-02-01 18:59:51, or None"""
+    match = HISTORY_FILE_TIMESTAMP.search(os.path.basename(filename))
+    if not match:
+        return None
+    try:
+        return datetime.strptime("".join(match.groups()), "%Y%m%d%H%M%S")
+    except ValueError:
+        return None
+
+
+def _price_range(products):
+    from price_normalizer import parse_prices
+
+    prices = parse_prices([product.get('price') for product in products]).dropna()
+    if prices.empty:
+        return None, None
+    return round(float(prices.min()), 2), round(float(prices.max()), 2)
+
+
+class HistoryManifest:
+    """Index of the history files in one <format>/<site>/<part> folder:
+    file name, parsed timestamp, row count and min/max price, newest first"""
+
+    def __init__(self, directory):
+        self.directory = str(directory)
+        self.path = os.path.join(self.directory, MANIFEST_NAME)
+        self.entries = []
+
+    @classmethod
+    def load(cls, directory):
+        """Read the folder's manifest; a folder written before manifests existed is indexed once"""
+        manifest = cls(directory)
+        try:
+            with open(manifest.path, 'r', encoding='utf-8') as f:
+                manifest.entries = json.load(f).get('files', [])
+        except FileNotFoundError:
+            if os.path.isdir(manifest.directory):
+                manifest.rebuild()
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Unreadable history manifest {manifest.path}, rebuilding: {e}")
+            manifest.rebuild()
+        return manifest
+
+    def save(self):
+        self.entries.sort(key=lambda entry: entry['timestamp'] or '', reverse=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'files': self.entries}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def add(self, file_name, products):
+        """Index a history file that was just written"""
+        when = timestamp_from_filename(file_name)
+        min_price, max_price = _price_range(products)
+        self.entries = [entry for entry in self.entries if entry['file'] != file_name]
+        self.entries.append({
+            'file': file_name,
+            'timestamp': when.isoformat(sep=' ') if when else None,
+            'rows': len(products),
+            'min_price': min_price,
+            'max_price': max_price,
+        })
+        self.save()
+
+    def rebuild(self):
+        """Index every history file already in the folder (one scan, then never again)"""
+        from price_history import read_history_file
+
+        self.entries = []
+        for name in os.listdir(self.directory):
+            if name == MANIFEST_NAME or not name.lower().endswith(HISTORY_SUFFIXES):
+                continue
+            try:
+                products = read_history_file(os.path.join(self.directory, name))
+            except Exception as e:
+                print(f"⚠️ Skipping unreadable history file {name}: {e}")
+                continue
+            when = timestamp_from_filename(name)
+            min_price, max_price = _price_range(products)
+            self.entries.append({
+                'file': name,
+                'timestamp': when.isoformat(sep=' ') if when else None,
+                'rows': len(products),
+                'min_price': min_price,
+                'max_price': max_price,
+            })
+        self.save()
+        print(f"DEBUG: Indexed {len(self.entries)} history files in {self.directory}")
+
+    def latest(self, count=None, suffixes=HISTORY_SUFFIXES):
+        """Newest entries first, skipping files that were deleted since they were indexed"""
+        entries = [
+            entry for entry in self.entries
+            if entry['file'].lower().endswith(suffixes)
+            and os.path.exists(os.path.join(self.directory, entry['file']))
+        ]
+        return entries[:count] if count else entries
+
+
+def record_history_file(path, products):
+    """Add a freshly written history file to its folder's manifest"""
+    try:
+        HistoryManifest.load(os.path.dirname(path)).add(os.path.basename(path), products)
+    except Exception as e:
+        print(f"⚠️ Could not update history manifest for {path}: {e}")
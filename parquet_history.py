@@ -0,0 +1,89 @@
+import json
+import os
+import uuid
+from datetime import datetime
+
+import pandas as pd
+
+from price_normalizer import parse_prices
+
+HISTORY_ROOT = "./scrape-history/parquet"
+
+# What the comparison graphs need; everything else stays on disk
+READ_COLUMNS = ('title', 'price', 'scraped_at')
+
+CORE_KEYS = ('title', 'price', 'url', 'currency', 'target_currency')
+
+
+def partition_dir(website, part, root=HISTORY_ROOT):
+    return os.path.join(root, f"site={website}", f"part={part}")
+
+
+def products_frame(products, scraped_at):
+    """Typed columns for one export: title, price (float), currency, url, scraped_at, specs (JSON)"""
+    return pd.DataFrame({
+        'title': pd.Series([product.get('title') for product in products], dtype='string'),
+        'price': parse_prices([product.get('price') for product in products]),
+        'currency': pd.Series(
+            [product.get('target_currency') or product.get('currency') for product in products], dtype='string'
+        ),
+        'url': pd.Series([product.get('url') for product in products], dtype='string'),
+        'scraped_at': pd.Series([pd.Timestamp(scraped_at)] * len(products), dtype='datetime64[ns]'),
+        'specs': pd.Series(
+            [json.dumps({k: v for k, v in product.items() if k not in CORE_KEYS}, ensure_ascii=False, default=str)
+             for product in products],
+            dtype='string',
+        ),
+    })
+
+
+def write_history_partition(products, website, part, scraped_at=None, root=HISTORY_ROOT):
+    """Append one export as a file under site=<website>/part=<part>/date=<YYYY-MM-DD>/"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    scraped_at = scraped_at or datetime.now()
+    directory = os.path.join(partition_dir(website, part, root), f"date={scraped_at:%Y-%m-%d}")
+    os.makedirs(directory, exist_ok=True)
+
+    path = os.path.join(directory, f"{scraped_at:%H%M%S}_{uuid.uuid4().hex[:8]}.parquet")
+    table = pa.Table.from_pandas(products_frame(products, scraped_at), preserve_index=False)
+    pq.write_table(table, path, compression='zstd')
+    return path
+
+
+def history_dates(website, part, root=HISTORY_ROOT):
+    """Dates with history for a site and part, newest first"""
+    directory = partition_dir(website, part, root)
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        (name[len("date="):] for name in os.listdir(directory) if name.startswith("date=")),
+        reverse=True,
+    )
+
+
+def read_history(website, part, start_date=None, end_date=None, columns=READ_COLUMNS, root=HISTORY_ROOT):
+    """Read only the requested columns of one site and part between two dates (inclusive).
+    The site/part directories and the date partitions outside the range are never opened."""
+    directory = partition_dir(website, part, root)
+    if not os.path.isdir(directory):
+        return pd.DataFrame(columns=list(columns))
+
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(
+        directory,
+        format='parquet',
+        partitioning=ds.partitioning(pa.schema([('date', pa.string())]), flavor='hive'),
+    )
+
+    expression = None
+    if start_date:
+        expression = ds.field('date') >= f"{pd.Timestamp(start_date):%Y-%m-%d}"
+    if end_date:
+        upper = ds.field('date') <= f"{pd.Timestamp(end_date):%Y-%m-%d}"
+        expression = upper if expression is None else expression & upper
+
+    return dataset.to_table(columns=list(columns), filter=expression).to_pandas()
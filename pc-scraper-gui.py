@@ -11,17 +11,19 @@ import traceback
 import sys
 
 from settings_manager import SettingsManager
-from scrapers.cpu_memory_manager import CPUMemoryManagerClass
+from scrapers import registry
 from scrapers.scraper_container_class import ScraperContainer
 from FileCreators import JSON_creator as jsc
 from FileCreators import CSV_creator as cs
 from FileCreators import TableMaker as exc
+from FileCreators import Parquet_creator as pqc
 
 from windows.scraper_options_window import ScraperOptionsWindow
 from windows.scraper_manager_window import ScraperManagerWindow
 
 from gui_classes.setup_gui_main import SetupGUI
 from currency_converter import RealCurrencyConverter
+from price_normalizer import normalize_prices
 
 from graph_comparer import GraphComparer
 from historical_comparer import HistoricalComparison
@@ -161,7 +163,7 @@ class GUI(ctk.CTk):
         self.selected_website = "Desktop.bg"
         self.scraper_list = []
         self.scraper_container = None 
-        self.cpu_manager = CPUMemoryManagerClass()
+        self.cpu_manager = registry.shared_resources.cpu_manager
         self.website_selection_limit = self.cpu_manager.get_optimal_worker_count()
         self.selected_websites = []
         self.scraper = None
@@ -468,7 +470,11 @@ class GUI(ctk.CTk):
         """Run all scrapers concurrently using ScraperContainer"""
     
         try:
-            loop = asyncio.new_event_loop()
+            # One loop for every run so the container's pooled browser stays warm between scrapes
+            loop = getattr(self, '_scrape_loop', None)
+            if loop is None or loop.is_closed():
+                loop = asyncio.new_event_loop()
+                self._scrape_loop = loop
             asyncio.set_event_loop(loop)
 
             for scraper in self.scraper_list:
@@ -495,12 +501,11 @@ class GUI(ctk.CTk):
         """Process results from ScraperContainer"""
         try:
             if self.scraper_container:
-                all_products_flat = self.scraper_container.get_all_results_flat()
                 deduplicated_results = self.scraper_container.deduplicate_results()
             
                 print(f"DEBUG: All results type: {type(all_results)}")
                 print(f"DEBUG: All results keys: {list(all_results.keys()) if isinstance(all_results, dict) else 'Not dict'}")
-                print(f"DEBUG: Flat products count: {len(all_products_flat)}")
+                print(f"DEBUG: Flat products count: {self.scraper_container.get_results_count()}")
                 print(f"DEBUG: Deduplicated count: {len(deduplicated_results)}")
             else:
                 deduplicated_results = []
@@ -829,8 +834,6 @@ class GUI(ctk.CTk):
             elif data_type == 'product':
                 product = data.get('data', {})
                 if product:
-                    self.all_products.append(product)
-
                     display_text = (
                     f"✅ {product.get('source', 'N/A')} Found:\n"
                     f"• Title: {product.get('title', 'N/A')[:80]}\n"
@@ -899,74 +902,7 @@ class GUI(ctk.CTk):
             target_currency = self.settings_manager.get("preferred_currency", 'BGN')
             target_symbol = self.currency_symbols.get(target_currency, "лв")
         
-            conversion_stats = {
-                'total': len(self.all_products),
-                'converted': 0,
-                'failed': 0,
-                'by_currency': {}
-            }
-        
-            for product in self.all_products:
-                if 'price' in product and product['price'] != "N/A":
-                    try:
-                        source_currency = product.get('source_currency') or product.get('currency')
-                    
-                        if not source_currency:
-                            print(f"⚠️ No source currency for {product.get('title', 'Unknown')}")
-                            conversion_stats['failed'] += 1
-                            continue
-                    
-                        if source_currency not in conversion_stats['by_currency']:
-                            conversion_stats['by_currency'][source_currency] = 0
-                        conversion_stats['by_currency'][source_currency] += 1
-                    
-                        price_str = str(product['price']).split('/')[0].strip()
-                    
-                        for symbol in ["лв", "$", "€", "£", "¥", "USD", "EUR", "BGN", "JPY", "GBP"]:
-                            price_str = price_str.replace(symbol, "")
-                    
-                        price_str = price_str.replace(",", "").replace(" ", "").strip()
-                    
-                        if not price_str:
-                            print(f"⚠️ Empty price string for {product.get('title', 'Unknown')}")
-                            continue
-                    
-                        original_price = float(price_str)
-                    
-                        if source_currency != target_currency:
-                            converted_price = self.converter.convert_currency(
-                                original_price,
-                                source_currency, 
-                                target_currency
-                            )
-                        
-                            if converted_price is None:
-                                original_symbol = self.currency_symbols.get(source_currency, source_currency)
-                                product['price'] = f"{original_symbol}{original_price:.2f}"
-                                product['original_price'] = original_price
-                                product['original_currency'] = source_currency
-                                product['conversion_failed'] = True
-                                conversion_stats['failed'] += 1
-                                print(f"⚠️ Conversion failed for {product.get('title', 'Unknown')} from {source_currency} to {target_currency}")
-                            else:
-                                product['price'] = f"{target_symbol}{converted_price:.2f}"
-                                product['original_price'] = original_price
-                                product['original_currency'] = source_currency
-                                product['converted_price'] = converted_price
-                                product['target_currency'] = target_currency
-                                conversion_stats['converted'] += 1
-                        else:
-                            product['price'] = f"{target_symbol}{original_price:.2f}"
-                            product['original_price'] = original_price
-                            product['original_currency'] = source_currency
-                            conversion_stats['converted'] += 1 
-                        
-                    except Exception as e:
-                        print(f"Currency conversion error for {product.get('title', 'Unknown')}: {str(e)}")
-                        import traceback
-                        traceback.print_exc()
-                        conversion_stats['failed'] += 1
-                        continue
+            conversion_stats = normalize_prices(self.all_products, self.converter, target_currency)
         
             print(f"\n📊 CONVERSION STATISTICS:")
             print(f"  Total products: {conversion_stats['total']}")
@@ -1013,6 +949,14 @@ class GUI(ctk.CTk):
                         pc_part_selected=self.selected_pc_part, 
                         currency_symbol=target_symbol
                 )
+                elif output_format == 'Parquet':
+                    pqc.ParquetCreator(
+                        data=website_products,
+                        website_scraped=website,
+                        output_folder=self.save_folder,
+                        pc_part_selected=self.selected_pc_part,
+                        currency_symbol=target_symbol
+                )
             
             if output_format == 'JSON':
                 print("Creating combined JSON file...")
@@ -1041,6 +985,15 @@ class GUI(ctk.CTk):
                     pc_part_selected=self.selected_pc_part, 
                     currency_symbol=target_symbol
                 )
+            elif output_format == 'Parquet':
+                print("Creating combined Parquet file...")
+                pqc.ParquetCreator(
+                    data=self.all_products,
+                    website_scraped="Combined",
+                    output_folder=self.save_folder,
+                    pc_part_selected=self.selected_pc_part,
+                    currency_symbol=target_symbol
+                )
         
             self.after(0, self._on_processing_complete)
 
@@ -1214,6 +1167,23 @@ class GUI(ctk.CTk):
         for child in widget.winfo_children():
             self._update_widget_colors_recursive(child)
 
+    def _close_scrape_resources(self):
+        """Close the pooled browser, HTTP fetcher, rate-limit state and price history kept warm between runs"""
+        loop = getattr(self, '_scrape_loop', None)
+        if loop is None or loop.is_closed() or not self.scraper_container:
+            return
+
+        print("Closing scraper resources...")
+        try:
+            if loop.is_running():
+                # A stopped scrape can still be winding down on the worker thread
+                asyncio.run_coroutine_threadsafe(self.scraper_container.close_all_resources(), loop).result(timeout=15)
+            else:
+                loop.run_until_complete(self.scraper_container.close_all_resources())
+                loop.close()
+        except Exception as e:
+            print(f"Error closing scraper resources: {e}")
+
     def on_closing(self):
         print("Closing application...")
         pygame.mixer.music.stop()
@@ -1233,6 +1203,8 @@ class GUI(ctk.CTk):
             except Exception as e:
                 print(f"Error stopping scraper: {e}")
 
+        self._close_scrape_resources()
+
         for widget in self.winfo_children():
             try:
                 widget.destroy()
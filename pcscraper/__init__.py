@@ -0,0 +1 @@
+"""Headless command line entry point for PC-Scraper (python -m pcscraper)"""
@@ -0,0 +1,252 @@
+import argparse
+import asyncio
+import datetime
+import json
+import logging
+import os
+import time
+
+from price_history import PriceHistoryDB
+from price_normalizer import normalize_prices
+from product_matcher import ProductMatcher
+from settings_manager import SettingsManager
+from scrapers import registry
+from scrapers.scraper_container_class import ScraperContainer
+from scrapers.session_journal import SessionJournal
+
+logger = logging.getLogger(__name__)
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m pcscraper",
+        description="Scrape PC part listings without the GUI",
+    )
+    parser.add_argument("-s", "--sites", nargs="+", metavar="SITE",
+                        help="Websites to scrape, as named in the GUI (see --list-sites)")
+    parser.add_argument("-t", "--terms", nargs="+", metavar="TERM",
+                        help="Search terms; each one is a separate run")
+    parser.add_argument("-p", "--part", default="Other",
+                        help="PC part type used for output file names and scrape-history (e.g. CPU, GPU)")
+    parser.add_argument("--pages", type=int, default=None, help="Max listing pages per site (default: max_pages setting)")
+    parser.add_argument("-f", "--format", choices=["JSON", "CSV", "Excel", "Parquet"], default=None,
+                        help="Output format (default: output_format setting)")
+    parser.add_argument("-o", "--output-dir", default="./output", help="Folder for result and metrics files")
+    parser.add_argument("-c", "--concurrency", type=int, default=None,
+                        help="Product pages fetched concurrently per listing page")
+    parser.add_argument("--mode", choices=["full", "fast"], default=None, help="full opens every product page, fast reads listings only")
+    parser.add_argument("--incremental", action="store_true", help="Only reopen new or changed products")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk page cache")
+    parser.add_argument("--headed", action="store_true", help="Show browser windows (headless by default)")
+    parser.add_argument("--lean", action="store_true", help="Use the lean Chromium launch profile")
+    parser.add_argument("--every", type=float, default=None, metavar="MINUTES",
+                        help="Daemon mode: repeat the scrape every MINUTES until interrupted")
+    parser.add_argument("--resume", nargs="?", const="latest", metavar="SESSION_ID",
+                        help="Continue an interrupted session (the latest unfinished one by default)")
+    parser.add_argument("--import-history", action="store_true",
+                        help="Import the scrape-history/data files into the price history database and exit")
+    parser.add_argument("--list-sites", action="store_true", help="List supported websites and exit")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Debug logging")
+    return parser
+
+
+def apply_overrides(settings_manager, args):
+    """Per-run settings from the command line; kept in memory, never saved to the settings file"""
+    overrides = {}
+    if args.pages is not None:
+        overrides['max_pages'] = args.pages
+    if args.format:
+        overrides['output_format'] = args.format
+    if args.concurrency is not None:
+        overrides['max_concurrent_products'] = args.concurrency
+    if args.mode:
+        overrides['scrape_mode'] = args.mode
+    if args.incremental:
+        overrides['incremental_mode'] = True
+    if args.no_cache:
+        overrides['no_cache'] = True
+    overrides['headless'] = not args.headed
+    if args.lean:
+        overrides['launch_profile'] = 'lean'
+
+    settings_manager.settings.update(overrides)
+    return overrides
+
+
+def write_results(results_by_site, output_format, output_dir, part, target_currency):
+    """Convert every price to the preferred currency, then save one file per site plus a combined one like the GUI does"""
+    if output_format == 'JSON':
+        from FileCreators.JSON_creator import JSONCreator as creator
+    elif output_format == 'CSV':
+        from FileCreators.CSV_creator import CSVCreator as creator
+    elif output_format == 'Parquet':
+        from FileCreators.Parquet_creator import ParquetCreator as creator
+    else:
+        from FileCreators.TableMaker import TableMaker as creator
+
+    all_products = [product for products in results_by_site.values() for product in products or []]
+    if not all_products:
+        return 0
+
+    stats = normalize_prices(all_products, registry.shared_resources.converter, target_currency)
+    logger.info(f"Prices in {target_currency}: {stats['converted']} converted, {stats['failed']} failed")
+
+    currency_symbol = f"{target_currency} "
+    for website, products in results_by_site.items():
+        if not products:
+            continue
+        creator(data=products, website_scraped=website, output_folder=output_dir, pc_part_selected=part,
+                currency_symbol=currency_symbol)
+
+    creator(data=all_products, website_scraped="Combined", output_folder=output_dir, pc_part_selected=part,
+            currency_symbol=currency_symbol)
+    write_best_deals(all_products, output_dir, part, registry.shared_resources.settings_manager)
+    return len(all_products)
+
+
+def write_best_deals(products, output_dir, part, settings_manager):
+    """Save the same-product-across-stores comparison (best price and spread per product) next to the results"""
+    matcher = ProductMatcher.from_settings(settings_manager)
+    if matcher is None:
+        return None
+    deals = matcher.match(products)
+    if not deals:
+        return None
+
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = os.path.join(output_dir, f"{part}_Best_Deals_{timestamp}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(deals, f, ensure_ascii=False, indent=4, default=str)
+
+    for deal in deals[:5]:
+        print(f"🏆 BEST DEAL: {deal['title']} - {deal['best_price']} {deal['currency']} ({deal['best_store']}), "
+              f"{deal['price_spread']} cheaper than the priciest of {len(deal['stores'])} stores")
+    print(f"📊 {len(deals)} products found in several stores: {path}")
+    return path
+
+
+def write_metrics(container, output_dir, run_info):
+    fetcher = container.http_fetcher
+    metrics = dict(run_info)
+    metrics.update({
+        'scrapers': container.get_scraper_status(),
+        'rate_limit': container.get_rate_limit_stats(),
+        'browser_pool': container.get_browser_pool_stats(),
+        'result_sink': container.result_sink.get_stats() if container.result_sink else None,
+        'http_fetcher': {
+            'requests_made': fetcher.requests_made,
+            'requests_failed': fetcher.requests_failed,
+            'page_cache': fetcher.page_cache.get_stats() if fetcher.page_cache else None,
+        } if fetcher else None,
+    })
+
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = os.path.join(output_dir, f"metrics_{timestamp}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(metrics, f, ensure_ascii=False, indent=4, default=str)
+    return path
+
+
+async def run_once(container, args, settings_manager):
+    output_format = settings_manager.get('output_format', 'JSON')
+    max_pages = settings_manager.get('max_pages', 10)
+
+    for term in args.terms:
+        started = time.time()
+        if args.resume:
+            print(f"⏯️ Resuming '{term}' on {len(container.scraper_list)} sites...")
+            results = await container.resume(
+                None if args.resume == 'latest' else args.resume,
+                headless=not args.headed,
+                launch_profile='lean' if args.lean else None,
+            )
+        else:
+            print(f"🔍 Scraping '{term}' on {len(container.scraper_list)} sites...")
+            results = await container.start_all_scrapers_async(
+                term, max_pages,
+                headless=not args.headed,
+                launch_profile='lean' if args.lean else None,
+            )
+
+        saved = write_results(results, output_format, args.output_dir, args.part,
+                              settings_manager.get('preferred_currency', 'BGN'))
+        metrics_path = write_metrics(container, args.output_dir, {
+            'search_term': term,
+            'session_id': container.session_id,
+            'part': args.part,
+            'started_at': datetime.datetime.fromtimestamp(started).isoformat(),
+            'duration_seconds': round(time.time() - started, 2),
+            'products_by_site': {site: len(products) for site, products in results.items()},
+            'products_saved': saved,
+        })
+        print(f"✅ '{term}': {saved} products saved to {args.output_dir} (metrics: {metrics_path})")
+
+
+async def run(args, settings_manager):
+    scrapers = [registry.create_scraper(site) for site in args.sites]
+    container = ScraperContainer(scrapers, settings_manager)
+    settings_manager.apply_to_scraper(container)
+
+    try:
+        while True:
+            await run_once(container, args, settings_manager)
+            args.resume = None
+            if not args.every:
+                break
+            print(f"💤 Next run in {args.every} minutes")
+            await asyncio.sleep(args.every * 60)
+    finally:
+        await container.close_all_resources()
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    if args.list_sites:
+        for site, spec in registry.SCRAPERS.items():
+            capabilities = ", ".join(sorted(spec.capabilities)) or "browser only"
+            print(f"{site} ({spec.currency}; {capabilities})")
+        return 0
+
+    settings_manager = SettingsManager()
+
+    if args.import_history:
+        db = PriceHistoryDB.from_settings(settings_manager)
+        if db is None:
+            parser.error("price_history is disabled in the settings")
+        db.import_history_files()
+        db.close()
+        return 0
+
+    if args.resume:
+        journal = SessionJournal.from_settings(settings_manager)
+        session = journal.get_session(None if args.resume == 'latest' else args.resume) if journal else None
+        if session is None:
+            parser.error(f"No session to resume ({args.resume})")
+        args.resume = session['id']
+        args.sites = args.sites or session['sites']
+        args.terms = [session['search_term']]
+        journal.close()
+
+    if not args.sites or not args.terms:
+        parser.error("--sites and --terms are required")
+
+    unknown = [site for site in args.sites if site not in registry.SCRAPERS]
+    if unknown:
+        parser.error(f"Unknown site(s): {', '.join(unknown)}. Use --list-sites to see the supported ones.")
+
+    apply_overrides(settings_manager, args)
+    registry.shared_resources.configure(settings_manager=settings_manager)
+
+    try:
+        asyncio.run(run(args, settings_manager))
+    except KeyboardInterrupt:
+        print("🛑 Interrupted")
+        return 130
+    return 0
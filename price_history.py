@@ -0,0 +1,247 @@
+import csv
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from history_manifest import MANIFEST_NAME, record_history_file, timestamp_from_filename
+from parquet_history import write_history_partition
+from price_normalizer import parse_prices
+
+# Websites whose exports only repeat rows already recorded per site
+AGGREGATE_WEBSITES = ("Combined",)
+
+CORE_KEYS = ('title', 'price', 'url', 'currency', 'source_currency', 'source', 'page', 'scraped_at')
+
+
+def product_key(product):
+    """Stable identity of a product across runs: URL without query/fragment, else the lowercased title"""
+    url = product.get('url')
+    if url and url != "N/A":
+        parts = urlsplit(str(url))
+        return f"{parts.netloc.lower().removeprefix('www.')}{parts.path.rstrip('/')}"
+    return str(product.get('title') or '').strip().lower()
+
+
+class PriceHistoryDB:
+    """SQLite price history: one row per product per run, indexed by site, part, product and time"""
+
+    def __init__(self, path="./scrape-history/history.sqlite3", keep_file_copies=False):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.keep_file_copies = keep_file_copies
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                site TEXT NOT NULL,
+                part TEXT NOT NULL,
+                scraped_at REAL NOT NULL,
+                product_count INTEGER,
+                source_file TEXT UNIQUE
+            );
+            CREATE TABLE IF NOT EXISTS prices (
+                run_id INTEGER NOT NULL REFERENCES runs(id),
+                site TEXT NOT NULL,
+                part TEXT NOT NULL,
+                product_key TEXT NOT NULL,
+                title TEXT,
+                url TEXT,
+                price REAL,
+                currency TEXT,
+                scraped_at REAL NOT NULL,
+                specs TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_runs_site_part_time ON runs(site, part, scraped_at);
+            CREATE INDEX IF NOT EXISTS idx_prices_site_part_time ON prices(site, part, scraped_at);
+            CREATE INDEX IF NOT EXISTS idx_prices_product_time ON prices(product_key, scraped_at);
+            CREATE INDEX IF NOT EXISTS idx_prices_run ON prices(run_id);
+        """)
+        self._db.commit()
+
+    @classmethod
+    def from_settings(cls, settings_manager):
+        """History store from the price_history setting, or None when it is disabled"""
+        config = settings_manager.get('price_history', {}) or {}
+        if not config.get('enabled', True):
+            return None
+        try:
+            return cls(
+                path=config.get('path', "./scrape-history/history.sqlite3"),
+                keep_file_copies=config.get('keep_file_copies', False),
+            )
+        except Exception as e:
+            print(f"⚠️ Could not open price history: {e}")
+            return None
+
+    def record_run(self, site, part, products, scraped_at=None, source_file=None):
+        """Append one export; returns the run id, or None if source_file was already imported"""
+        scraped_at = scraped_at or time.time()
+        prices = parse_prices([product.get('price') for product in products]).tolist()
+
+        rows = []
+        for product, price in zip(products, prices):
+            specs = {k: v for k, v in product.items() if k not in CORE_KEYS}
+            rows.append((
+                site, part, product_key(product),
+                product.get('title'), product.get('url'),
+                None if price != price else price,
+                product.get('target_currency') or product.get('currency') or product.get('source_currency'),
+                scraped_at,
+                json.dumps(specs, ensure_ascii=False, default=str),
+            ))
+
+        with self._lock:
+            try:
+                cursor = self._db.execute(
+                    "INSERT INTO runs (site, part, scraped_at, product_count, source_file) VALUES (?, ?, ?, ?, ?)",
+                    (site, part, scraped_at, len(rows), source_file),
+                )
+            except sqlite3.IntegrityError:
+                return None
+            run_id = cursor.lastrowid
+            self._db.executemany(
+                "INSERT INTO prices (run_id, site, part, product_key, title, url, price, currency, scraped_at, specs) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id,) + row for row in rows],
+            )
+            self._db.commit()
+        return run_id
+
+    def runs(self, site, part, limit=None):
+        """Runs for a site and part, newest first"""
+        query = "SELECT id, scraped_at, product_count, source_file FROM runs WHERE site = ? AND part = ? ORDER BY scraped_at DESC"
+        params = [site, part]
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+        return [
+            {'id': run_id, 'scraped_at': scraped_at, 'product_count': count, 'source_file': source_file}
+            for run_id, scraped_at, count, source_file in rows
+        ]
+
+    def load_prices(self, run_ids):
+        """Rows of the given runs in the shape GraphComparer works with (title, price, url, date, website)"""
+        if not run_ids:
+            return []
+        placeholders = ",".join("?" * len(run_ids))
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT site, title, url, price, currency, scraped_at, product_key FROM prices "
+                f"WHERE run_id IN ({placeholders})",
+                list(run_ids),
+            ).fetchall()
+        return [
+            {
+                'website': site,
+                'title': title,
+                'url': url,
+                'price': price,
+                'currency': currency,
+                'date': datetime.fromtimestamp(scraped_at).strftime("%Y-%m-%d %H:%M:%S"),
+                'product_key': key,
+            }
+            for site, title, url, price, currency, scraped_at, key in rows
+        ]
+
+    def product_history(self, key):
+        """(scraped_at, site, price) for one product across all runs, oldest first"""
+        with self._lock:
+            return self._db.execute(
+                "SELECT scraped_at, site, price FROM prices WHERE product_key = ? ORDER BY scraped_at",
+                (key,),
+            ).fetchall()
+
+    def import_history_files(self, base_path="./scrape-history/data"):
+        """One-shot import of the old <format>/<site>/<part>/<file> tree; files already imported are skipped"""
+        imported = skipped = failed = 0
+        for file_path in sorted(Path(base_path).glob("*/*/*/*")):
+            if not file_path.is_file() or file_path.name == MANIFEST_NAME \
+                    or file_path.suffix.lower() not in ('.csv', '.json', '.xlsx'):
+                continue
+            site, part = file_path.parent.parent.name, file_path.parent.name
+            try:
+                products = read_history_file(file_path)
+            except Exception as e:
+                print(f"⚠️ Could not import {file_path}: {e}")
+                failed += 1
+                continue
+
+            when = timestamp_from_filename(file_path.name)
+            scraped_at = when.timestamp() if when else file_path.stat().st_mtime
+            if self.record_run(site, part, products, scraped_at=scraped_at, source_file=file_path.as_posix()) is None:
+                skipped += 1
+            else:
+                imported += 1
+
+        print(f"📦 History import: {imported} files imported, {skipped} already present, {failed} failed")
+        return {'imported': imported, 'skipped': skipped, 'failed': failed}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def read_history_file(file_path):
+    """Products from an old-style history file (CSV, JSON or the Excel tables TableMaker writes)"""
+    file_path = Path(file_path)
+    suffix = file_path.suffix.lower()
+    if suffix == '.json':
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return [item for item in data if isinstance(item, dict)]
+    if suffix == '.csv':
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            return list(csv.DictReader(f))
+
+    import pandas as pd
+    frame = pd.read_excel(file_path).rename(columns={"Product Name": "title", "Price": "price", "URL": "url"})
+    return frame.to_dict('records')
+
+
+_default_db = None
+_default_db_lock = threading.Lock()
+
+
+def get_history_db():
+    """The history store configured in the shared settings, opened once per process"""
+    global _default_db
+    with _default_db_lock:
+        if _default_db is None:
+            from scrapers.registry import shared_resources
+            _default_db = PriceHistoryDB.from_settings(shared_resources.settings_manager) or False
+    return _default_db or None
+
+
+def record_export(products, website, part, write_file_copy=None):
+    """Append an export to the history store and the partitioned Parquet history, whatever the export
+    format. The old duplicate history file is only written when keep_file_copies is set or the store is unavailable."""
+    if products and website not in AGGREGATE_WEBSITES:
+        try:
+            path = write_history_partition(products, website, part)
+            print(f"History partition written: {path}")
+        except Exception as e:
+            print(f"⚠️ Could not write Parquet history for {website}: {e}")
+
+    db = get_history_db()
+    if db is not None and products and website not in AGGREGATE_WEBSITES:
+        try:
+            db.record_run(website, part, products)
+            print(f"History: recorded {len(products)} {part} prices for {website}")
+        except Exception as e:
+            print(f"⚠️ Could not record history for {website}: {e}")
+            db = None
+
+    if write_file_copy is not None and (db is None or db.keep_file_copies):
+        path = write_file_copy()
+        if path and products:
+            record_history_file(path, products)
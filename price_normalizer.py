@@ -0,0 +1,102 @@
+import math
+import re
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# A decimal comma: '12,5', '1299,00', '1.299,00' (but not the thousands separator in '1,299')
+DECIMAL_COMMA = r'[\d.]*,\d{1,2}'
+
+
+def parse_prices(values) -> pd.Series:
+    """Parse a column of prices in any scraped format to floats (NaN where there is no price).
+    Handles numbers, 'лв123.00', '€12.00 / лв23.47', '1,299.00', '1.299,00 Ft', 'N/A'."""
+    series = values if isinstance(values, pd.Series) else pd.Series(list(values), dtype=object)
+    if series.empty:
+        return pd.Series([], dtype=float)
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(float)
+
+    numbers = pd.to_numeric(series, errors='coerce')
+    text = series.astype(str).str.split('/', n=1).str[0]
+    text = text.str.replace(r'[^\d.,]', '', regex=True)
+
+    decimal_comma = text.str.fullmatch(DECIMAL_COMMA).fillna(False).astype(bool)
+    text = text.where(
+        ~decimal_comma,
+        text.str.replace('.', '', regex=False).str.replace(',', '.', regex=False),
+    )
+    text = text.where(decimal_comma, text.str.replace(',', '', regex=False))
+
+    return numbers.fillna(pd.to_numeric(text, errors='coerce')).astype(float)
+
+
+def parse_price(value) -> Optional[float]:
+    """Single-value counterpart of parse_prices, None where there is no price"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return None if math.isnan(value) else float(value)
+    if value is None:
+        return None
+
+    text = re.sub(r'[^\d.,]', '', str(value).split('/', 1)[0])
+    if re.fullmatch(DECIMAL_COMMA, text):
+        text = text.replace('.', '').replace(',', '.')
+    else:
+        text = text.replace(',', '')
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def normalize_prices(products, converter, target_currency):
+    """Parse and convert the prices of all products in one columnar pass, one rate lookup per currency.
+    Writes numeric prices back into the product dicts and returns conversion stats."""
+    stats = {'total': len(products), 'converted': 0, 'failed': 0, 'by_currency': {}}
+    if not products:
+        return stats
+
+    frame = pd.DataFrame({
+        'original': parse_prices([product.get('price') for product in products]),
+        'currency': pd.Series(
+            [str(product.get('source_currency') or product.get('currency') or '').upper() or None
+             for product in products],
+            dtype=object,
+        ),
+    })
+
+    has_price = frame['original'].notna()
+    currencies = frame.loc[has_price, 'currency'].dropna().unique().tolist()
+    converter.prefetch(currencies + [target_currency])
+    rates = {currency: converter.get_real_time_rate(currency, target_currency) for currency in currencies}
+
+    frame['rate'] = frame['currency'].map(rates).astype(float)
+    frame['converted'] = (frame['original'] * frame['rate']).round(2)
+
+    converted_mask = has_price & frame['rate'].notna()
+    stats['converted'] = int(converted_mask.sum())
+    stats['failed'] = int((has_price & ~converted_mask).sum())
+    stats['by_currency'] = frame.loc[has_price, 'currency'].value_counts().to_dict()
+
+    for product, original, currency, converted in zip(
+        products,
+        frame['original'].to_numpy(),
+        frame['currency'].tolist(),
+        frame['converted'].to_numpy(),
+    ):
+        if np.isnan(original):
+            continue
+        product['original_price'] = float(original)
+        product['original_currency'] = currency
+
+        if math.isnan(converted):
+            product['price'] = float(original)
+            product['conversion_failed'] = True
+        else:
+            product['price'] = float(converted)
+            if currency != target_currency:
+                product['converted_price'] = float(converted)
+                product['target_currency'] = target_currency
+
+    return stats
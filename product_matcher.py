@@ -0,0 +1,252 @@
+import re
+from collections import Counter, defaultdict
+
+from price_normalizer import parse_price
+
+# Exact spec table labels that hold a manufacturer part number or barcode. Labels such as 'Модел' or
+# 'Chipset model' name a series ('RTX 4070') shared by many products, so they are not identifiers.
+IDENTIFIER_SPEC_LABELS = frozenset({
+    'mpn', 'part number', 'partnumber', 'manufacturer part number', 'item model number', 'model number',
+    'manufacturer reference', 'каталожен номер', 'код на производител', 'партиден номер',
+    'ean', 'ean code', 'gtin', 'upc', 'баркод', 'barcode',
+})
+
+BRAND_SPEC_LABELS = frozenset({'brand', 'manufacturer', 'производител', 'марка'})
+
+# Board and module makers; chip vendors only count when no maker is named ('AMD Ryzen 7' vs 'ASUS Radeon')
+BRANDS = frozenset({
+    'asus', 'msi', 'gigabyte', 'aorus', 'asrock', 'zotac', 'palit', 'gainward', 'pny', 'inno3d', 'evga',
+    'sapphire', 'powercolor', 'xfx', 'kingston', 'corsair', 'crucial', 'teamgroup', 'adata',
+    'patriot', 'lexar', 'samsung', 'wd', 'seagate', 'toshiba', 'sandisk', 'seasonic', 'noctua',
+    'deepcool', 'arctic', 'nzxt', 'fractal', 'lianli', 'coolermaster', 'thermaltake', 'chieftec', 'fortron',
+})
+CHIP_VENDORS = frozenset({'amd', 'intel', 'nvidia'})
+
+# Product family words every offer of that family repeats; they tell nothing about which model it is
+FAMILY_WORDS = frozenset({
+    'rtx', 'gtx', 'geforce', 'radeon', 'rx', 'arc', 'ryzen', 'core', 'ultra', 'threadripper', 'xeon',
+    'pentium', 'celeron', 'athlon', 'ssd', 'hdd', 'ram', 'dimm', 'sodimm', 'kit', 'gaming', 'edition',
+})
+
+# Shop wording that says nothing about which product it is
+STOP_WORDS = frozenset({
+    'процесор', 'видеокарта', 'видео', 'карта', 'памет', 'дънна', 'платка', 'захранване', 'кутия',
+    'processor', 'cpu', 'gpu', 'graphics', 'card', 'memory', 'motherboard', 'box', 'tray',
+    'нов', 'new', 'with', 'and', 'for', 'за', 'с', 'и',
+})
+
+# Words that turn one model into a different one: 'RTX 4080' vs 'RTX 4080 Super'
+VARIANT_WORDS = frozenset({'super', 'ti', 'xt', 'xtx', 'gre', 'oc'})
+
+# '4.2GHz', '16GB', '850W' are specs rather than model codes
+UNIT_TOKEN = re.compile(r'\d+(?:ghz|mhz|hz|gb|mb|tb|kb|w|mm|cm|nm|v|mah|ms|rpm|bit)|cl\d+')
+
+# Memory types, buses, sockets and ports shared by whole product categories ('ddr5', 'gddr6x', 'am5')
+GENERIC_TOKEN = re.compile(
+    r'(?:lp)?g?ddr\d+x?|pcie\d*|gen\d+|am\d|lga\d+|fm\d|usb\d*|hdmi\d*|dp\d*|wifi\d*e?|bt\d*|'
+    r'm2|nvme|sata\d*|x\d{1,2}|\d{1,2}x|a?rgb\d*'
+)
+
+
+def normalize_title(text):
+    """Lowercase, drop ®™©, split on hyphens and punctuation - the same clean-up the keyword filter does"""
+    text = re.sub(r'[®™©]', '', str(text or '').lower())
+    return re.split(r'[\W_]+', text.replace('-', ' ')) if text else []
+
+
+def title_tokens(text):
+    return frozenset(token for token in normalize_title(text) if token and token not in STOP_WORDS)
+
+
+def is_spec_token(token):
+    """Units ('16gb') and category-wide tokens ('ddr5', 'am5', 'pcie4') rather than anything model specific"""
+    return bool(UNIT_TOKEN.fullmatch(token) or GENERIC_TOKEN.fullmatch(token))
+
+
+def model_codes(tokens):
+    """Tokens that name a model: contain a digit, 3+ characters, not a unit or a generic spec"""
+    return frozenset(
+        token for token in tokens
+        if len(token) >= 3 and any(ch.isdigit() for ch in token) and not is_spec_token(token)
+    )
+
+
+def _label(label):
+    return str(label).strip().rstrip(':').strip().lower()
+
+
+def product_brand(product, tokens):
+    """Brand from the spec table, else the maker named in the title, else the chip vendor; None if unnamed"""
+    for label, value in product.items():
+        if _label(label) in BRAND_SPEC_LABELS and isinstance(value, str) and value.strip():
+            return re.sub(r'[\W_]+', '', value.lower())
+    makers = tokens & BRANDS
+    if makers:
+        return min(makers)
+    vendors = tokens & CHIP_VENDORS
+    return min(vendors) if vendors else None
+
+
+def product_identifiers(product):
+    """Normalized MPN/EAN values from the spec table, e.g. {'100100000910WOF', '0730143314930'}"""
+    identifiers = set()
+    for label, value in product.items():
+        if not isinstance(value, str) or _label(label) not in IDENTIFIER_SPEC_LABELS:
+            continue
+        identifier = re.sub(r'[^0-9A-Za-z]', '', value).upper()
+        if len(identifier) >= 5 and any(ch.isdigit() for ch in identifier):
+            identifiers.add(identifier)
+    return identifiers
+
+
+def offer_price(product):
+    """(price, currency) in the converted currency when normalize_prices ran, else as scraped"""
+    if product.get('converted_price') is not None:
+        return product['converted_price'], product.get('target_currency')
+    price = parse_price(product.get('price'))
+    return price, product.get('currency') or product.get('source_currency')
+
+
+class _Offer:
+    __slots__ = ('product', 'store', 'tokens', 'codes', 'variants', 'identifiers', 'brand', 'distinguishing')
+
+    def __init__(self, product):
+        self.product = product
+        self.store = product.get('source') or product.get('website') or ''
+        self.tokens = title_tokens(product.get('title'))
+        self.codes = model_codes(self.tokens)
+        self.variants = self.tokens & VARIANT_WORDS
+        self.identifiers = product_identifiers(product)
+        self.brand = product_brand(product, self.tokens)
+        # Series and model words left once brand, family, units and specs are set aside ('dual', 'ventus', '2x')
+        self.distinguishing = frozenset(
+            token for token in self.tokens - self.variants - BRANDS - CHIP_VENDORS - FAMILY_WORDS
+            if not is_spec_token(token) and not token.isdigit()
+        )
+
+
+class ProductMatcher:
+    """Clusters the same product offered by different stores: offers are blocked on model codes and
+    MPN/EAN through an inverted index, so only offers sharing a key are ever compared"""
+
+    def __init__(self, min_similarity=0.6, max_block_size=200):
+        self.min_similarity = min_similarity
+        self.max_block_size = max_block_size
+
+    @classmethod
+    def from_settings(cls, settings_manager):
+        """Matcher from the product_matching setting, or None when it is disabled"""
+        config = settings_manager.get('product_matching', {}) or {}
+        if not config.get('enabled', True):
+            return None
+        return cls(
+            min_similarity=config.get('min_similarity', 0.6),
+            max_block_size=config.get('max_block_size', 200),
+        )
+
+    def _compatible(self, first, second):
+        """False when a variant, the brand or the series words tell the two offers apart"""
+        if first.variants != second.variants:
+            return False
+        if first.identifiers & second.identifiers:
+            return True
+        # Without a shared MPN/EAN, a 'RTX 4070' from ASUS and one from MSI are different products,
+        # and so are two series of the same maker ('Dual' vs 'TUF')
+        if first.brand != second.brand:
+            return False
+        shared_codes = first.codes & second.codes
+        first_rest = first.distinguishing - shared_codes
+        second_rest = second.distinguishing - shared_codes
+        return not (first_rest and second_rest and not (first_rest & second_rest))
+
+    def _same_product(self, first, second):
+        if not self._compatible(first, second):
+            return False
+        if first.identifiers & second.identifiers:
+            return True
+        if first.store == second.store or not (first.codes & second.codes):
+            return False
+        overlap = len(first.tokens & second.tokens) / min(len(first.tokens), len(second.tokens))
+        return overlap >= self.min_similarity
+
+    def cluster(self, products):
+        """Groups of product dicts that are the same item"""
+        offers = [_Offer(product) for product in products if product and product.get('title')]
+
+        index = defaultdict(list)
+        for i, offer in enumerate(offers):
+            for identifier in offer.identifiers:
+                index[('id', identifier)].append(i)
+            for code in offer.codes:
+                index[('code', code)].append(i)
+
+        parent = list(range(len(offers)))
+        members = {i: [i] for i in range(len(offers))}
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def can_merge(root_i, root_j):
+            # One matching pair is not enough: a generic 'ASUS RTX 4070' title would otherwise
+            # chain the 'Dual' and the 'TUF' clusters together
+            return all(
+                self._compatible(offers[a], offers[b]) for a in members[root_i] for b in members[root_j]
+            )
+
+        for postings in index.values():
+            # A key shared by hundreds of offers ('2024', 'ddr5') does not identify anything
+            if len(postings) < 2 or len(postings) > self.max_block_size:
+                continue
+            for position, i in enumerate(postings):
+                for j in postings[position + 1:]:
+                    root_i, root_j = find(i), find(j)
+                    if root_i != root_j and self._same_product(offers[i], offers[j]) and can_merge(root_i, root_j):
+                        parent[root_j] = root_i
+                        members[root_i].extend(members.pop(root_j))
+
+        groups = defaultdict(list)
+        for i, offer in enumerate(offers):
+            groups[find(i)].append(offer.product)
+        return list(groups.values())
+
+    def match(self, products, min_stores=2):
+        """Best price and price spread for every product sold by at least min_stores stores, biggest spread first"""
+        comparisons = []
+        for group in self.cluster(products):
+            priced = [(offer_price(product), product) for product in group]
+            priced = [(price, currency, product) for (price, currency), product in priced if price is not None]
+            if not priced:
+                continue
+
+            # Only offers in the same currency can be compared; use the one most of them share
+            currency = Counter(currency for _, currency, _ in priced).most_common(1)[0][0]
+            priced = sorted((entry for entry in priced if entry[1] == currency), key=lambda entry: entry[0])
+            stores = {product.get('source') or product.get('website') for _, _, product in priced}
+            if len(stores) < min_stores:
+                continue
+
+            best_price, _, best = priced[0]
+            highest_price = priced[-1][0]
+            comparisons.append({
+                'title': best.get('title'),
+                'stores': sorted(store for store in stores if store),
+                'offer_count': len(priced),
+                'currency': currency,
+                'best_price': best_price,
+                'best_store': best.get('source') or best.get('website'),
+                'best_url': best.get('url'),
+                'highest_price': highest_price,
+                'price_spread': round(highest_price - best_price, 2),
+                'spread_percent': round((highest_price - best_price) / best_price * 100, 1) if best_price else None,
+                'offers': [
+                    {'store': product.get('source') or product.get('website'), 'title': product.get('title'),
+                     'price': price, 'url': product.get('url')}
+                    for price, _, product in priced
+                ],
+            })
+
+        comparisons.sort(key=lambda comparison: comparison['price_spread'], reverse=True)
+        return comparisons
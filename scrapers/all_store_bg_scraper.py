@@ -6,7 +6,6 @@ class AllStoreScraper(AsyncPlaywrightBaseScraper):
     def __init__(self, website_currency, update_gui_callback=None):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://allstore.bg/"
-        self.current_page = 1
         self.update_gui_callback = update_gui_callback
         self.website_that_is_scraped = "AllStore.bg"
 
@@ -15,9 +14,9 @@ class AllStoreScraper(AsyncPlaywrightBaseScraper):
         encoded_term = quote(search_term)
         return f"{self.base_url}search.html?phrase={encoded_term}"
 
-    def _construct_page_url(self, base_url, search_term):
-        if self.current_page >= 1:
-            return f"{self.base_url}search.html?phrase={quote(search_term)}&action=dmExecAdvancedSearch&page={self.current_page}"
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num >= 1:
+            return f"{self.base_url}search.html?phrase={quote(search_term)}&action=dmExecAdvancedSearch&page={page_num}"
         return base_url
 
     async def _extract_product_links(self, page, page_url):
@@ -26,8 +25,6 @@ class AllStoreScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-            
             await page.wait_for_selector('ul.c-search-grid-page__product-grid li', timeout=10000)
 
             product_elements = await page.query_selector_all('ul.c-search-grid-page__product-grid li')
@@ -78,8 +75,6 @@ class AllStoreScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Parsing AllStore product: {product_url}")
     
         try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-        
             await page.wait_for_selector('div.c-product-page__product-name-wrapper h1', timeout=10000)
 
             price_int_element = await page.query_selector('span.taxed-price-value')
@@ -112,8 +107,6 @@ class AllStoreScraper(AsyncPlaywrightBaseScraper):
             else:
                 print("DEBUG: No price element found")
 
-            price = self.convert_where_necessary(price)
-            
             title_element = await page.query_selector('div.c-product-page__product-name-wrapper h1')
             title = ""
             if title_element:
@@ -129,7 +122,6 @@ class AllStoreScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': self.website_that_is_scraped,  
                 'source_currency': self.website_currency,
-                'page': self.current_page
             }
 
             print(f"DEBUG: Extracted AllStore product: {title} - {price}")
@@ -10,7 +10,6 @@ class AmazonCoUkScraper(AsyncPlaywrightBaseScraper):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://www.amazon.co.uk/"
         self.website_that_is_scraped = "Amazon.co.uk"
-        self.current_page = 1
         self.update_gui_callback = update_gui_callback
 
     def _get_base_url(self, search_term):
@@ -18,9 +17,9 @@ class AmazonCoUkScraper(AsyncPlaywrightBaseScraper):
         encoded_term = quote(search_term)
         return f"{self.base_url}s?k={encoded_term}"
 
-    def _construct_page_url(self, base_url, search_term):
-        if self.current_page >= 1:
-            return f"{self.base_url}s?k={quote(search_term)}&page={self.current_page}"
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num >= 1:
+            return f"{self.base_url}s?k={quote(search_term)}&page={page_num}"
         return base_url
 
     async def _extract_product_links(self, page, page_url):
@@ -29,8 +28,6 @@ class AmazonCoUkScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-        
             await page.wait_for_selector('div[data-component-type="s-search-result"]', timeout=15000)
             
             html = await page.content()
@@ -89,13 +86,45 @@ class AmazonCoUkScraper(AsyncPlaywrightBaseScraper):
             print(f"DEBUG: Error extracting product links from Amazon.co.uk: {e}")
             return []
     
+    async def _extract_listing_items(self, page, page_url):
+        """Read title, price and link of every search result on the loaded page"""
+        await page.wait_for_selector('div[data-component-type="s-search-result"]', timeout=10000)
+        cards = await self._read_listing_cards(page, 'div[data-component-type="s-search-result"]', {
+            'title': ('div[data-cy=title-recipe]', None),
+            'href': ('a.a-link-normal', 'href'),
+            'price': ('span.a-price span.a-offscreen', 'textContent'),
+            'sponsored': ('.puis-sponsored-label-text', None),
+        })
+
+        listing_items = []
+        for card in cards:
+            href = card.get('href')
+            if card.get('sponsored') or not href or '/dp/' not in href:
+                continue
+            listing_items.append({
+                'title': card.get('title') or '',
+                'price': self._parse_listing_price(card.get('price')),
+                'url': urljoin(self.base_url, href).split('ref=')[0].split('?')[0],
+            })
+        print(f"DEBUG: Found {len(listing_items)} Amazon.co.uk listing items")
+        return listing_items
+
+    def _parse_listing_price(self, price_text):
+        """Parse the off-screen listing price text into a float"""
+        if not price_text:
+            return None
+        cleaned = re.sub(r'[^\d.]', '', price_text)
+        try:
+            return float(cleaned) if cleaned else None
+        except ValueError:
+            print(f"DEBUG: Could not parse listing price: '{price_text}'")
+            return None
+
     async def _extract_product_data(self, page, product_url):
         """Extract detailed information using Playwright"""
         print(f"DEBUG: Parsing Amazon.co.uk product: {product_url}")
 
         try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-    
             await page.wait_for_selector('h1#title span#productTitle', timeout=10000)
 
             title_element = await page.query_selector('h1#title span#productTitle')
@@ -152,8 +181,6 @@ class AmazonCoUkScraper(AsyncPlaywrightBaseScraper):
                 else:
                     print(f"DEBUG: No price found for product: {title}")
 
-            price = self.convert_where_necessary(price)
-
             product_data = {
                 'title': title,
                 'price': price,
@@ -161,7 +188,6 @@ class AmazonCoUkScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': 'Amazon.co.uk',
                 'source_currency': self.website_currency,  
-                'page': self.current_page  
             }
 
             print(f"DEBUG: Extracted Amazon.co.uk product: {title} - £{price}")
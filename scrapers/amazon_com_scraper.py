@@ -8,7 +8,6 @@ class AmazonComScraper(AsyncPlaywrightBaseScraper):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://www.amazon.com/"
         self.update_gui_callback = update_gui_callback
-        self.current_page = 1
         self.website_that_is_scraped = "Amazon.com"
 
     def _get_base_url(self, search_term):
@@ -16,15 +15,15 @@ class AmazonComScraper(AsyncPlaywrightBaseScraper):
         encoded_term = quote(search_term)
         return f"{self.base_url}s?k={encoded_term}&crid=2J0PCSZU19ONB&sprefix={encoded_term}%2Caps%2C153&ref=nb_sb_noss_2"
 
-    def _construct_page_url(self, base_url, search_term):
+    def _construct_page_url(self, base_url, search_term, page_num):
         """Construct paginated URL properly for Ardes"""
-        if self.current_page == 1:
+        if page_num == 1:
             return base_url
         
         parsed_url = urlparse(base_url)
         query_params = parse_qs(parsed_url.query)
 
-        query_params['page'] = [str(self.current_page)]
+        query_params['page'] = [str(page_num)]
 
         new_query = urlencode(query_params, doseq=True)
         new_url = urlunparse((
@@ -35,7 +34,6 @@ class AmazonComScraper(AsyncPlaywrightBaseScraper):
             new_query,
             parsed_url.fragment
         ))
-        self.current_page += 1
         return new_url
 
     async def _extract_product_links(self, page, page_url):
@@ -44,8 +42,6 @@ class AmazonComScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-        
             await page.wait_for_selector('div[data-component-type="s-search-result"]', timeout=10000)
 
             product_elements = await page.query_selector_all('div[data-component-type="s-search-result"]')
@@ -98,13 +94,45 @@ class AmazonComScraper(AsyncPlaywrightBaseScraper):
             print(f"DEBUG: Error extracting product links from Amazon.com: {e}")
             return []
 
+    async def _extract_listing_items(self, page, page_url):
+        """Read title, price and link of every search result on the loaded page"""
+        await page.wait_for_selector('div[data-component-type="s-search-result"]', timeout=10000)
+        cards = await self._read_listing_cards(page, 'div[data-component-type="s-search-result"]', {
+            'title': ('div[data-cy=title-recipe]', None),
+            'href': ('a.a-link-normal', 'href'),
+            'price': ('span.a-price span.a-offscreen', 'textContent'),
+            'sponsored': ('.puis-sponsored-label-text', None),
+        })
+
+        listing_items = []
+        for card in cards:
+            href = card.get('href')
+            if card.get('sponsored') or not href or '/dp/' not in href:
+                continue
+            listing_items.append({
+                'title': card.get('title') or '',
+                'price': self._parse_listing_price(card.get('price')),
+                'url': urljoin(self.base_url, href).split('ref=')[0].split('?')[0],
+            })
+        print(f"DEBUG: Found {len(listing_items)} Amazon.com listing items")
+        return listing_items
+
+    def _parse_listing_price(self, price_text):
+        """Parse the off-screen listing price text into a float"""
+        if not price_text:
+            return None
+        cleaned = re.sub(r'[^\d.]', '', price_text)
+        try:
+            return float(cleaned) if cleaned else None
+        except ValueError:
+            print(f"DEBUG: Could not parse listing price: '{price_text}'")
+            return None
+
     async def _extract_product_data(self, page, product_url):
         """Extract detailed information using Playwright"""
         print(f"DEBUG: Parsing Amazon.com product: {product_url}")
 
         try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-    
             await page.wait_for_selector('h1#title span#productTitle', timeout=10000)
 
             title_element = await page.query_selector('h1#title span#productTitle')
@@ -135,7 +163,6 @@ class AmazonComScraper(AsyncPlaywrightBaseScraper):
 
             price = price_text.replace('$', '').replace(',', '').strip()
 
-            price = self.convert_where_necessary(price)
             product_data = {
                 'title': title,
                 'price': price_text,
@@ -143,7 +170,6 @@ class AmazonComScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': 'Amazon.com',
                 'source_currency': self.website_currency,
-                'page': self.current_page
             }
 
             print(f"DEBUG: Extracted Amazon.com product: {title} - {price_text}")
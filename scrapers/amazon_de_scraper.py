@@ -11,16 +11,15 @@ class AmazonDeScraper(AsyncPlaywrightBaseScraper):
         self.base_url = "https://www.amazon.de/"
         self.update_gui_callback = update_gui_callback
         self.website_that_is_scraped = "Amazon.de"
-        self.current_page = 1
 
     def _get_base_url(self, search_term):
         """Generate clean search URL without restrictive parameters"""
         encoded_term = quote(search_term)
         return f"{self.base_url}s?k={encoded_term}&crid=2J0PCSZU19ONB&sprefix={encoded_term}%2Caps%2C153&ref=nb_sb_noss_2"
 
-    def _construct_page_url(self, base_url, search_term):
-        if self.current_page > 1:
-            return f"{self.base_url}s?k={quote(search_term)}&page={self.current_page}&xpid=L1vzNrANz4x19&crid=2J0PCSZU19ONB&qid=1760797196&sprefix={quote(search_term)}%2Caps%2C153&ref=sr_pg_2"
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num > 1:
+            return f"{self.base_url}s?k={quote(search_term)}&page={page_num}&xpid=L1vzNrANz4x19&crid=2J0PCSZU19ONB&qid=1760797196&sprefix={quote(search_term)}%2Caps%2C153&ref=sr_pg_2"
         return base_url
 
     async def _extract_product_links(self, page, page_url):
@@ -29,8 +28,6 @@ class AmazonDeScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-        
             await page.wait_for_selector('div[data-component-type="s-impression-counter"]', timeout=10000)
 
             product_elements = await page.query_selector_all('div[data-component-type="s-search-result"]')
@@ -132,13 +129,47 @@ class AmazonDeScraper(AsyncPlaywrightBaseScraper):
         
         return 0.0
 
+    async def _extract_listing_items(self, page, page_url):
+        """Read title, price and link of every search result on the loaded page"""
+        await page.wait_for_selector('div[data-component-type="s-search-result"]', timeout=10000)
+        cards = await self._read_listing_cards(page, 'div[data-component-type="s-search-result"]', {
+            'title': ('div[data-cy=title-recipe]', None),
+            'href': ('a.a-link-normal', 'href'),
+            'price': ('span.a-price span.a-offscreen', 'textContent'),
+            'sponsored': ('.puis-sponsored-label-text', None),
+        })
+
+        listing_items = []
+        for card in cards:
+            href = card.get('href')
+            if card.get('sponsored') or not href or '/dp/' not in href:
+                continue
+            listing_items.append({
+                'title': card.get('title') or '',
+                'price': self._parse_listing_price(card.get('price')),
+                'url': urljoin(self.base_url, href).split('ref=')[0].split('?')[0],
+            })
+        print(f"DEBUG: Found {len(listing_items)} Amazon.de listing items")
+        return listing_items
+
+    def _parse_listing_price(self, price_text):
+        """Parse the off-screen listing price text into a float"""
+        if not price_text:
+            return None
+        match = re.search(r'[\d.,]+', price_text)
+        if not match:
+            return None
+        try:
+            return float(match.group().replace('.', '').replace(',', '.'))
+        except ValueError:
+            print(f"DEBUG: Could not parse listing price: '{price_text}'")
+            return None
+
     async def _extract_product_data(self, page, product_url):
         """Extract detailed information using Playwright"""
         print(f"DEBUG: Parsing Amazon.de product: {product_url}")
 
         try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-    
             await page.wait_for_selector('h1#title span#productTitle', timeout=10000)
 
             title_element = await page.query_selector('h1#title span#productTitle')
@@ -151,7 +182,6 @@ class AmazonDeScraper(AsyncPlaywrightBaseScraper):
     
             price = await self._extract_price_from_page(page)
 
-            price = self.convert_where_necessary(price)
             product_data = {
                 'title': title,
                 'price': price,
@@ -159,7 +189,6 @@ class AmazonDeScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': 'Allstore.bg',  
                 'source_currency': self.website_currency,
-                'page': self.current_page
             }
 
             print(f"DEBUG: Extracted Amazon.de product: {title} - €{price}")
@@ -1,17 +1,24 @@
-import random
 import re
 from urllib.parse import urljoin, quote, urlparse, parse_qs, urlencode, urlunparse
 from scrapers.base_scraper import AsyncPlaywrightBaseScraper
 from playwright.async_api import Page
 from typing import List, Dict, Any, Optional
-import asyncio
 
 class ArdesScraper(AsyncPlaywrightBaseScraper):
+    supports_http_fetch = True
+    product_schema = {
+        'ready': 'div.product-title',
+        'title': 'div.product-title h1',
+        'price': 'span.bgn-price',
+        'spec_rows': 'ul.tech-specs-list li',
+        'spec_label': 'span',
+        'spec_value': None,
+    }
+
     def __init__(self, website_currency, update_gui_callback=None):
         super().__init__(website_currency, update_gui_callback)
         self.base_domain = "https://www.ardes.bg"
         self.update_gui_callback = update_gui_callback
-        self.current_page = 1
         self.website_that_is_scraped = "Ardes.bg"
 
     def _get_base_url(self, search_term):
@@ -19,9 +26,9 @@ class ArdesScraper(AsyncPlaywrightBaseScraper):
         encoded_term = quote(search_term)
         return f"https://www.ardes.bg/products?q={encoded_term}"
 
-    def _construct_page_url(self, base_url, search_term):
+    def _construct_page_url(self, base_url, search_term, page_num):
         """Construct paginated URL properly for Ardes"""
-        if self.current_page == 1:
+        if page_num == 1:
             return base_url
     
         parsed_url = urlparse(base_url)
@@ -30,277 +37,198 @@ class ArdesScraper(AsyncPlaywrightBaseScraper):
         if 'page' in path_parts:
             for i, part in enumerate(path_parts):
                 if part == 'page' and i + 1 < len(path_parts):
-                    path_parts[i + 1] = str(self.current_page)
+                    path_parts[i + 1] = str(page_num)
                     break
         else:
             if 'products' in path_parts:
                 products_index = path_parts.index('products')
                 path_parts.insert(products_index + 1, 'page')
-                path_parts.insert(products_index + 2, str(self.current_page))
+                path_parts.insert(products_index + 2, str(page_num))
             else:
                 if parsed_url.path.endswith('/'):
-                    new_path = f"{parsed_url.path}page/{self.current_page}"
+                    new_path = f"{parsed_url.path}page/{page_num}"
                 else:
-                    new_path = f"{parsed_url.path}/page/{self.current_page}"
+                    new_path = f"{parsed_url.path}/page/{page_num}"
                 parsed_url = parsed_url._replace(path=new_path)
-                self.current_page += 1
                 return urlunparse(parsed_url)
     
         new_path = '/'.join(path_parts)
         parsed_url = parsed_url._replace(path=new_path)
     
-        self.current_page += 1
         return urlunparse(parsed_url)
     
+    def _parse_price_text(self, price_text):
+        return self._parse_ardes_price(price_text)
+
+    async def _extract_product_data(self, page, product_url):
+        return await self._extract_product_data_from_schema(page, product_url)
+
+    def _parse_ardes_price(self, price_text):
+        """Parse the BGN price span text into a float"""
+        print(f"DEBUG: Raw price text: {price_text}")
+
+        price_text = price_text.strip()
+        price_text = re.sub(r'[^\d,.-]', '', price_text)
+        price_text = price_text.replace(',', '.')
+
+        try:
+            price = float(price_text)
+            print(f"DEBUG: Parsed price: {price}")
+            return price
+        except ValueError:
+            print(f"DEBUG: Could not parse price to float: {price_text}")
+            return 0.0
+
+    def _parse_product_links_html(self, soup, page_url):
+        """Get product links from the static search page HTML"""
+        product_links = []
+        skipped_count = 0
+
+        for product in soup.select('div.product'):
+            title_text = ""
+            for selector in ['div.product-head a', 'span.ellip-line', '.product-title', '.name', 'h2', 'h3', 'a[href]']:
+                text = self._soup_text(product, selector)
+                if len(text) > 5:
+                    title_text = text
+                    break
+
+            if title_text and self._should_filter_by_keywords({'title': title_text, 'description': ''}):
+                print(f'Skipped product "{title_text}" because it matches exclusion keywords')
+                skipped_count += 1
+                continue
+
+            link_element = product.select_one('div.product-head > a[href]') or product.select_one('a[href]')
+            if link_element and link_element.get('href'):
+                product_links.append(urljoin(self.base_domain, link_element['href']))
+
+        print(f"DEBUG: Total Ardes product links found over HTTP: {len(product_links)} (skipped {skipped_count} products)")
+        if not product_links and skipped_count == 0:
+            return None
+        return list(dict.fromkeys(product_links))
+
+    def _parse_listing_items_html(self, soup, page_url):
+        """Read title, price and link of every product in the static search page HTML"""
+        listing_items = []
+        for product in soup.select('div.product'):
+            link_element = product.select_one('div.product-head > a[href]') or product.select_one('a[href]')
+            if not link_element:
+                continue
+            price_text = self._soup_text(product, 'span.bgn-price')
+            listing_items.append({
+                'title': self._soup_text(product, 'div.product-head a') or link_element.get_text(" ", strip=True),
+                'price': self._parse_ardes_price(price_text) if price_text else None,
+                'url': urljoin(self.base_domain, link_element['href']),
+            })
+        return listing_items or None
+
     async def _extract_product_links(self, page: Page, page_url: str) -> List[str]:
-        """Get all product links using Playwright with retry logic"""
+        """Get all product links from the already loaded search page"""
         print(f"DEBUG: Extracting product links from: {page_url}")
 
-        for attempt in range(3):
-            try:
-                print(f"DEBUG: Attempt {attempt + 1} for {page_url}")
+        selectors_to_try = [
+            'div.products-grid',
+            '.search-results', 
+            '.product-item',
+            '[class*="product"]',
+            '.product-list'
+        ]
 
-                await page.mouse.wheel(0, random.randint(400, 900))
-                await asyncio.sleep(random.uniform(0.5, 1.5))
-        
-                wait_strategies = ['domcontentloaded', 'load', 'networkidle']
-                wait_strategy = wait_strategies[min(attempt, len(wait_strategies)-1)]
-        
-                await page.goto(page_url, wait_until=wait_strategy, timeout=30000)
-                print(f"DEBUG: Page loaded successfully: {page_url} (wait_until: {wait_strategy})")
-            
-                selectors_to_try = [
-                    'div.products-grid',
-                    '.search-results', 
-                    '.product-item',
-                    '[class*="product"]',
-                    '.product-list'
-                ]
-        
-                found_selector = None
-                for selector in selectors_to_try:
-                    try:
-                        await page.wait_for_selector(selector, timeout=10000)
-                        found_selector = selector
-                        print(f"DEBUG: Found product grid with selector: {selector}")
-                        break
-                    except Exception:
-                        continue
-        
-                if not found_selector:
-                    print(f"DEBUG: Could not find main product grid on attempt {attempt + 1}")
-                    if attempt < 2:
-                        print(f"DEBUG: Retrying in {2 * (attempt + 1)} seconds...")
-                        await asyncio.sleep(2 * (attempt + 1))  
-                        continue
-                    else:
-                        screenshot_path = f"debug_ardes_{hash(page_url)}_{attempt}.png"
-                        await page.screenshot(path=screenshot_path, full_page=True)
-                        print(f"DEBUG: Screenshot saved to {screenshot_path}")
-                        return []
-        
-                product_elements = await page.query_selector_all('div.product')
-                print(f"DEBUG: Found {len(product_elements)} product elements")
-            
-                if product_elements:
-                    first_product = product_elements[0]
-                    all_text = await first_product.inner_text()
-                    print(f"DEBUG: First product full text: {all_text}")
+        found_selector = await self._wait_for_selector_with_fallback(page, selectors_to_try)
+        if not found_selector:
+            print(f"DEBUG: Could not find main product grid on {page_url}")
+            screenshot_path = f"debug_ardes_{hash(page_url)}.png"
+            await page.screenshot(path=screenshot_path, full_page=True)
+            print(f"DEBUG: Screenshot saved to {screenshot_path}")
+            return []
 
-                    test_selectors = [
-                        'span.ellip-line',
-                        '.product-title',
-                        '.name',
-                        'h2',
-                        'h3',
-                        'a',
-                        'div.product-head',
-                        'div.product-head a'
-                    ]
-                
-                    for selector in test_selectors:
-                        element = await first_product.query_selector(selector)
-                        if element:
-                            text = await element.inner_text()
-                            print(f"DEBUG: Selector '{selector}' gives: {text.strip()[:100]}")
-            
-                product_links = []
-                skipped_count = 0
-            
-                for product in product_elements:
-                    try:
-                        title_text = ""
-                        title_selectors = [
-                            'div.product-head a',  
-                            'span.ellip-line',
-                            '.product-title',
-                            '.name',
-                            'h2',
-                            'h3',
-                            'a[href]'
-                        ]
-                    
-                        for selector in title_selectors:
-                            title_element = await product.query_selector(selector)
-                            if title_element:
-                                text = await title_element.inner_text()
-                                if text and len(text.strip()) > 5:  
-                                    title_text = text.strip()
-                                    break
-                    
-                        if not title_text or len(title_text) < 10:
-                            link_element = await product.query_selector('a[href]')
-                            if link_element:
-                                title_text = await link_element.inner_text()
-                                title_text = title_text.strip()
-                    
-                        print(f"DEBUG: Extracted title: {title_text}")
-                    
-                        if title_text:
-                            temp_product_data = {'title': title_text, 'description': ''}
-                            if self._should_filter_by_keywords(temp_product_data):
-                                print(f'Skipped product "{title_text}" because it matches exclusion keywords')
-                                skipped_count += 1
-                                continue  
-                    
-                        link_element = await product.query_selector('div.product-head > a[href]')
-                        if not link_element:
-                            link_element = await product.query_selector('a[href]')
-                    
-                        if link_element:
-                            href = await link_element.get_attribute('href')
-                            if href:
-                                full_url = urljoin(self.base_domain, href)
-                                product_links.append(full_url)
-                                print(f"DEBUG: Added product link for: {title_text}")
-                            
-                    except Exception as e:
-                        print(f"DEBUG: Error processing product: {e}")
-                        continue
-            
-                print(f"DEBUG: Total Ardes product links found: {len(product_links)} (skipped {skipped_count} products)")
-        
-                if product_links:
-                    unique_links = list(dict.fromkeys(product_links))
-                    if len(product_links) != len(unique_links):
-                        print(f"DEBUG: Removed {len(product_links) - len(unique_links)} duplicate URLs")
-                    return unique_links
-                else:
-                    print(f"DEBUG: No product links found on attempt {attempt + 1}")
-                    if attempt < 2:
-                        print(f"DEBUG: Retrying in {2 * (attempt + 1)} seconds...")
-                        await asyncio.sleep(2 * (attempt + 1))  
-                        continue
-        
-            except Exception as e:
-                print(f"DEBUG: Attempt {attempt + 1} failed for {page_url}: {e}")
-        
-                if attempt < 2: 
-                    print(f"DEBUG: Retrying in {2 * (attempt + 1)} seconds...")
-                    await asyncio.sleep(2 * (attempt + 1))  
-                    continue  
-                else:
-                    print(f"DEBUG: All attempts failed for {page_url}")
-                    import traceback
-                    traceback.print_exc()
-                    return []
+        product_elements = await page.query_selector_all('div.product')
+        print(f"DEBUG: Found {len(product_elements)} product elements")
 
-        return []
-    
-    async def _extract_product_data(self, page: Page, product_url: str) -> Optional[Dict[str, Any]]:
-        """Extract detailed information using Playwright"""
-        print(f"DEBUG: Parsing Ardes product: {product_url}")
-        
-        for attempt in range(3): 
+        product_links = []
+        skipped_count = 0
+
+        for product in product_elements:
             try:
-                await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-                await self._rate_limit()
-                try:
-                    await page.wait_for_selector('div.product-title', timeout=15000)
-                except Exception as e:
-                    print(f"DEBUG: Could not find product title: {e}")
-                    await page.wait_for_selector('h1, .title, [itemprop="name"]', timeout=5000)
+                title_text = ""
+                title_selectors = [
+                    'div.product-head a',  
+                    'span.ellip-line',
+                    '.product-title',
+                    '.name',
+                    'h2',
+                    'h3',
+                    'a[href]'
+                ]
 
-                title_element = await page.query_selector('div.product-title h1')
-                title = ""
-                if title_element:
-                    title = await title_element.inner_text()
-                    title = title.strip()
+                for selector in title_selectors:
+                    title_element = await product.query_selector(selector)
+                    if title_element:
+                        text = await title_element.inner_text()
+                        if text and len(text.strip()) > 5:  
+                            title_text = text.strip()
+                            break
 
-                price = 0.0
+                if not title_text or len(title_text) < 10:
+                    link_element = await product.query_selector('a[href]')
+                    if link_element:
+                        title_text = await link_element.inner_text()
+                        title_text = title_text.strip()
 
-                price_element = await page.query_selector('span.bgn-price')
-                if price_element:
-                    price = await price_element.inner_text()
-                    print(f"DEBUG: Raw price text: {price}")
+                print(f"DEBUG: Extracted title: {title_text}")
 
-                    price_text = price.strip()
-                    price_text = re.sub(r'[^\d,.-]', '', price_text)
-                    price_text = price_text.replace(',', '.')
+                if title_text:
+                    temp_product_data = {'title': title_text, 'description': ''}
+                    if self._should_filter_by_keywords(temp_product_data):
+                        print(f'Skipped product "{title_text}" because it matches exclusion keywords')
+                        skipped_count += 1
+                        continue  
 
-                    try:
-                        price = float(price_text)
-                        print(f"DEBUG: Parsed price: {price}")
-                    except ValueError:
-                        print(f"DEBUG: Could not parse price to float: {price_text}")
-                        price = 0.0
-                else:
-                    print("DEBUG: Price element not found")
-                
-                price = self.convert_where_necessary(price)
+                link_element = await product.query_selector('div.product-head > a[href]')
+                if not link_element:
+                    link_element = await product.query_selector('a[href]')
 
-                product_data = {}
-                tech_specs_list = await page.query_selector('ul.tech-specs-list')
-                if tech_specs_list:
-                    list_items = await tech_specs_list.query_selector_all('li')
-                    for li in list_items:
-                        try:
-                            if li:
-                                label_element = await li.query_selector('span')
-                                value_text = (await li.inner_text()).strip()  
-                                label = (await label_element.inner_text()).strip() if label_element else ''
-                                value = value_text.replace(label, '').strip() if label else value_text
-                        
-                                product_data[label] = value
-                                print(f"DEBUG: Added property from list: {label} = {value}")
-                        except Exception as e:
-                            print(f"DEBUG: Skipping tech specs list item: {str(e)}")
-                            continue
-
-                if price == 0.0:
-                    print(f"DEBUG: Could not find price for product: {title}")
+                if link_element:
+                    href = await link_element.get_attribute('href')
+                    if href:
+                        full_url = urljoin(self.base_domain, href)
+                        product_links.append(full_url)
+                        print(f"DEBUG: Added product link for: {title_text}")
 
-                product_data.update({
-                    'title': title,
-                    'price': price,
-                    'url': product_url,
-                    'currency': self.website_currency,
-                    'source': 'Ardes.bg',
-                    'source_currency': self.website_currency,
-                    'page': self.current_page
-                })
-                print(f"DEBUG: Extracted Ardes product: {title} - {price} {self.website_currency}")
-                return product_data
-            
             except Exception as e:
-                    print(f"DEBUG: Attempt {attempt + 1} failed for {product_url}: {e}")
-            
-            if attempt < 2: 
-                print(f"DEBUG: Retrying in {2 * (attempt + 1)} seconds...")
-                await asyncio.sleep(2 * (attempt + 1))  
-                continue  
-            else:
-                print(f"DEBUG: All attempts failed for {product_url}")
-                import traceback
-                traceback.print_exc()
-                return []
+                print(f"DEBUG: Error processing product: {e}")
+                continue
+
+        print(f"DEBUG: Total Ardes product links found: {len(product_links)} (skipped {skipped_count} products)")
 
-    async def _get_total_pages(self, page: Page, base_url: str) -> int:
-        """Get total number of pages for pagination"""
-        await page.mouse.wheel(0, random.randint(400, 900))
+        unique_links = list(dict.fromkeys(product_links))
+        if len(product_links) != len(unique_links):
+            print(f"DEBUG: Removed {len(product_links) - len(unique_links)} duplicate URLs")
+        return unique_links
+    
+    async def _extract_listing_items(self, page: Page, page_url: str) -> Optional[List[Dict[str, Any]]]:
+        """Read title, price and link of every product on the loaded search page"""
+        await self._wait_for_selector_with_fallback(page, ['div.products-grid', 'div.product'])
+        cards = await self._read_listing_cards(page, 'div.product', {
+            'title': ('div.product-head a', None),
+            'href': ('div.product-head > a[href], a[href]', 'href'),
+            'price': ('span.bgn-price', None),
+        })
+
+        listing_items = []
+        for card in cards:
+            if not card.get('href'):
+                continue
+            listing_items.append({
+                'title': card.get('title') or '',
+                'price': self._parse_ardes_price(card['price']) if card.get('price') else None,
+                'url': urljoin(self.base_domain, card['href']),
+            })
+        print(f"DEBUG: Found {len(listing_items)} Ardes listing items")
+        return listing_items
+
+    async def _get_total_pages(self, page: Page) -> int:
+        """Get total number of pages from the pagination of the loaded search page"""
         try:
-            await page.goto(base_url, wait_until='domcontentloaded', timeout=30000)
-            
             pagination_selectors = [
                 '.pagination',
                 '.pages',
@@ -329,4 +257,4 @@ class ArdesScraper(AsyncPlaywrightBaseScraper):
             
         except Exception as e:
             print(f"DEBUG: Error getting total pages: {e}")
-            return 1
\ No newline at end of file
+            return 1
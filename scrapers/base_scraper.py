@@ -1,28 +1,53 @@
 import asyncio
+import contextvars
 from abc import ABC, abstractmethod
-from typing import Deque
 import random
 import re
-import time 
 from playwright.async_api import async_playwright
 from typing import List, Dict, Any, Optional
 import logging
-from scrapers.cpu_memory_manager import CPUMemoryManagerClass
-from settings_manager import SettingsManager
-from currency_converter import RealCurrencyConverter
+from scrapers.http_fetcher import AsyncHttpFetcher
+from scrapers.page_cache import PageCache
+from scrapers.incremental_state import IncrementalState
+from scrapers.rate_limiter import DomainRateLimiter, THROTTLE_STATUSES
+from scrapers.registry import shared_resources
+from scrapers.product import Product
+from scrapers.keyword_filter import KeywordFilter
 import threading
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cards the site's listing extractor dropped through the keyword filter while reading one search page.
+# Set around the extraction only, so product-page filtering done later is not counted.
+_listing_filtered_cards = contextvars.ContextVar('listing_filtered_cards', default=None)
+
 class AsyncPlaywrightBaseScraper(ABC):
     """Async version of the base scraper for massive performance gains"""
+
+    # Sites whose listing and product pages are fully server-rendered set this
+    # and implement the _parse_*_html hooks; Playwright stays as the fallback.
+    supports_http_fetch = False
+
+    # Navigation is owned by the base class; subclasses only parse loaded pages.
+    listing_wait_until = 'domcontentloaded'
+    product_wait_until = 'domcontentloaded'
+
+    # Declarative product page layout, read with one page.evaluate (or one soup pass):
+    #   ready       - selector to wait for before reading
+    #   title/price - selectors for the title and price text
+    #   spec_rows   - selector for every spec row
+    #   spec_label  - selector for the label inside a row
+    #   spec_value  - selector for the value inside a row; None means row text minus label
+    #   value_strip - characters stripped from the start of each value
+    #   lowercase_specs, skip_labels, filter_products - per-site tweaks
+    product_schema = None
     
     def __init__(self, website_currency, gui_callback=None):
         self.website_currency = website_currency
         self.gui_callback = gui_callback
-        self.converter = RealCurrencyConverter()
-        self.settings_manager = SettingsManager()
+        self.converter = shared_resources.converter
+        self.settings_manager = shared_resources.settings_manager
 
         self.products_collected = 0
         self.total_expected_products = 0
@@ -32,9 +57,12 @@ class AsyncPlaywrightBaseScraper(ABC):
 
         self.max_concurrent_products = 3
         
-        self._request_times = Deque()
-        self.max_requests_per_minute = 30
-        self.min_delay_between_requests = 1.5
+        self.rate_limiter = None
+        self.browser_pool = None
+        self.result_sink = None
+        self.session_journal = None
+        self.session_id = None
+        self._completed_pages = set()
         
         raw_min = self.settings_manager.get('min_price', 0)
         raw_max = self.settings_manager.get('max_price', 0)
@@ -49,8 +77,6 @@ class AsyncPlaywrightBaseScraper(ABC):
         
         self._update_converted_prices()
         
-        self.exclude_keywords = self.settings_manager.get('exclude_keywords', [])
-
         self.exclude_keywords = self.settings_manager.get('exclude_keywords', [])
         
         self.current_progress = 0
@@ -63,7 +89,7 @@ class AsyncPlaywrightBaseScraper(ABC):
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
         ]
-        self.cpu_manager = CPUMemoryManagerClass()
+        self.cpu_manager = shared_resources.cpu_manager
         self.process_pool = None
         
         self._stop_event = threading.Event()
@@ -72,6 +98,17 @@ class AsyncPlaywrightBaseScraper(ABC):
         self._running = False
 
         self._processed_urls = set()
+        self._last_page_num = float('inf')
+
+        self.use_http_fetch = self.settings_manager.get('http_fetch_enabled', True)
+        self.scrape_mode = self.settings_manager.get('scrape_mode', 'full')
+        self.fast_mode_fetch_specs = self.settings_manager.get('fast_mode_fetch_specs', False)
+        self.incremental_mode = self.settings_manager.get('incremental_mode', False)
+        self.incremental_max_age_hours = self.settings_manager.get('incremental_max_age_hours', 72)
+        self._incremental_state = None
+        self._listing_prices = {}
+        self.http_fetcher = None
+        self._owns_http_fetcher = False
 
     def _update_converted_prices(self):
         """Update converted price values based on current settings"""
@@ -95,14 +132,18 @@ class AsyncPlaywrightBaseScraper(ABC):
             self.converted_min = self._convert_prices_only(self.original_min_price, "EUR", target_currency)
             self.converted_max = self._convert_prices_only(self.original_max_price, "EUR", target_currency)
 
-    def convert_where_necessary(self, price):
-        converted_price = float(self._convert_prices_only(price, self.website_currency, "EUR"))
-        if converted_price is not None:
-            if self._should_filter_by_price({'price': converted_price}):
-                print(f'Skipped product because it was not in the range of the price filter: {self.converted_min:.2f} - {self.converted_max:.2f} EUR')
-                return None
-        else:
-            print(f"DEBUG: Could not convert price {price} {self.website_currency} to EUR")
+    async def _ensure_conversion_rates(self):
+        """Load the rates this scraper converts with before products arrive, off the event loop"""
+        if not hasattr(self.converter, 'get_rate_async'):
+            return
+        try:
+            await asyncio.gather(
+                self.converter.get_rate_async(self.website_currency, "EUR"),
+                self.converter.get_rate_async(self.preferred_currency, "EUR"),
+            )
+            self._update_converted_prices()
+        except Exception as e:
+            logger.error(f"Could not load currency rates: {e}")
 
     def update_settings(self, min_price=None, max_price=None, exclude_keywords=None):
         """Update scraper settings and re-convert if needed"""
@@ -144,14 +185,19 @@ class AsyncPlaywrightBaseScraper(ABC):
                 
         return default
     def _convert_prices_only(self, price_val, source_currency, target_currency):
-        """Convert a single price value to the target currency - returns float"""
+        """Convert a single price value to the target currency - returns float.
+        Uses rates already in memory so it never blocks the event loop on a network lookup."""
         try:
             if isinstance(price_val, str):
                 price_val = self._safe_float_conversion(price_val)
                 
             if price_val is None:
                 return None
-                
+
+            if hasattr(self.converter, 'get_cached_rate'):
+                rate = self.converter.get_cached_rate(source_currency, target_currency)
+                return float(price_val) * rate if rate else None
+
             converted_price = self.converter.convert_currency(
                 float(price_val),
                 source_currency,
@@ -204,6 +250,30 @@ class AsyncPlaywrightBaseScraper(ABC):
         print(f"DEBUG: Page loaded successfully: {url} (wait_until: {wait_strategy})")
         return True
     
+    async def _goto_page(self, page, url: str, wait_until: str, timeout: int, worker_id: int = 0) -> bool:
+        """The single navigation point for listing and product pages, with retries"""
+        for attempt in range(3):
+            if self._stop_requested:
+                return False
+
+            try:
+                await self._rate_limit(url)
+                response = await page.goto(url, wait_until=wait_until, timeout=timeout)
+
+                status = response.status if response else None
+                captcha = 'captcha' in page.url.lower()
+                self._get_rate_limiter().report(url, status, captcha=captcha)
+                if captcha or status in THROTTLE_STATUSES:
+                    logger.warning(f"Worker {worker_id}: Throttled on {url} (status={status}, captcha={captcha})")
+                    continue
+                return True
+            except Exception as e:
+                if attempt == 2:
+                    logger.error(f"Worker {worker_id}: Failed to load {url}: {e}")
+                    return False
+                await asyncio.sleep(1 * (attempt + 1))
+        return False
+
     async def _wait_for_selector_with_fallback(self, page, selectors: List[str], timeout: int = 10000) -> Optional[str]:
         """Wait for any of the given selectors with fallback options"""
         for selector in selectors:
@@ -215,30 +285,184 @@ class AsyncPlaywrightBaseScraper(ABC):
                 continue
         return None
     
-    async def _rate_limit(self):
-        """Rate limiting to avoid detection"""
-        now = time.time()
-    
-        while self._request_times and now - self._request_times[0] > 60:
-            self._request_times.popleft()
-        
-        if len(self._request_times) >= self.max_requests_per_minute:
-            wait_time = 60 - (now - self._request_times[0])
-            if wait_time > 0:
-                print(f"DEBUG: Rate limit hit, waiting {wait_time:.1f}s")
-                await asyncio.sleep(wait_time)
-        
-        delay = self.settings_manager.get('delay_between_requests', 2) * random.uniform(0.8, self.settings_manager.get('random_delay_multiplier', 1.5))
-        delay = max(delay, self.min_delay_between_requests)
-        
-        print(f"DEBUG: Rate limiting - waiting {delay:.2f}s")
-        await asyncio.sleep(delay)
-        
-        self._request_times.append(now)
+    def _get_rate_limiter(self) -> DomainRateLimiter:
+        """Use the limiter shared by the container, or a private one when running standalone"""
+        if self.rate_limiter is None:
+            self.rate_limiter = DomainRateLimiter.from_settings(self.settings_manager)
+        return self.rate_limiter
+
+    async def _rate_limit(self, url: str):
+        """Wait for the per-domain token bucket before a network request"""
+        await self._get_rate_limiter().acquire(url)
     
     async def _get_random_user_agent(self):
         """Get random user agent"""
         return random.choice(self.user_agents)
+
+    def _can_use_http_fetch(self) -> bool:
+        """Check if this site can be scraped without a browser page"""
+        return self.supports_http_fetch and self.use_http_fetch and AsyncHttpFetcher.is_available()
+
+    def _get_http_fetcher(self) -> AsyncHttpFetcher:
+        """Return the shared HTTP fetcher, creating a private one if none was assigned"""
+        if self.http_fetcher is None:
+            self.http_fetcher = AsyncHttpFetcher(
+                user_agents=self.user_agents,
+                page_cache=PageCache.from_settings(self.settings_manager),
+            )
+            self.http_fetcher.rate_limiter = self._get_rate_limiter()
+            self._owns_http_fetcher = True
+        return self.http_fetcher
+
+    async def _fetch_soup(self, url: str, listing: bool = False):
+        """Download a page over plain HTTP (or the page cache) and parse it, or None if that fails"""
+        html = await self._get_http_fetcher().fetch_text(url, listing=listing)
+        if not html:
+            return None
+        return AsyncHttpFetcher.make_soup(html)
+
+    def _soup_text(self, node, selector: str) -> str:
+        """Stripped text of the first element matching selector, or an empty string"""
+        element = node.select_one(selector) if node is not None else None
+        return element.get_text(" ", strip=True) if element else ""
+
+    def _parse_product_links_html(self, soup, page_url: str) -> Optional[List[str]]:
+        """Parse product links from a static listing page; None means use Playwright"""
+        return None
+
+    def _parse_product_html(self, soup, product_url: str) -> Optional[Dict[str, Any]]:
+        """Parse product data from a static product page; None means use Playwright, {} means filtered out"""
+        if not self.product_schema:
+            return None
+        return self._build_product_from_schema(self._read_schema_from_soup(soup), product_url)
+
+    def _read_schema_from_soup(self, soup) -> Dict[str, Any]:
+        """Soup counterpart of the product_schema page.evaluate"""
+        schema = self.product_schema
+        specs = []
+        for row in soup.select(schema['spec_rows']) if schema.get('spec_rows') else []:
+            label = self._soup_text(row, schema['spec_label']) if schema.get('spec_label') else ''
+            if schema.get('spec_value'):
+                value = self._soup_text(row, schema['spec_value'])
+            else:
+                value = row.get_text(" ", strip=True)
+                if label:
+                    value = value.replace(label, '', 1).strip()
+            specs.append([label, value])
+
+        return {
+            'title': self._soup_text(soup, schema['title']),
+            'price': self._soup_text(soup, schema['price']) if schema.get('price') else '',
+            'specs': specs,
+        }
+
+    async def _read_schema_from_page(self, page) -> Dict[str, Any]:
+        """Read title, price and all spec rows of the loaded page in a single round-trip"""
+        return await page.evaluate("""(schema) => {
+            const text = (root, selector) => {
+                const el = selector ? root.querySelector(selector) : root;
+                return el ? el.innerText.trim() : '';
+            };
+            const specs = [];
+            if (schema.spec_rows) {
+                for (const row of document.querySelectorAll(schema.spec_rows)) {
+                    const label = schema.spec_label ? text(row, schema.spec_label) : '';
+                    let value = text(row, schema.spec_value || null);
+                    if (!schema.spec_value && label) value = value.replace(label, '').trim();
+                    specs.push([label, value]);
+                }
+            }
+            return {
+                title: schema.title ? text(document, schema.title) : '',
+                price: schema.price ? text(document, schema.price) : '',
+                specs: specs,
+            };
+        }""", {key: value for key, value in self.product_schema.items() if isinstance(value, (str, type(None)))})
+
+    def _parse_price_text(self, price_text: str):
+        """Site-specific price parsing hook for product_schema scrapers"""
+        return self._safe_float_conversion(price_text, 0.0)
+
+    def _build_product_from_schema(self, raw: Dict[str, Any], product_url: str) -> Optional[Dict[str, Any]]:
+        """Turn the raw schema read into the product dict every scraper returns"""
+        schema = self.product_schema
+        title = (raw.get('title') or '').strip()
+        if not title:
+            return None
+
+        lowercase = schema.get('lowercase_specs', False)
+        skip_labels = schema.get('skip_labels', ())
+        value_strip = schema.get('value_strip', '')
+
+        product_data = {}
+        for label, value in raw.get('specs', []):
+            label = label.strip()
+            value = value.lstrip(value_strip).strip() if value_strip else value.strip()
+            if lowercase:
+                label, value = label.lower(), value.lower()
+            if label and value and label not in skip_labels:
+                product_data[label] = value
+
+        price = self._parse_price_text(raw.get('price') or '')
+
+        product_data.update({
+            'title': title,
+            'price': price,
+            'url': product_url,
+            'currency': self.website_currency,
+            'source': self.website_that_is_scraped,
+            'source_currency': self.website_currency,
+        })
+        print(f"DEBUG: Extracted {self.website_that_is_scraped} product: {title} - {price} {self.website_currency} ({len(raw.get('specs', []))} spec rows)")
+
+        if schema.get('filter_products') and not self._passes_current_filters(product_data):
+            print(f"DEBUG: Product filtered out: {title}")
+            return {}
+
+        return product_data
+
+    def _parse_listing_items_html(self, soup, page_url: str) -> Optional[List[Dict[str, Any]]]:
+        """Parse partial products (title, price, url) from a static listing page; None if unsupported"""
+        return None
+
+    async def _extract_listing_http(self, page_url: str, want_items: bool):
+        """Try to read the listing over HTTP before opening a browser page, returns (items, links)"""
+        try:
+            soup = await self._fetch_soup(page_url, listing=True)
+            if soup is None:
+                return None, None
+            if want_items:
+                listing_items = self._parse_listing_items_html(soup, page_url)
+                if listing_items is not None:
+                    return listing_items, None
+            return None, self._parse_product_links_html(soup, page_url)
+        except Exception as e:
+            logger.error(f"HTTP listing extraction failed for {page_url}: {e}")
+            return None, None
+
+    async def _scrape_single_product_http(self, product_url: str, worker_id: int, page_num: Optional[int] = None):
+        """Scrape a product over HTTP; returns None when the caller should fall back to Playwright"""
+        if self._stop_requested:
+            return {}
+
+        try:
+            soup = await self._fetch_soup(product_url)
+            if soup is None or self._stop_requested:
+                return None
+
+            product_data = self._parse_product_html(soup, product_url)
+            if product_data is None:
+                print(f"DEBUG: HTTP parse gave nothing for {product_url}, falling back to Playwright")
+                return None
+
+            # {} (filtered by the parser) is journaled as filtered by _register_product
+            product_data = self._register_product(product_data, product_url, page_num)
+            self._remember_product(product_data, product_url)
+            return product_data or {}
+
+        except Exception as e:
+            logger.error(f"Worker {worker_id}: HTTP scrape failed for {product_url}: {e}")
+            return None
     
     def stop_scraping(self):
         """Stop this individual scraper instance"""
@@ -279,6 +503,15 @@ class AsyncPlaywrightBaseScraper(ABC):
             self.total_pages_to_scrape = 0
             self.total_products_found = 0
             self.products_per_page = {}
+            self._processed_urls = set()
+            self._listing_prices = {}
+            self._incremental_state = None
+            if self.incremental_mode:
+                self._incremental_state = IncrementalState.load(
+                    self.website_that_is_scraped, search_term,
+                    max_age_hours=self.incremental_max_age_hours,
+                )
+            resumed_results = self._load_session_progress()
             
             self._update_gui({
                 'type': 'product_count',
@@ -289,10 +522,13 @@ class AsyncPlaywrightBaseScraper(ABC):
             })
             self._update_gui({'type': 'start', 'scraper_name' : self.__class__.__name__, 'message': 'Starting async scrape'})
             
+            await self._ensure_conversion_rates()
+
             optimal_workers = self.cpu_manager.get_optimal_worker_count()
             logger.info(f"Using {optimal_workers} workers for scraping")
 
-            all_results = await self._distributed_scrape(search_term, max_pages, optimal_workers)
+            all_results = resumed_results + await self._distributed_scrape(search_term, max_pages, optimal_workers)
+            self._save_incremental_state()
             
             self._running = False
             if not self._stop_requested:
@@ -326,27 +562,36 @@ class AsyncPlaywrightBaseScraper(ABC):
         except Exception as e:
             logger.error(f"Error closing scraper context: {e}")
 
+        if self._owns_http_fetcher and self.http_fetcher:
+            await self.http_fetcher.close()
+            self.http_fetcher = None
+            self._owns_http_fetcher = False
+
     async def _distributed_scrape(self, search_term: str, max_pages: int, num_workers: int) -> List[Dict[str, Any]]:
-        """Distribute scraping across multiple processes/cores with stop support"""
-        
-        worker_tasks = []
-        self.total_pages_to_scrape = 0
+        """Fan search pages out to workers pulling page numbers from a shared queue"""
 
-        for worker_id in range(1):
-            start_page = worker_id * self.settings_manager.get('max_pages', 1) + 1
-            end_page = min((worker_id + 1) * self.settings_manager.get('max_pages', 2), max_pages)
-            
-            if start_page <= end_page:
-                pages_in_this_worker = end_page - start_page + 1
-                self.total_pages_to_scrape += pages_in_this_worker
+        page_queue = asyncio.Queue()
+        for page_num in range(1, max_pages + 1):
+            if page_num not in self._completed_pages:
+                page_queue.put_nowait(page_num)
+
+        self.total_pages_to_scrape = max_pages
+        self._last_page_num = max_pages
+        for page_num in self._completed_pages:
+            if not self.products_per_page.get(page_num):
+                self._mark_last_page(page_num)
+        num_workers = max(1, min(num_workers, page_queue.qsize()))
+        print(f"📊 Total pages to scrape: {self.total_pages_to_scrape} with {num_workers} workers")
+
+        worker_tasks = []
+        for worker_id in range(num_workers):
+            task = asyncio.create_task(
+                self._worker_scrape(search_term, page_queue, worker_id)
+            )
+            task._shielded = True
+            worker_tasks.append(task)
+            self._active_tasks.append(task)
 
-                task = asyncio.create_task(
-                    self._worker_scrape(search_term, start_page, end_page, worker_id)
-                )
-                task._shielded = True
-                worker_tasks.append(task)
-                self._active_tasks.append(task)
-                print(f"📊 Total pages to scrape: {self.total_pages_to_scrape}")
         try:
             worker_results = await asyncio.gather(*worker_tasks, return_exceptions=True)
         
@@ -373,9 +618,15 @@ class AsyncPlaywrightBaseScraper(ABC):
                         task.cancel()
                 
             raise
+
+    def _mark_last_page(self, page_num: int):
+        """Stop handing out pages after one that had no products"""
+        if page_num < self._last_page_num:
+            logger.info(f"No products on page {page_num}, skipping later pages")
+            self._last_page_num = page_num
     
-    async def _worker_scrape(self, search_term: str, start_page: int, end_page: int, worker_id: int) -> List[Dict[str, Any]]:
-        """Single worker scraping a range of pages with stop support"""
+    async def _worker_scrape(self, search_term: str, page_queue: asyncio.Queue, worker_id: int) -> List[Dict[str, Any]]:
+        """Single worker taking page numbers from the queue until it is empty"""
         results = []
 
         if self._stop_requested:
@@ -383,21 +634,29 @@ class AsyncPlaywrightBaseScraper(ABC):
             return []
 
         self.cpu_manager.set_worker_affinity(worker_id)
-    
+
+        links_page = None
         try:
-            if not hasattr(self, 'context') or not self.context:
+            context = await self._get_worker_context(worker_id)
+            if not context:
                 logger.error(f"Worker {worker_id}: No context available")
                 return []
+
+            if not self._can_use_http_fetch():
+                links_page = await self._acquire_page(context)
         
-            context = self.context
-        
-            for page_num in range(start_page, end_page + 1):
+            while not page_queue.empty():
+                page_num = page_queue.get_nowait()
+
                 if self._stop_requested or self._stop_event.is_set():
                     logger.info(f"Worker {worker_id}: Stop requested at page {page_num}")
                     break
+
+                if page_num > self._last_page_num:
+                    continue
             
                 page_results = await asyncio.shield(self._scrape_single_page_async(
-                    context, search_term, page_num, worker_id
+                    context, search_term, page_num, worker_id, links_page
                 ))
 
                 if page_results:
@@ -413,14 +672,6 @@ class AsyncPlaywrightBaseScraper(ABC):
                     'page_num': page_num,
                     'scraper_name': self.__class__.__name__
                 })
-                if not self._stop_requested:
-                    try:
-                        await asyncio.wait_for(
-                            asyncio.sleep(self.settings_manager.get('delay_between_requests', 2) * random.uniform(0.8, 1.2)),
-                            timeout=5.0
-                        )
-                    except asyncio.TimeoutError:
-                        pass  
         
             return results
 
@@ -430,38 +681,90 @@ class AsyncPlaywrightBaseScraper(ABC):
         except Exception as e:
             logger.error(f"Worker {worker_id} failed: {e}")
             return results
+        finally:
+            if links_page:
+                await self._release_page(context, links_page)
 
-    async def _scrape_single_page_async(self, context, search_term: str, page_num: int, worker_id: int) -> List[Dict[str, Any]]:
+    async def _scrape_single_page_async(self, context, search_term: str, page_num: int, worker_id: int, links_page=None) -> List[Dict[str, Any]]:
         if self._stop_requested:
             return []
 
-        await self._rate_limit()
-
         page_url = self._construct_page_url(
             self._get_base_url(search_term),
             search_term,
+            page_num,
         )
 
         if not page_url:
             logger.warning(f"Worker {worker_id}: No URL for page {page_num}")
+            self._mark_last_page(page_num)
+            self._journal_page_done(page_num, 0)
             return []
 
         logger.info(f"Worker {worker_id}: Scraping page {page_num}: {page_url}")
 
-        links_page = None
+        owns_links_page = False
         try:
-            links_page = await context.new_page()
-            links_page.set_default_timeout(60000)
-            await links_page.goto(page_url, wait_until="domcontentloaded", timeout=30000)
+            fast_mode = self.scrape_mode == 'fast'
+            want_items = fast_mode or self._incremental_state is not None
+            listing_items = None
+            product_links = None
+            filtered_cards = [0]
+            filter_token = _listing_filtered_cards.set(filtered_cards)
+            try:
+                if self._can_use_http_fetch():
+                    listing_items, product_links = await self._extract_listing_http(page_url, want_items)
 
-            if self._stop_requested:
-                await links_page.close()
-                return []
+                if not listing_items and not product_links:
+                    if links_page is None:
+                        links_page = await self._acquire_page(context)
+                        owns_links_page = True
+                    if not await self._goto_page(links_page, page_url, self.listing_wait_until, 30000, worker_id):
+                        return []
+
+                    if self._stop_requested:
+                        return []
+
+                    await asyncio.sleep(random.uniform(1.5, 3.0))
+
+                    filtered_cards[0] = 0
+                    listing_items = None
+                    if want_items:
+                        listing_items = await self._extract_listing_items_async(links_page, page_url)
+                    if listing_items is None:
+                        product_links = await self._extract_product_links_async(links_page, page_url)
+                    await links_page.evaluate("window.scrollTo(0, Math.random() * 500)")
+                    await asyncio.sleep(random.uniform(0.5, 1.5))
+            finally:
+                _listing_filtered_cards.reset(filter_token)
+
+            # Cards on the page before any keyword/price filtering: only this decides the last page
+            if listing_items is not None:
+                cards_on_page = len({item['url'] for item in listing_items if item.get('url')})
+            else:
+                cards_on_page = len(product_links or [])
+            cards_on_page += filtered_cards[0]
+
+            listing_results = []
+            if listing_items is not None:
+                for item in listing_items:
+                    if item.get('url') and item.get('price'):
+                        self._listing_prices[item['url']] = item['price']
+                if fast_mode:
+                    listing_results, product_links = self._split_listing_items(listing_items, page_num)
+                else:
+                    product_links = list(dict.fromkeys(item['url'] for item in listing_items if item.get('url')))
+
+            products_on_page = len(listing_results) + len(product_links)
+
+            product_links = [url for url in product_links if url not in self._processed_urls]
+            self._processed_urls.update(product_links)
 
-            await asyncio.sleep(random.uniform(1.5, 3.0))
+            if self._incremental_state is not None:
+                reused_results, product_links = self._reuse_unchanged_products(product_links, page_num)
+                listing_results.extend(reused_results)
 
-            product_links = await self._extract_product_links_async(links_page, page_url)
-            products_on_page = len(product_links)
+            self._journal_queue_products(product_links, page_num)
 
             self.products_per_page[page_num] = products_on_page
 
@@ -474,16 +777,18 @@ class AsyncPlaywrightBaseScraper(ABC):
                 'page_products': products_on_page,
                 'scraper_name': self.__class__.__name__
             })
-            await links_page.evaluate("window.scrollTo(0, Math.random() * 500)")
-            await asyncio.sleep(random.uniform(0.5, 1.5))
-            await links_page.close()
-            
+
             if not product_links:
-                logger.warning(f"Worker {worker_id}: No products found on page {page_num}")
-                return []
+                if not cards_on_page:
+                    logger.warning(f"Worker {worker_id}: No products found on page {page_num}")
+                    self._mark_last_page(page_num)
+                elif not products_on_page:
+                    logger.info(f"Worker {worker_id}: All {cards_on_page} products on page {page_num} were filtered out")
+                self._journal_page_done(page_num, cards_on_page)
+                return listing_results
 
             logger.info(
-                f"Worker {worker_id}: Found {len(product_links)} products on page {page_num}"
+                f"Worker {worker_id}: Found {len(product_links)} products to open on page {page_num}"
             )
 
             semaphore = asyncio.Semaphore(self.max_concurrent_products)
@@ -493,21 +798,20 @@ class AsyncPlaywrightBaseScraper(ABC):
                     if self._stop_requested:
                         return None
 
-                    await asyncio.sleep(random.uniform(2.5, 5.0))
-                
-                    product_page = await context.new_page()
-                    product_page.set_default_timeout(60000)
+                    if self._can_use_http_fetch():
+                        result = await self._scrape_single_product_http(product_url, worker_id, page_num)
+                        if result is not None or self._stop_requested:
+                            return result or None
+
+                    product_page = await self._acquire_page(context)
                 
                     try:
                         result = await self._scrape_single_product_async(
-                            product_page, product_url, worker_id
+                            product_page, product_url, worker_id, page_num
                         )
                         return result
                     finally:
-                        try:
-                            await product_page.close()
-                        except:
-                            pass
+                        await self._release_page(context, product_page)
 
             tasks = [
                 scrape_with_delay(url)
@@ -524,15 +828,22 @@ class AsyncPlaywrightBaseScraper(ABC):
                 logger.warning(f"Worker {worker_id}: Page {page_num} timed out")
                 return []
 
-            valid_results = []
+            valid_results = listing_results
 
-            for result in product_results:
+            failed_urls = []
+            for product_url, result in zip(product_links, product_results):
                 if isinstance(result, Exception):
                     if not isinstance(result, asyncio.CancelledError):
                         logger.error(f"Product scraping error: {result}")
+                    failed_urls.append(product_url)
                 elif result:
                     valid_results.append(result)
+                else:
+                    # Still 'queued' only if it was neither registered nor filtered
+                    failed_urls.append(product_url)
 
+            self._journal_products_failed(failed_urls)
+            self._journal_page_done(page_num, cards_on_page)
             return valid_results
 
         except asyncio.CancelledError:
@@ -543,27 +854,43 @@ class AsyncPlaywrightBaseScraper(ABC):
             logger.error(f"Worker {worker_id}: Error scraping page {page_num}: {e}")
             return []
 
-    async def _scrape_single_product_async(self, page, product_url: str, worker_id: int):
+        finally:
+            if owns_links_page and links_page:
+                await self._release_page(context, links_page)
+
+    async def _get_worker_context(self, worker_id: int):
+        """The worker's pooled context slot, or the single context assigned to this scraper"""
+        if self.browser_pool:
+            try:
+                return await self.browser_pool.get_context(self.website_that_is_scraped, slot=worker_id)
+            except Exception as e:
+                logger.error(f"Worker {worker_id}: Could not get pooled context: {e}")
+        return getattr(self, 'context', None)
+
+    async def _acquire_page(self, context):
+        if self.browser_pool:
+            return await self.browser_pool.acquire_page(context)
+        page = await context.new_page()
+        page.set_default_timeout(60000)
+        return page
+
+    async def _release_page(self, context, page):
+        """Return a page to the pool (reset to about:blank) or close it when there is no pool"""
+        try:
+            if self.browser_pool:
+                await self.browser_pool.release_page(context, page)
+            else:
+                await page.close()
+        except Exception:
+            pass
+
+    async def _scrape_single_product_async(self, page, product_url: str, worker_id: int, page_num: Optional[int] = None):
         """Scrape a single product asynchronously with stop support and reduced page reloads."""
 
         if self._stop_requested:
             return None
 
-        await self._rate_limit()
-
-        for attempt in range(3):
-            if self._stop_requested:
-                return None
-
-            try:
-                await page.goto(product_url, wait_until='domcontentloaded', timeout=15000)
-                break  
-            except Exception as e:
-                if attempt == 2:
-                    logger.error(f"Worker {worker_id}: Failed to load {product_url}: {e}")
-                    return None
-                await asyncio.sleep(1 * (attempt + 1))
-        else:
+        if not await self._goto_page(page, product_url, self.product_wait_until, 15000, worker_id):
             return None
 
         if self._stop_requested:
@@ -571,37 +898,209 @@ class AsyncPlaywrightBaseScraper(ABC):
 
         try:
             product_data = await self._extract_product_data_async(page, product_url)
-            if self.update_gui_callback:
-                self.update_gui_callback({'type': 'product', 'data': product_data})
+            product_data = self._register_product(product_data, product_url, page_num)
+            self._remember_product(product_data, product_url)
+            return product_data
 
-            if self._stop_requested or not product_data:
-                return None
+        except asyncio.CancelledError:
+            logger.debug(f"Worker {worker_id}: Product scraping cancelled for {product_url}")
+            return None
+        except Exception as e:
+            logger.error(f"Worker {worker_id}: Error scraping {product_url}: {e}")
+            return None
 
-            product_data['url'] = product_url
-        
+    def _register_product(self, product_data, product_url: str, page_num: Optional[int] = None):
+        """Apply the price and keyword filters, then count a scraped product and report it to the GUI"""
+        if product_data and not self._passes_current_filters(product_data):
+            print(f"DEBUG: Product filtered out: {product_data.get('title', '')[:50]}")
+            self._journal_product_filtered(product_url, page_num)
+            return None
+
+        if self._stop_requested:
+            return None
+        if not product_data:
+            # An empty record is how the parsers report a product they filtered themselves
+            if product_data is not None:
+                self._journal_product_filtered(product_url, page_num)
+            return None
+
+        product_data['url'] = product_url
+        if page_num is not None:
+            product_data['page'] = page_num
+
+        self.products_collected += 1
+        self._journal_product_done(product_data, product_url, page_num)
+        if self.result_sink is not None:
+            self.result_sink.push(Product.from_dict(
+                product_data, source=self.website_that_is_scraped, currency=self.website_currency
+            ))
+        self._update_gui({"type": "product", 'data': product_data})
+
+        self._update_gui({
+            'type': 'product_progress',
+            'collected': self.products_collected,
+            'total_expected': self.total_expected_products,
+            'product_title': product_data.get('title', '')[:30],
+            'scraper_name': self.__class__.__name__
+        })
+        return product_data
+
+    def _reuse_unchanged_products(self, product_links: List[str], page_num: int):
+        """Incremental mode: reuse stored records for products that are not new, stale or repriced.
+        Returns (reused products, links that still need a product page)."""
+        state = self._incremental_state
+        reused = []
+        to_fetch = []
+
+        for url in product_links:
+            reason = state.refresh_reason(url, self._listing_prices.get(url))
+            record = state.cached_record(url) if reason is None else None
+            if record is None:
+                state.stats[reason or 'new'] += 1
+                to_fetch.append(url)
+                continue
+
+            state.stats['reused'] += 1
+            product_data = self._register_product(record, url, page_num)
             if product_data:
-                self.products_collected += 1
-                self._update_gui({"type": "product", 'data': product_data})
+                reused.append(product_data)
 
-                self._update_gui({
-                    'type': 'product_progress',
-                    'collected': self.products_collected,
-                    'total_expected': self.total_expected_products,
-                    'product_title': product_data.get('title', '')[:30],
-                    'scraper_name': self.__class__.__name__
-                })
-                return product_data
+        print(f"DEBUG: Incremental: reused {len(product_links) - len(to_fetch)} stored products, {len(to_fetch)} need a product page")
+        return reused, to_fetch
 
-            return None
+    def _passes_current_filters(self, product_data: Dict[str, Any]) -> bool:
+        """Price filter (compared in EUR) and keyword filter for a product in the site currency"""
+        if self._should_filter_by_keywords(product_data):
+            return False
+        eur_price = self._convert_prices_only(product_data.get('price'), self.website_currency, "EUR")
+        if eur_price is not None and self._should_filter_by_price({'price': eur_price}):
+            return False
+        return True
 
-        except asyncio.CancelledError:
-            logger.debug(f"Worker {worker_id}: Product scraping cancelled for {product_url}")
-            return None
+    def _remember_product(self, product_data, product_url: str):
+        if self._incremental_state is not None and product_data:
+            self._incremental_state.remember(product_url, product_data, self._listing_prices.get(product_url))
+
+    def _load_session_progress(self) -> List[Dict[str, Any]]:
+        """Resumed session: take the pages and products the interrupted run already finished from the journal"""
+        self._completed_pages = set()
+        if self.session_journal is None or self.session_id is None:
+            return []
+
+        progress = self.session_journal.site_progress(self.session_id, self.website_that_is_scraped)
+        self._completed_pages = set(progress['pages'])
+        self.products_per_page.update(progress['pages'])
+
+        records = [record for record in progress['records'] if record.get('url')]
+        self._processed_urls.update(record['url'] for record in records)
+        self._processed_urls.update(progress['filtered'])
+        if records or self._completed_pages or progress['reopened_pages']:
+            print(f"DEBUG: Resuming {self.website_that_is_scraped}: {len(self._completed_pages)} pages and "
+                  f"{len(records)} products already done, {progress['unfinished']} unfinished products "
+                  f"to retry on pages {sorted(progress['reopened_pages'])}")
+        return records
+
+    def _journal_queue_products(self, product_links: List[str], page_num: int):
+        if self.session_journal is not None and product_links:
+            self.session_journal.queue_products(self.session_id, self.website_that_is_scraped, product_links, page_num)
+
+    def _journal_product_done(self, product_data, product_url: str, page_num: Optional[int]):
+        if self.session_journal is not None:
+            self.session_journal.product_done(self.session_id, self.website_that_is_scraped, product_url, product_data, page_num)
+
+    def _journal_product_filtered(self, product_url: str, page_num: Optional[int]):
+        if self.session_journal is not None:
+            self.session_journal.product_filtered(self.session_id, self.website_that_is_scraped, product_url, page_num)
+
+    def _journal_products_failed(self, product_urls: List[str]):
+        """Products of a finished page that gave no result; resume reopens their page"""
+        if self.session_journal is not None and product_urls and not self._stop_requested:
+            self.session_journal.products_failed(self.session_id, self.website_that_is_scraped, product_urls)
+
+    def _journal_page_done(self, page_num: int, product_count: int):
+        """A page counts as done only when it finished without a stop request"""
+        if self.session_journal is not None and not self._stop_requested:
+            self.session_journal.page_done(self.session_id, self.website_that_is_scraped, page_num, product_count)
+
+    def _save_incremental_state(self):
+        if self._incremental_state is None:
+            return
+        self._incremental_state.save()
+        logger.info(f"Incremental scrape stats: {self._incremental_state.stats}")
+
+    def _split_listing_items(self, listing_items: List[Dict[str, Any]], page_num: int):
+        """Keep complete listing items as products and return the URLs that still need a product page"""
+        listing_results = []
+        deep_fetch_links = []
+
+        for item in listing_items:
+            url = item.get('url')
+            # Sponsored slots and shifting pagination repeat products on one page or across pages
+            if not url or url in deep_fetch_links or url in self._processed_urls:
+                continue
+
+            title = item.get('title') or ''
+            if title and self._should_filter_by_keywords({'title': title, 'description': ''}):
+                self._processed_urls.add(url)
+                continue
+
+            price = item.get('price')
+            if not title or not price:
+                deep_fetch_links.append(url)
+                continue
+
+            eur_price = self._convert_prices_only(price, self.website_currency, "EUR")
+            if eur_price is not None and self._should_filter_by_price({'price': eur_price}):
+                print(f"DEBUG: Listing item outside the price filter: {title}")
+                self._processed_urls.add(url)
+                continue
+
+            if self.fast_mode_fetch_specs:
+                deep_fetch_links.append(url)
+                continue
+
+            product_data = {
+                'title': title,
+                'price': price,
+                'url': url,
+                'currency': self.website_currency,
+                'source': self.website_that_is_scraped,
+                'source_currency': self.website_currency,
+            }
+            self._processed_urls.add(url)
+            product_data = self._register_product(product_data, url, page_num)
+            if product_data:
+                listing_results.append(product_data)
+
+        print(f"DEBUG: Listing gave {len(listing_results)} products, {len(deep_fetch_links)} need a product page")
+        return listing_results, deep_fetch_links
+
+    async def _extract_listing_items(self, page, page_url: str) -> Optional[List[Dict[str, Any]]]:
+        """Read partial products (title, price in site currency, url) from the loaded listing page; None if unsupported"""
+        return None
+
+    async def _extract_listing_items_async(self, page, page_url: str) -> Optional[List[Dict[str, Any]]]:
+        try:
+            return await self._extract_listing_items(page, page_url)
         except Exception as e:
-            logger.error(f"Worker {worker_id}: Error scraping {product_url}: {e}")
+            logger.error(f"Error extracting listing items from {page_url}: {e}")
             return None
 
-    
+    async def _read_listing_cards(self, page, card_selector: str, fields: Dict[str, tuple]) -> List[Dict[str, Any]]:
+        """Read several (selector, attribute) fields from every listing card in one round-trip.
+        An attribute of None reads innerText, 'textContent' reads hidden text."""
+        return await page.eval_on_selector_all(card_selector, """(cards, fields) => cards.map(card => {
+            const out = {};
+            for (const [name, [selector, attr]] of Object.entries(fields)) {
+                const el = selector ? card.querySelector(selector) : card;
+                if (!el) { out[name] = null; continue; }
+                if (!attr) out[name] = el.innerText.trim();
+                else if (attr === 'textContent') out[name] = el.textContent.trim();
+                else out[name] = el.getAttribute(attr);
+            }
+            return out;
+        })""", fields)
+
     async def _extract_product_links_async(self, page, page_url: str) -> List[str]:
         """Async version of product link extraction"""
         try:
@@ -647,46 +1146,28 @@ class AsyncPlaywrightBaseScraper(ABC):
             
         return False
 
+    @property
+    def exclude_keywords(self):
+        return self._exclude_keywords
+
+    @exclude_keywords.setter
+    def exclude_keywords(self, keywords):
+        """Every assignment (settings, update_settings, the container, subclasses) recompiles the filter"""
+        self._exclude_keywords = keywords
+        self._keyword_filter = KeywordFilter(keywords)
+
     def _should_filter_by_keywords(self, product_data):
         """Check if product should be filtered based on excluded keywords"""
-        if not self.exclude_keywords:
+        if not self._keyword_filter:
             return False
 
-        if isinstance(self.exclude_keywords, str):
-            excluded_words = [word.strip().lower() for word in self.exclude_keywords.split(',') if word.strip()]
-        else:
-            excluded_words = [word.lower() for word in self.exclude_keywords if word]
-    
-        title = product_data.get('title', '').lower()
-        description = product_data.get('description', '').lower()
-    
-        logger.debug(f"Filter check - Title: '{title}'")
-        logger.debug(f"Filter check - Excluded: {excluded_words}")
-    
-        def super_normalize(text):
-            text = re.sub(r'[®™©]', '', text)  
-            text = text.replace('-', ' ')       
-            text = re.sub(r'\s+', ' ', text)   
-            text = text.replace('core', '').replace('intel', '').strip()  
-            return text
-    
-        normalized_title = super_normalize(title)
-        normalized_description = super_normalize(description)
-    
-        logger.debug(f"Filter check - Normalized title: '{normalized_title}'")
-    
-        for excluded_word in excluded_words:
-            normalized_excluded = super_normalize(excluded_word)
-        
-            if (normalized_excluded in normalized_title or 
-                normalized_excluded in normalized_description):
-                logger.debug(f"FILTERED - Excluded: '{excluded_word}', Title: '{title}'")
-                return True
-        
-            if (excluded_word in title or excluded_word in description):
-                logger.debug(f"FILTERED - Excluded: '{excluded_word}', Title: '{title}'")
-                return True
-    
+        excluded_word = self._keyword_filter.match(product_data.get('title') or '', product_data.get('description') or '')
+        if excluded_word:
+            logger.debug(f"FILTERED - Excluded: '{excluded_word}', Title: '{product_data.get('title')}'")
+            filtered_cards = _listing_filtered_cards.get()
+            if filtered_cards is not None:
+                filtered_cards[0] += 1
+            return True
         return False
     
     @abstractmethod
@@ -695,16 +1176,25 @@ class AsyncPlaywrightBaseScraper(ABC):
         pass
 
     @abstractmethod
-    def _construct_page_url(self, base_url, search_term):
-        """Construct the URL for a specific page number"""
+    def _construct_page_url(self, base_url, search_term, page_num):
+        """Construct the URL for a specific page number without touching scraper state"""
         pass
 
     @abstractmethod
     async def _extract_product_links(self, page, page_url):
-        """Extract product links from search page using Playwright"""
+        """Extract product links from the search page the base class already loaded"""
         pass
     
     @abstractmethod
     async def _extract_product_data(self, page, product_url):
-        """Subclasses must implement this - extract raw product data without filtering"""
-        pass
\ No newline at end of file
+        """Subclasses must implement this - extract raw product data from the already loaded page, without
+        navigating or filtering. Scrapers with a product_schema delegate to _extract_product_data_from_schema."""
+        pass
+
+    async def _extract_product_data_from_schema(self, page, product_url):
+        """_extract_product_data for scrapers that declare a product_schema"""
+        if self.product_schema.get('ready'):
+            await page.wait_for_selector(self.product_schema['ready'], timeout=15000)
+
+        # {} (filtered by the schema parser) is passed on as is so _register_product journals it as filtered
+        return self._build_product_from_schema(await self._read_schema_from_page(page), product_url)
\ No newline at end of file
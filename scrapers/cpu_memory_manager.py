@@ -24,6 +24,9 @@ class CPUMemoryManagerClass:
     def get_optimal_worker_count(self) -> int:
         """Calculate optimal number of workers based on system resources"""
         cpu_info = self.cpu_info
+        # Non-blocking refresh: usage since the previous call, so a shared manager never goes stale
+        cpu_info['cpu_usage'] = psutil.cpu_percent(interval=None, percpu=True) or cpu_info['cpu_usage']
+        cpu_info['memory'] = psutil.virtual_memory()
         
         available_cores = max(1, cpu_info['logical_cores'] - 1)
         
@@ -9,16 +9,15 @@ class CyberTradeScraper(AsyncPlaywrightBaseScraper):
         self.base_url = "https://cybertrade.bg/"
         self.website_that_is_scraped = "CyberTrade.bg"
         self.update_gui_callback = update_gui_callback
-        self.current_page = 1
 
     def _get_base_url(self, search_term):
         """Generate clean search URL without restrictive parameters"""
         encoded_term = quote(search_term)
         return f"{self.base_url}product/search?search={encoded_term}"
 
-    def _construct_page_url(self, base_url, search_term):
-        if self.current_page > 1:
-            return f"{self.base_url}product/search?search={quote(search_term)}&page={self.current_page}"
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num > 1:
+            return f"{self.base_url}product/search?search={quote(search_term)}&page={page_num}"
         return base_url
 
     async def _extract_product_links(self, page, page_url):
@@ -27,8 +26,6 @@ class CyberTradeScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-            
             await page.wait_for_selector('div.row div.product-list', timeout=10000)
 
             product_elements = await page.query_selector_all('div.row div.product-list')
@@ -130,8 +127,6 @@ class CyberTradeScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Parsing CyberTrade product: {product_url}")
     
         try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-        
             await page.wait_for_selector('div#product h1.product-title', timeout=10000)
 
             title_element = await page.query_selector('div#product h1.product-title')
@@ -144,7 +139,6 @@ class CyberTradeScraper(AsyncPlaywrightBaseScraper):
         
             price = await self._extract_price_from_page(page)
             
-            price = self.convert_where_necessary(price)
             product_data = {
                 'title': title,
                 'price': price,
@@ -152,7 +146,6 @@ class CyberTradeScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': 'Allstore.bg',  
                 'source_currency': self.website_currency,
-                'page': self.current_page
             }
 
             print(f"DEBUG: Extracted CyberTrade product: {title} - {price} лв.")
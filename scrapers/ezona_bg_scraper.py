@@ -8,14 +8,15 @@ class EZonaScraper(AsyncPlaywrightBaseScraper):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://ezona.net/"
         self.website_that_is_scraped = "EZona.net"
-        self.current_page = 1
         self.update_gui_callback = update_gui_callback
 
     def _get_base_url(self, search_term):
         encoded_term = quote(search_term)
         return f"{self.base_url}products/search?s={encoded_term}"
 
-    def _construct_page_url(self, base_url, search_term):
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num > 1:
+            return None
         return base_url
 
     async def _extract_product_links(self, page, page_url):
@@ -23,8 +24,6 @@ class EZonaScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-            
             await page.wait_for_selector('div.cards div.product', timeout=10000)
 
             product_elements = await page.query_selector_all('div.cards div.product')
@@ -110,8 +109,6 @@ class EZonaScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Parsing EZona product: {product_url}")
     
         try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-        
             await page.wait_for_selector('div.product-brand h1', timeout=10000)
 
             title_element = await page.query_selector('div.product-brand h1')
@@ -129,7 +126,6 @@ class EZonaScraper(AsyncPlaywrightBaseScraper):
                 price_text = price_text.strip()
                 price = await self._extract_ezona_bg_price(price_text)
             
-            price = self.convert_where_necessary(price)
             product_data = {    
                 'title': title,
                 'price': price,
@@ -137,7 +133,6 @@ class EZonaScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': 'EZona.net',
                 'source_currency': self.website_currency,
-                'page': self.current_page
             }
 
             print(f"DEBUG: Extracted EZona product: {title} - {price}")
@@ -7,16 +7,15 @@ class GtComputersScraper(AsyncPlaywrightBaseScraper):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://gtcomputers.bg/"
         self.website_that_is_scraped = "GtComputers.bg"
-        self.current_page = 1
         self.update_gui_callback = update_gui_callback
 
     def _get_base_url(self, search_term):
         encoded_term = quote(search_term)
         return f"{self.base_url}search_tags/?s={encoded_term}"
 
-    def _construct_page_url(self, base_url, search_term):
-        if self.current_page >= 1:
-            return f"{self.base_url}search_tags/?s={quote(search_term)}&pg={self.current_page}"
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num >= 1:
+            return f"{self.base_url}search_tags/?s={quote(search_term)}&pg={page_num}"
         return base_url
 
     async def _extract_product_links(self, page, page_url):
@@ -24,8 +23,6 @@ class GtComputersScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-            
             await page.wait_for_selector('div.pt-1', timeout=10000)
 
             product_elements = await page.query_selector_all('div.pt-1')
@@ -85,8 +82,6 @@ class GtComputersScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Parsing GtComputers product: {product_url}")
     
         try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-            
             await page.wait_for_selector('div.sttop-mt1 h1.tit1', timeout=10000)
 
             title_element = await page.query_selector('div.sttop-mt1 h1.tit1')
@@ -106,7 +101,6 @@ class GtComputersScraper(AsyncPlaywrightBaseScraper):
             
                 price = await self._extract_gt_computers_price(bgn_part)
 
-            price = self.convert_where_necessary(price)
             product_data = {
                 'title': title,
                 'price': price,
@@ -114,7 +108,6 @@ class GtComputersScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': 'GtComputers.bg',
                 'source_currency': self.website_currency,
-                'page': self.current_page
             }
 
             print(f"DEBUG: Extracted GtComputers product: {title} - {price}")
@@ -6,7 +6,6 @@ class HitsBGScraper(AsyncPlaywrightBaseScraper):
     def __init__(self, website_currency, update_gui_callback=None):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://hits.bg/"
-        self.current_page = 1
         self.website_that_is_scraped = "Hits.bg"
         self.update_gui_callback = update_gui_callback
 
@@ -14,9 +13,9 @@ class HitsBGScraper(AsyncPlaywrightBaseScraper):
         encoded_term = quote(search_term)
         return f"{self.base_url}bg/search?search_text={encoded_term}"
 
-    def _construct_page_url(self, base_url, search_term):
-        if self.current_page > 1:
-            return f"{self.base_url}bg/search?search_text={quote(search_term)}&page={self.current_page}"
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num > 1:
+            return f"{self.base_url}bg/search?search_text={quote(search_term)}&page={page_num}"
         return base_url
 
     async def _extract_product_links(self, page, page_url):
@@ -24,8 +23,6 @@ class HitsBGScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-            
             await page.wait_for_selector('div.catalog-grid div.grid-item', timeout=10000)
 
             product_elements = await page.query_selector_all('div.catalog-grid div.grid-item')
@@ -70,8 +67,6 @@ class HitsBGScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Parsing HitsBG product: {product_url}")
     
         try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-        
             await page.wait_for_selector('span.product-status-text', timeout=10000)
             
             product_status = await page.query_selector('div.product-status')
@@ -107,7 +102,6 @@ class HitsBGScraper(AsyncPlaywrightBaseScraper):
             else:
                 print("DEBUG: Not enough price elements found")
 
-            price = self.convert_where_necessary(price)
             product_data = {
                 'title': title,
                 'price': price,
@@ -115,7 +109,6 @@ class HitsBGScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': 'Hits.bg',
                 'source_currency': self.website_currency,
-                'page': self.current_page
             }
 
             print(f"DEBUG: Extracted HitsBG product: {title} - {price}")
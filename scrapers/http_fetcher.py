@@ -0,0 +1,197 @@
+import asyncio
+import logging
+import random
+from typing import Optional
+
+from scrapers.rate_limiter import looks_like_captcha
+
+try:
+    from curl_cffi.requests import AsyncSession as CurlAsyncSession
+except ImportError:
+    CurlAsyncSession = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncHttpFetcher:
+    """Pooled HTTP client for store pages that are fully server-rendered"""
+
+    def __init__(self, user_agents=None, max_connections=20, max_per_host=4, timeout=20, page_cache=None):
+        self.user_agents = user_agents or [
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        ]
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.page_cache = page_cache
+        self.rate_limiter = None
+
+        self._session = None
+        self._backend = None
+        self._session_lock = asyncio.Lock()
+
+        self.requests_made = 0
+        self.requests_failed = 0
+
+    @staticmethod
+    def is_available():
+        """True when at least one HTTP client and the HTML parser are installed"""
+        return BeautifulSoup is not None and (CurlAsyncSession is not None or aiohttp is not None)
+
+    def _default_headers(self):
+        return {
+            'User-Agent': random.choice(self.user_agents),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'bg-BG,bg;q=0.9,en;q=0.8',
+        }
+
+    async def _get_session(self):
+        """Create the shared session on first use"""
+        if self._session is not None:
+            return self._session
+
+        async with self._session_lock:
+            if self._session is not None:
+                return self._session
+
+            if CurlAsyncSession is not None:
+                self._session = CurlAsyncSession(
+                    impersonate="chrome",
+                    timeout=self.timeout,
+                    max_clients=self.max_connections,
+                )
+                self._backend = 'curl_cffi'
+            elif aiohttp is not None:
+                connector = aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.max_per_host,
+                    ttl_dns_cache=300,
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                )
+                self._backend = 'aiohttp'
+            else:
+                raise RuntimeError("No async HTTP client installed (curl_cffi or aiohttp)")
+
+            logger.info(f"HTTP fetcher using {self._backend} backend")
+            return self._session
+
+    async def fetch(self, url: str, headers: Optional[dict] = None):
+        """Fetch a URL and return (status, headers, text) or None on network failure"""
+        request_headers = self._default_headers()
+        if headers:
+            request_headers.update(headers)
+
+        try:
+            session = await self._get_session()
+            self.requests_made += 1
+
+            if self._backend == 'curl_cffi':
+                response = await session.get(url, headers=request_headers, allow_redirects=True)
+                return response.status_code, dict(response.headers), response.text
+
+            async with session.get(url, headers=request_headers, allow_redirects=True) as response:
+                text = await response.text(errors='replace')
+                return response.status, dict(response.headers), text
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.requests_failed += 1
+            print(f"DEBUG: HTTP fetch failed for {url}: {e}")
+            return None
+
+    async def fetch_text(self, url: str, listing: bool = False) -> Optional[str]:
+        """Fetch a page body, returning None for anything but a 200 response.
+        Fresh cache hits skip the network and the rate limiter entirely;
+        stale entries are revalidated with ETag/Last-Modified.
+        Listing pages use the cache's listing TTL, and bypass it when that is 0."""
+        page_cache = self.page_cache
+        if listing and page_cache and not page_cache.listing_ttl:
+            page_cache = None
+
+        cached = None
+        if page_cache:
+            cached = await asyncio.to_thread(page_cache.lookup, url, page_cache.listing_ttl if listing else None)
+            if cached and cached[1]:
+                return cached[0]
+
+        headers = {}
+        if cached:
+            validators = cached[2]
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+
+        if self.rate_limiter:
+            await self.rate_limiter.acquire(url)
+
+        response = await self.fetch(url, headers)
+        if response is None:
+            if cached:
+                print(f"DEBUG: Network failed, serving stale cached copy of {url}")
+                return cached[0]
+            return None
+
+        status, response_headers, text = response
+        captcha = status == 200 and looks_like_captcha(text)
+        if self.rate_limiter:
+            retry_after = next((v for k, v in response_headers.items() if k.lower() == 'retry-after'), None)
+            self.rate_limiter.report(url, status, captcha=captcha, retry_after=retry_after)
+        if captcha:
+            print(f"DEBUG: CAPTCHA page returned for {url}")
+            return None
+
+        if status == 304 and cached:
+            await asyncio.to_thread(page_cache.mark_revalidated, url)
+            return cached[0]
+
+        if status != 200:
+            print(f"DEBUG: HTTP fetch got status {status} for {url}")
+            return None
+
+        if page_cache:
+            try:
+                await asyncio.to_thread(page_cache.store, url, text, response_headers)
+            except Exception as e:
+                logger.error(f"Could not cache {url}: {e}")
+        return text
+
+    @staticmethod
+    def make_soup(html: str):
+        return BeautifulSoup(html, HTML_PARSER)
+
+    async def close(self):
+        """Close the pooled session and the page cache"""
+        if self.page_cache:
+            self.page_cache.close()
+            self.page_cache = None
+
+        if self._session is None:
+            return
+        try:
+            await self._session.close()
+        except Exception as e:
+            logger.error(f"Error closing HTTP session: {e}")
+        finally:
+            self._session = None
+            self._backend = None
@@ -0,0 +1,100 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Fields that change between runs without the product itself changing
+VOLATILE_FIELDS = ('url', 'page', 'price', 'currency', 'source_currency')
+
+
+def spec_hash(product_data: Dict[str, Any]) -> str:
+    """Stable hash of everything in a product record except price and run-specific fields"""
+    stable = {k: v for k, v in product_data.items() if k not in VOLATILE_FIELDS}
+    encoded = json.dumps(stable, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+
+
+class IncrementalState:
+    """Per site and search term memory of product URLs: last listing price, spec hash and record"""
+
+    def __init__(self, website_name, search_term, state_dir="./scrape-history/state", max_age_hours=72):
+        self.website_name = website_name
+        self.search_term = search_term
+        self.max_age_seconds = float(max_age_hours) * 3600
+
+        slug = re.sub(r'[^\w\-]+', '_', search_term.strip().lower()) or 'default'
+        self.path = os.path.join(state_dir, website_name, f"{slug}.json")
+
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.stats = {'reused': 0, 'new': 0, 'price_changed': 0, 'no_listing_price': 0, 'stale': 0, 'specs_changed': 0}
+
+    @classmethod
+    def load(cls, website_name, search_term, **kwargs):
+        state = cls(website_name, search_term, **kwargs)
+        try:
+            with open(state.path, 'r', encoding='utf-8') as f:
+                state.entries = json.load(f).get('products', {})
+            print(f"DEBUG: Loaded incremental state for {website_name} '{search_term}': {len(state.entries)} products")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not read incremental state {state.path}: {e}")
+        return state
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'website': self.website_name,
+                    'search_term': self.search_term,
+                    'saved_at': time.time(),
+                    'products': self.entries,
+                }, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error(f"Could not save incremental state {self.path}: {e}")
+
+    def refresh_reason(self, url: str, listing_price=None) -> Optional[str]:
+        """Why the product page has to be loaded again ('new', 'no_listing_price', 'price_changed', 'stale'),
+        or None to reuse the record. Without a listing price now and then a price change cannot be ruled out."""
+        entry = self.entries.get(url)
+        if not entry or not entry.get('record'):
+            return 'new'
+
+        last_price = entry.get('listing_price')
+        if listing_price is None or last_price is None:
+            return 'no_listing_price'
+        try:
+            if abs(float(listing_price) - float(last_price)) > 0.005:
+                return 'price_changed'
+        except (TypeError, ValueError):
+            return 'price_changed'
+
+        if time.time() - entry.get('fetched_at', 0) > self.max_age_seconds:
+            return 'stale'
+        return None
+
+    def cached_record(self, url: str) -> Optional[Dict[str, Any]]:
+        entry = self.entries.get(url)
+        return dict(entry['record']) if entry and entry.get('record') else None
+
+    def remember(self, url: str, product_data: Dict[str, Any], listing_price=None):
+        """Store a freshly scraped product"""
+        entry = self.entries.get(url, {})
+        new_hash = spec_hash(product_data)
+        if entry.get('spec_hash') and entry['spec_hash'] != new_hash:
+            self.stats['specs_changed'] += 1
+
+        self.entries[url] = {
+            'listing_price': listing_price if listing_price is not None else entry.get('listing_price'),
+            'spec_hash': new_hash,
+            'fetched_at': time.time(),
+            'record': product_data,
+        }
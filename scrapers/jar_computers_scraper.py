@@ -7,16 +7,15 @@ class JarComputersScraper(AsyncPlaywrightBaseScraper):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://www.jarcomputers.com/"
         self.website_that_is_scraped = "JarComputers.com"
-        self.current_page = 1
         self.update_gui_callback = update_gui_callback
 
     def _get_base_url(self, search_term):
         encoded_term = quote(search_term)
         return f"{self.base_url}search?q={encoded_term}"
 
-    def _construct_page_url(self, base_url, search_term):
-        if self.current_page > 1:
-            return f"{self.base_url}search?q={quote(search_term)}&ref=&page={self.current_page}"
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num > 1:
+            return f"{self.base_url}search?q={quote(search_term)}&ref=&page={page_num}"
         return base_url
 
     async def _extract_product_links(self, page, page_url):
@@ -24,8 +23,6 @@ class JarComputersScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-
             await page.wait_for_selector('ol#product_list', timeout=10000)
             
             product_elements = await page.query_selector_all('ol#product_list li[class*="sProduct"]')
@@ -126,8 +123,6 @@ class JarComputersScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Parsing JarComputers product: {product_url}")
         
         try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-            
             await page.wait_for_selector('div#product_name', timeout=10000)
             
             title_element = await page.query_selector('div#product_name h1')
@@ -145,7 +140,6 @@ class JarComputersScraper(AsyncPlaywrightBaseScraper):
                 price_text = price_text.strip()
                 price = await self._extract_jar_computers_price(price_text)
             
-            price = self.convert_where_necessary(price)
             product_data = {
                 'title': title,
                 'price': price,
@@ -153,7 +147,6 @@ class JarComputersScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': 'JarComputers.com',
                 'source_currency': self.website_currency,
-                'page': self.current_page
             }
 
             print(f"DEBUG: Extracted JarComputers product: {title} - {price}")
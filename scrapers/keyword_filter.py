@@ -0,0 +1,60 @@
+import re
+from functools import lru_cache
+
+TRADEMARKS = re.compile(r'[®™©]')
+WHITESPACE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=8192)
+def normalize_keyword_text(text):
+    """Lowercased text with ®™© dropped, hyphens as spaces and the 'core'/'intel' noise removed.
+    Cached because the same titles come back on every listing page and every re-scrape."""
+    text = TRADEMARKS.sub('', text.lower())
+    text = WHITESPACE.sub(' ', text.replace('-', ' '))
+    return text.replace('core', '').replace('intel', '').strip()
+
+
+def _alternation(words):
+    # Longest first so the reported keyword is the most specific one
+    return re.compile('|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True)))
+
+
+class KeywordFilter:
+    """Exclusion keywords compiled once into two combined patterns: one over the raw lowercased
+    text and one over the normalized text, so each title is scanned once whatever the list length"""
+
+    def __init__(self, keywords):
+        if isinstance(keywords, str):
+            words = [word.strip().lower() for word in keywords.split(',') if word.strip()]
+        else:
+            words = [str(word).strip().lower() for word in keywords or [] if word and str(word).strip()]
+        self.keywords = list(dict.fromkeys(words))
+
+        # Keywords that normalize to nothing ('intel') would match every title, so they only match raw
+        self._by_normalized = {}
+        for word in self.keywords:
+            normalized = normalize_keyword_text(word)
+            if normalized:
+                self._by_normalized.setdefault(normalized, word)
+
+        self._raw_pattern = _alternation(self.keywords) if self.keywords else None
+        self._normalized_pattern = _alternation(self._by_normalized) if self._by_normalized else None
+
+    def __bool__(self):
+        return bool(self.keywords)
+
+    def match(self, *texts):
+        """The excluded keyword found in any of the texts, or None"""
+        for text in texts:
+            if not text:
+                continue
+            lowered = text.lower()
+            if self._raw_pattern is not None:
+                found = self._raw_pattern.search(lowered)
+                if found:
+                    return found.group()
+            if self._normalized_pattern is not None:
+                found = self._normalized_pattern.search(normalize_keyword_text(text))
+                if found:
+                    return self._by_normalized[found.group()]
+        return None
@@ -3,19 +3,29 @@ from urllib.parse import quote, urljoin
 from .base_scraper import AsyncPlaywrightBaseScraper
 
 class OptimalComputersScraper(AsyncPlaywrightBaseScraper):
+    supports_http_fetch = True
+    product_schema = {
+        'ready': 'div.page-header h1',
+        'title': 'div.page-header h1',
+        'price': 'span.product-price',
+        'spec_rows': 'ul.product-characteristics li',
+        'spec_label': 'div.element--color-light',
+        'spec_value': None,
+        'value_strip': ':',
+    }
+
     def __init__(self, website_currency, update_gui_callback=None):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://optimal-computers.bg/"
         self.website_that_is_scraped = "Optimal-Computers.bg"
-        self.current_page = 1
         self.update_gui_callback = update_gui_callback
 
     def _get_base_url(self, search_term):
         encoded_term = quote(search_term)
         return f"{self.base_url}products/search?s={encoded_term}"
 
-    def _construct_page_url(self, base_url, search_term):
-        if self.current_page == 1:
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num == 1:
             return base_url
         else:
             print(f"DEBUG: Optimal Computers - no pagination, stopping at page 1")
@@ -26,8 +36,6 @@ class OptimalComputersScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-            
             await page.wait_for_selector('div.page--search-result', timeout=10000)
 
             product_elements = await page.query_selector_all('div.cards--products div.card-content')
@@ -68,7 +76,38 @@ class OptimalComputersScraper(AsyncPlaywrightBaseScraper):
             print(f"DEBUG: Error extracting product links from Optimal Computers: {e}")
             return []
 
-    async def _extract_optimal_computers_price(self, price_text):
+    def _parse_product_links_html(self, soup, page_url):
+        """Get product links from the static search page HTML"""
+        if soup.select_one('div.page--search-result') is None:
+            return None
+
+        product_links = []
+        for product in soup.select('div.cards--products div.card-content'):
+            if 'Sponsored' in product.get_text(" ", strip=True):
+                continue
+
+            title_element = product.select_one('a.link--inherit')
+            title = title_element.get_text(" ", strip=True) if title_element else ""
+            if self._should_filter_by_keywords({'title': title, 'description': ''}):
+                print(f'Skipped product because it was in the exclusion keywords: {self.exclude_keywords}')
+                continue
+
+            if title_element and title_element.get('href'):
+                full_url = urljoin(self.base_url, title_element['href'])
+                clean_url = full_url.split('ref=')[0].split('?')[0]
+                if clean_url not in product_links:
+                    product_links.append(clean_url)
+
+        print(f"DEBUG: Total Optimal Computers product links found over HTTP: {len(product_links)}")
+        return product_links
+
+    def _parse_price_text(self, price_text):
+        return self._extract_optimal_computers_price(price_text) if price_text else 0.0
+
+    async def _extract_product_data(self, page, product_url):
+        return await self._extract_product_data_from_schema(page, product_url)
+
+    def _extract_optimal_computers_price(self, price_text):
         try:
             print(f"DEBUG: Processing price text: '{price_text}'")
         
@@ -144,70 +183,3 @@ class OptimalComputersScraper(AsyncPlaywrightBaseScraper):
             print(f"DEBUG: Could not convert price: '{price_text}'")
             return 0.0
 
-    async def _extract_product_data(self, page, product_url):
-        print(f"DEBUG: Parsing Optimal Computers product: {product_url}")
-    
-        try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-        
-            await page.wait_for_selector('div.page-header h1', timeout=10000)
-
-            title_element = await page.query_selector('div.page-header h1')
-            title = ""
-            if title_element:
-                title_text = await title_element.inner_text()
-                title = title_text.strip()
-            else:
-                title = "N/A"
-        
-            price_element = await page.query_selector('span.product-price')
-            price = 0.0
-            if price_element:
-                price_text = await price_element.inner_text()
-                price_text = price_text.strip()
-                price = await self._extract_optimal_computers_price(price_text)
-
-            price = self.convert_where_necessary(price)
-            product_data = {
-                'title': title,
-                'price': price,
-                'url': product_url,
-                'currency': self.website_currency,
-                'source': 'Optimal-Computers.bg',
-                'source_currency': self.website_currency,
-                'page': self.current_page 
-            }
-
-            print(f"DEBUG: Extracted Optimal Computers product: {title} - {price}")
-
-            tech_table = await page.query_selector('ul.product-characteristics')
-            if tech_table:
-                list_items = await tech_table.query_selector_all('li')
-                for item in list_items:
-                    try:
-                        label_element = await item.query_selector('div.element--color-light')
-                        if label_element:
-                            label_text = await label_element.inner_text()
-                            label_text = label_text.strip()
-                            
-                            full_text = await item.inner_text()
-                            full_text = full_text.strip()
-                            
-                            value_text = full_text.replace(label_text, '').strip()
-                            value_text = value_text.lstrip(':').strip()
-                            
-                            if label_text and value_text:
-                                product_data[label_text] = value_text
-                                print(f"DEBUG: Added Optimal Computers spec: {label_text} = {value_text}")
-                        else:
-                            print(f"DEBUG: No label found in list item")
-                        
-                    except Exception as e:
-                        print(f"DEBUG: Skipping invalid property: {str(e)}")
-                        continue
-
-            return product_data
-
-        except Exception as e:
-            print(f"DEBUG: Error parsing Optimal Computers product page: {e}")
-            return None
\ No newline at end of file
@@ -0,0 +1,236 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# last_access updates are kept in memory and written with the next store, or after this many lookups
+ACCESS_FLUSH_EVERY = 200
+
+
+class PageCache:
+    """On-disk page cache: SQLite index keyed by URL, zlib-compressed bodies stored by content hash"""
+
+    def __init__(self, cache_dir="./cache/http", max_size_mb=512, default_ttl=6 * 3600, site_ttls=None,
+                 listing_ttl=0):
+        self.cache_dir = cache_dir
+        self.bodies_dir = os.path.join(cache_dir, "bodies")
+        os.makedirs(self.bodies_dir, exist_ok=True)
+
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.default_ttl = default_ttl
+        self.site_ttls = site_ttls or {}
+        # Search/listing pages carry the prices incremental mode compares, so by default they are never cached
+        self.listing_ttl = listing_ttl
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(cache_dir, "index.sqlite"), check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                host TEXT,
+                body_hash TEXT,
+                size INTEGER,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL,
+                last_access REAL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_pages_last_access ON pages(last_access)")
+        self._db.commit()
+        # Bytes of body files on disk: URLs sharing a body count it once
+        self._total_size = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT MAX(size) AS size FROM pages GROUP BY body_hash)"
+        ).fetchone()[0]
+        self._pending_access = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.revalidated = 0
+
+    @classmethod
+    def from_settings(cls, settings_manager):
+        """Build the cache from the page_cache setting, or None when caching is off"""
+        if settings_manager.get('no_cache', False):
+            return None
+
+        config = settings_manager.get('page_cache', {}) or {}
+        if not config.get('enabled', True):
+            return None
+
+        try:
+            return cls(
+                cache_dir=config.get('cache_dir', "./cache/http"),
+                max_size_mb=config.get('max_size_mb', 512),
+                default_ttl=config.get('default_ttl_seconds', 6 * 3600),
+                site_ttls=config.get('site_ttl_seconds', {}),
+                listing_ttl=config.get('listing_ttl_seconds', 0),
+            )
+        except Exception as e:
+            logger.error(f"Could not open page cache: {e}")
+            return None
+
+    def _ttl_for(self, host):
+        host = host or ""
+        bare_host = host[4:] if host.startswith("www.") else host
+        return self.site_ttls.get(host, self.site_ttls.get(bare_host, self.default_ttl))
+
+    def _body_path(self, body_hash):
+        return os.path.join(self.bodies_dir, body_hash[:2], body_hash + ".z")
+
+    def _read_body(self, body_hash):
+        try:
+            with open(self._body_path(body_hash), "rb") as f:
+                return zlib.decompress(f.read()).decode("utf-8")
+        except (OSError, zlib.error) as e:
+            logger.debug(f"Cached body {body_hash} unreadable: {e}")
+            return None
+
+    def _flush_access(self):
+        """Write the deferred last_access times; the caller holds the lock and commits"""
+        if self._pending_access:
+            self._db.executemany(
+                "UPDATE pages SET last_access = ? WHERE url = ?",
+                [(accessed, url) for url, accessed in self._pending_access.items()]
+            )
+            self._pending_access.clear()
+
+    def _forget_body(self, body_hash, size):
+        """Delete a body file no row uses any more and take it off the running total"""
+        if self._db.execute("SELECT 1 FROM pages WHERE body_hash = ? LIMIT 1", (body_hash,)).fetchone():
+            return
+        try:
+            os.remove(self._body_path(body_hash))
+        except OSError:
+            pass
+        self._total_size -= size or 0
+
+    def lookup(self, url, ttl=None):
+        """Return (body, is_fresh, validators) for a cached URL, or None; ttl overrides the site TTL"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT host, body_hash, size, etag, last_modified, fetched_at FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            host, body_hash, size, etag, last_modified, fetched_at = row
+            body = self._read_body(body_hash)
+            if body is None:
+                # Every URL sharing the unreadable body goes with it
+                self._db.execute("DELETE FROM pages WHERE body_hash = ?", (body_hash,))
+                self._forget_body(body_hash, size)
+                self._db.commit()
+                self.misses += 1
+                return None
+
+            self._pending_access[url] = time.time()
+            if len(self._pending_access) >= ACCESS_FLUSH_EVERY:
+                self._flush_access()
+                self._db.commit()
+
+        is_fresh = time.time() - fetched_at < (self._ttl_for(host) if ttl is None else ttl)
+        if is_fresh:
+            self.hits += 1
+        else:
+            self.stale += 1
+        return body, is_fresh, {'etag': etag, 'last_modified': last_modified}
+
+    def store(self, url, body, headers=None):
+        """Save a fetched body with its validators"""
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        data = body.encode("utf-8")
+        body_hash = hashlib.sha256(data).hexdigest()
+        path = self._body_path(body_hash)
+
+        with self._lock:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(zlib.compress(data, 6))
+                os.replace(tmp_path, path)
+
+            previous = self._db.execute("SELECT body_hash, size FROM pages WHERE url = ?", (url,)).fetchone()
+            size = os.path.getsize(path)
+            # A body another URL already points at is on disk and counted once
+            if not self._db.execute("SELECT 1 FROM pages WHERE body_hash = ? LIMIT 1", (body_hash,)).fetchone():
+                self._total_size += size
+
+            now = time.time()
+            self._pending_access.pop(url, None)
+            self._flush_access()
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages (url, host, body_hash, size, etag, last_modified, fetched_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, urlparse(url).hostname, body_hash, size,
+                 headers.get('etag'), headers.get('last-modified'), now, now)
+            )
+            if previous and previous[0] != body_hash:
+                self._forget_body(*previous)
+            self._db.commit()
+            self._evict_if_needed()
+
+    def mark_revalidated(self, url):
+        """A 304 answer: the cached body is good for another TTL"""
+        with self._lock:
+            now = time.time()
+            self._pending_access.pop(url, None)
+            self._db.execute("UPDATE pages SET fetched_at = ?, last_access = ? WHERE url = ?", (now, now, url))
+            self._db.commit()
+        self.revalidated += 1
+
+    def _evict_if_needed(self):
+        """Drop least recently used entries until the cache fits max_size_mb (size kept as a running total)"""
+        if self._total_size <= self.max_size_bytes:
+            return
+
+        removed = 0
+        for url, body_hash, size in self._db.execute(
+            "SELECT url, body_hash, size FROM pages ORDER BY last_access ASC"
+        ).fetchall():
+            if self._total_size <= self.max_size_bytes * 0.9:
+                break
+            self._db.execute("DELETE FROM pages WHERE url = ?", (url,))
+            self._forget_body(body_hash, size)
+            removed += 1
+
+        self._db.commit()
+        logger.info(f"Page cache evicted {removed} entries")
+
+    def clear(self):
+        with self._lock:
+            for (body_hash,) in self._db.execute("SELECT DISTINCT body_hash FROM pages").fetchall():
+                try:
+                    os.remove(self._body_path(body_hash))
+                except OSError:
+                    pass
+            self._db.execute("DELETE FROM pages")
+            self._db.commit()
+            self._pending_access.clear()
+            self._total_size = 0
+
+    def get_stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale': self.stale,
+            'revalidated': self.revalidated,
+        }
+
+    def close(self):
+        with self._lock:
+            try:
+                self._flush_access()
+                self._db.commit()
+                self._db.close()
+            except Exception:
+                pass
@@ -6,7 +6,6 @@ class PcTechBgScraper(AsyncPlaywrightBaseScraper):
     def __init__(self, website_currency, update_gui_callback=None):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://www.pctech.bg/"
-        self.current_page = 1
         self.update_gui_callback = update_gui_callback
         self.website_that_is_scraped = "PcTech.bg"
 
@@ -14,9 +13,9 @@ class PcTechBgScraper(AsyncPlaywrightBaseScraper):
         encoded_term = quote(search_term)
         return f"{self.base_url}index.php?route=product/search&search={encoded_term}"
 
-    def _construct_page_url(self, base_url, search_term):
-        if self.current_page > 1:
-            return f"{self.base_url}index.php?route=product/search&search={search_term}&page={self.current_page}"
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num > 1:
+            return f"{self.base_url}index.php?route=product/search&search={quote(search_term)}&page={page_num}"
         return base_url
 
     async def _extract_product_links(self, page, page_url):
@@ -24,8 +23,6 @@ class PcTechBgScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-            
             await page.wait_for_selector('div.flex_height_row div.product-layout', timeout=10000)
 
             product_elements = await page.query_selector_all('div.flex_height_row div.product-layout')
@@ -69,8 +66,6 @@ class PcTechBgScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Parsing PcTech.bg product: {product_url}")
     
         try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-        
             await page.wait_for_selector('div.col-xs-12 h1.pr_h1', timeout=10000)
 
             title_element = await page.query_selector('div.col-xs-12 h1.pr_h1')
@@ -94,7 +89,6 @@ class PcTechBgScraper(AsyncPlaywrightBaseScraper):
                 except Exception as e:
                     print(f"DEBUG: Price parsing error: {e} for text: {price_text}")
             
-            price = self.convert_where_necessary(price)
             product_data = {
                 'title': title,
                 'price': price,
@@ -102,7 +96,6 @@ class PcTechBgScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': self.website_that_is_scraped,  
                 'source_currency': self.website_currency,
-                'page': self.current_page
             }
 
             print(f"DEBUG: Extracted PcTech.bg product: {title} - {price}")
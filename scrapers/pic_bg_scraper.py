@@ -6,7 +6,6 @@ class PICBgScraper(AsyncPlaywrightBaseScraper):
     def __init__(self, website_currency, update_gui_callback=None):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://www.pic.bg/"
-        self.current_page = 1
         self.update_gui_callback = update_gui_callback
         self.website_that_is_scraped = "PIC.bg"
 
@@ -62,9 +61,9 @@ class PICBgScraper(AsyncPlaywrightBaseScraper):
         encoded_term = quote(search_term)
         return f"{self.base_url}search/{encoded_term}"
 
-    def _construct_page_url(self, base_url, search_term):
-        if self.current_page > 1:
-            return f"{self.base_url}search/{quote(search_term)}/filter/page/{self.current_page}"
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num > 1:
+            return f"{self.base_url}search/{quote(search_term)}/filter/page/{page_num}"
         return base_url
 
     async def _extract_product_links(self, page, page_url):
@@ -73,8 +72,6 @@ class PICBgScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-        
             await page.wait_for_selector('div.res-page', timeout=10000)
 
             results_container = await page.query_selector('div.res-page')
@@ -130,8 +127,6 @@ class PICBgScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Parsing PIC.bg product: {product_url}")
 
         try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-    
             await page.wait_for_selector('div.product-title h1', timeout=10000)
 
             title_element = await page.query_selector('div.product-title h1')
@@ -145,8 +140,6 @@ class PICBgScraper(AsyncPlaywrightBaseScraper):
                 price_text = price_text.strip()
             price = self._extract_and_convert_price(price_text)
 
-            price = self.convert_where_necessary(price)
-
             product_data = {
                 'title': title,
                 'price': price,
@@ -154,7 +147,6 @@ class PICBgScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': 'PIC.bg',
                 'source_currency': self.website_currency,
-                'page': self.current_page
             }
 
             print(f"DEBUG: Extracted PIC.bg product: {title} - {price}")
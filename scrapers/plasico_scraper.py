@@ -3,13 +3,29 @@ from urllib.parse import quote, urljoin
 from .base_scraper import AsyncPlaywrightBaseScraper
 
 class PlasicoScraper(AsyncPlaywrightBaseScraper):
+    supports_http_fetch = True
+    product_schema = {
+        'ready': 'div.details-heading h1',
+        'title': 'div.details-heading h1',
+        'price': 'span.price:not(.oldprice)',
+        'spec_rows': 'table#spec-table tr',
+        'spec_label': 'td:nth-of-type(1)',
+        'spec_value': 'td:nth-of-type(2)',
+        'lowercase_specs': True,
+    }
+
     def __init__(self, website_currency, update_gui_callback=None):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://plasico.bg/"
-        self.current_page = 1
         self.update_gui_callback = update_gui_callback
         self.website_that_is_scraped = "Plasico.bg"
         
+    def _parse_price_text(self, price_text):
+        return self._extract_and_convert_price(price_text or "N/A")
+
+    async def _extract_product_data(self, page, product_url):
+        return await self._extract_product_data_from_schema(page, product_url)
+
     def _extract_and_convert_price(self, price_text):
         if price_text == "N/A":
             return None
@@ -49,18 +65,36 @@ class PlasicoScraper(AsyncPlaywrightBaseScraper):
         encoded_term = quote(search_term)
         return f"{self.base_url}tyrsene/{encoded_term}"
 
-    def _construct_page_url(self, base_url, search_term):
-        if self.current_page > 1:
-            return f"{self.base_url}tyrsene/{quote(search_term)}/p{self.current_page}"
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num > 1:
+            return f"{self.base_url}tyrsene/{quote(search_term)}/p{page_num}"
         return base_url
 
+    def _parse_product_links_html(self, soup, page_url):
+        """Get product links from the static search page HTML"""
+        product_links = []
+
+        for product in soup.select('article.product-box'):
+            title = self._soup_text(product, 'span.ttl')
+            if self._should_filter_by_keywords({'title': title, 'description': ''}):
+                print(f'Skipped product because it was in the exclusion keywords: {self.exclude_keywords}')
+                continue
+
+            link_element = product.select_one('a.mainlink[href]')
+            if link_element:
+                full_url = urljoin(self.base_url, link_element['href'])
+                clean_url = full_url.split('ref=')[0].split('?')[0]
+                if clean_url not in product_links:
+                    product_links.append(clean_url)
+
+        print(f"DEBUG: Total Plasico product links found over HTTP: {len(product_links)}")
+        return product_links or None
+
     async def _extract_product_links(self, page, page_url):
         product_links = []
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-            
             await page.wait_for_selector('div#list-results', timeout=10000)
 
             product_elements = await page.query_selector_all('article.product-box')
@@ -101,87 +135,3 @@ class PlasicoScraper(AsyncPlaywrightBaseScraper):
             print(f"DEBUG: Error extracting product links from Plasico: {e}")
             return []
 
-    async def _extract_product_data(self, page, product_url):
-        print(f"DEBUG: Parsing Plasico product: {product_url}")
-
-        try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-    
-            await page.wait_for_selector('div.details-heading h1', timeout=10000)
-
-            title_element = await page.query_selector('div.details-heading h1')
-            title = await title_element.inner_text() if title_element else "N/A"
-            if title_element:
-                title = title.strip()
-    
-            price_element = None
-            price_selectors = [
-                'span.price',
-                '.price',
-                '.details-price span.price',
-                'div.details-price span.price'
-            ]
-        
-            for selector in price_selectors:
-                price_element = await page.query_selector(selector)
-                if price_element:
-                    class_attr = await price_element.get_attribute('class') or ''
-                    if 'oldprice' not in class_attr:
-                        break
-                    price_element = None
-        
-            if price_element:
-                price_text = await price_element.inner_text()
-                price_text = price_text.strip()
-                print(f"DEBUG: Price text extracted: '{price_text}'")
-            else:
-                price_text = "N/A"
-                print("DEBUG: No price element found")
-            
-            price = self._extract_and_convert_price(price_text)
-            
-            price = self.convert_where_necessary(price)
-            product_data = {
-                'title': title,
-                'price': price,
-                'url': product_url,
-                'currency': self.website_currency,
-                'source': 'Plasico.bg',
-                'source_currency': self.website_currency,
-                'page': self.current_page
-            }
-
-            print(f"DEBUG: Extracted Plasico product: {title} - {price}")
-
-            tech_table = await page.query_selector('table#spec-table')
-            if tech_table:
-                list_items = await tech_table.query_selector_all('tr')
-                for item in list_items:
-                    try:
-                        td_elements = await item.query_selector_all('td')
-                        if len(td_elements) >= 2:
-                            label_element = td_elements[0]
-                            value_element = td_elements[1]
-                    
-                            label_text = await label_element.inner_text() if label_element else ""
-                            value_text = await value_element.inner_text() if value_element else ""
-                            if label_element:
-                                label_text = label_text.strip().lower()
-                            if value_element:
-                                value_text = value_text.strip().lower()
-                    
-                            if value_text:
-                                product_data[label_text] = value_text
-                                print(f"DEBUG: Added Plasico spec: {label_text} = {value_text}")
-                        else:
-                            print(f"DEBUG: Skipping table row with insufficient cells: {len(td_elements)}")
-                    
-                    except Exception as e:
-                        print(f"DEBUG: Skipping invalid property: {str(e)}")
-                        continue
-
-            return product_data
-
-        except Exception as e:
-            print(f"DEBUG: Error parsing Plasico product page: {e}")
-            return None
\ No newline at end of file
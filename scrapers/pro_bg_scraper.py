@@ -6,7 +6,6 @@ class ProBgScraper(AsyncPlaywrightBaseScraper):
     def __init__(self, website_currency, update_gui_callback=None):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://www.pro-bg.com/"
-        self.current_page = 1
         self.update_gui_callback = update_gui_callback
         self.website_that_is_scraped = "Pro.bg"
 
@@ -14,9 +13,9 @@ class ProBgScraper(AsyncPlaywrightBaseScraper):
         encoded_term = quote(search_term)
         return f"{self.base_url}product/index.php?search_text={encoded_term}&category_id=0"
 
-    def _construct_page_url(self, base_url, search_term):
-        if self.current_page > 1:
-            item_from = (self.current_page - 1) * 30
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num > 1:
+            item_from = (page_num - 1) * 30
             return f"{self.base_url}product/index.php?category_id=0&search_text={quote(search_term)}&item_from={item_from}"
         return base_url
 
@@ -25,8 +24,6 @@ class ProBgScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-        
             await page.wait_for_selector('div.grid-x.small-up-1', timeout=10000)
 
             product_elements = await page.query_selector_all('div.grid-x.small-up-1 div.cell')
@@ -76,8 +73,6 @@ class ProBgScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Parsing Pro-bg product: {product_url}")
     
         try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-        
             await page.wait_for_selector('div.product_box_info h2', timeout=10000)
 
             title_element = await page.query_selector('div.product_box_info h2')
@@ -107,7 +102,6 @@ class ProBgScraper(AsyncPlaywrightBaseScraper):
                 except Exception as e:
                     print(f"DEBUG: Price conversion error: {e} for text: {price_text}")
             
-            price = self.convert_where_necessary(price)
             product_data = {
                 'title': title,
                 'price': price,
@@ -115,7 +109,6 @@ class ProBgScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': self.website_that_is_scraped,
                 'source_currency': self.website_currency,
-                'page': self.current_page
             }
 
             print(f"DEBUG: Extracted Pro-bg product: {title} - {price_text}")
@@ -0,0 +1,73 @@
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from price_normalizer import parse_price
+
+# Product dict keys held in Product fields; every other key is a spec
+CORE_FIELDS = ('title', 'price', 'currency', 'source_currency', 'url', 'source', 'page', 'scraped_at')
+
+# Spec values up to this length are interned, long descriptions are kept as they are
+MAX_INTERNED_VALUE = 64
+
+
+def _intern(value):
+    if isinstance(value, str) and len(value) <= MAX_INTERNED_VALUE:
+        return sys.intern(value)
+    return value
+
+
+def to_minor_units(price) -> Optional[int]:
+    """Price in hundredths of the currency unit (12.99 -> 1299), None when there is no price"""
+    amount = parse_price(price)
+    return round(amount * 100) if amount is not None else None
+
+
+@dataclass(slots=True)
+class Product:
+    """Compact scraped product: typed core fields plus specs as interned (key, value) pairs"""
+    title: str
+    price_minor_units: Optional[int]
+    currency: Optional[str]
+    url: Optional[str]
+    source: Optional[str]
+    page: Optional[int] = None
+    scraped_at: float = field(default_factory=time.time)
+    specs: Tuple[Tuple[str, Any], ...] = ()
+
+    @property
+    def price(self) -> Optional[float]:
+        return self.price_minor_units / 100 if self.price_minor_units is not None else None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], source: Optional[str] = None, currency: Optional[str] = None):
+        """Build from the dict shape the scrapers produce; source and currency fill in missing keys"""
+        currency = data.get('currency') or data.get('source_currency') or currency
+        return cls(
+            title=data.get('title') or '',
+            price_minor_units=to_minor_units(data.get('price')),
+            currency=_intern(currency.upper()) if currency else None,
+            url=data.get('url'),
+            source=_intern(data.get('source') or source),
+            page=data.get('page'),
+            scraped_at=data.get('scraped_at') or time.time(),
+            specs=tuple((sys.intern(str(key)), _intern(value))
+                        for key, value in data.items() if key not in CORE_FIELDS),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The dict shape exporters and the GUI expect: specs first, then the product fields"""
+        data = dict(self.specs)
+        data.update({
+            'title': self.title,
+            'price': self.price,
+            'url': self.url,
+            'currency': self.currency,
+            'source': self.source,
+            'source_currency': self.currency,
+            'scraped_at': self.scraped_at,
+        })
+        if self.page is not None:
+            data['page'] = self.page
+        return data
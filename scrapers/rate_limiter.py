@@ -0,0 +1,187 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_STATUSES = (429, 503)
+
+CAPTCHA_MARKERS = (
+    'validatecaptcha',
+    'captcha-delivery',
+    'are you a robot',
+    'type the characters you see',
+)
+
+# Every Cloudflare-fronted page loads /cdn-cgi/challenge-platform/ scripts, so only the interstitial
+# itself counts: its title together with the cf-chl challenge form
+CLOUDFLARE_CHALLENGE_TITLES = ('<title>just a moment', 'attention required! | cloudflare')
+CLOUDFLARE_CHALLENGE_MARKERS = ('cf-chl', 'cf_chl')
+
+
+def domain_of(url_or_domain: str) -> str:
+    """'https://www.ardes.bg/x' -> 'ardes.bg'"""
+    host = urlparse(url_or_domain).hostname if '//' in url_or_domain else url_or_domain
+    host = (host or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def looks_like_captcha(text: Optional[str]) -> bool:
+    """Cheap check for a bot-challenge page instead of the requested content"""
+    if not text or len(text) > 200_000:
+        return False
+    lowered = text.lower()
+    if any(marker in lowered for marker in CAPTCHA_MARKERS):
+        return True
+    return (any(title in lowered for title in CLOUDFLARE_CHALLENGE_TITLES)
+            and any(marker in lowered for marker in CLOUDFLARE_CHALLENGE_MARKERS))
+
+
+class TokenBucket:
+    """Token bucket for one domain with adaptive slow-down after throttling responses"""
+
+    def __init__(self, rate, burst, jitter=0.0, min_rate_factor=0.1, backoff_seconds=15, max_backoff=300):
+        self.base_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = max(1.0, float(burst))
+        self.jitter = float(jitter)
+        self.min_rate = self.base_rate * min_rate_factor
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff = max_backoff
+
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.backoff_until = 0.0
+        self.consecutive_throttles = 0
+
+        self.requests = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def reserve(self) -> float:
+        """Take a token now and return how long the caller has to wait before using it"""
+        now = time.monotonic()
+        # No tokens accrue during a backoff: updated sits at its end until then
+        self.tokens = min(self.burst, self.tokens + max(0.0, now - self.updated) * self.rate)
+        self.updated = max(self.updated, now)
+        self.tokens -= 1
+
+        # Requests queued during a backoff are spaced out from its end instead of all firing when it expires
+        token_wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        wait = max(0.0, self.backoff_until - now) + token_wait
+        if self.jitter:
+            wait += random.uniform(0, self.jitter)
+
+        self.requests += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        return wait
+
+    def on_throttled(self, retry_after: Optional[float] = None):
+        self.throttled += 1
+        self.consecutive_throttles += 1
+        self.rate = max(self.min_rate, self.rate * 0.5)
+
+        backoff = retry_after if retry_after else self.backoff_seconds * 2 ** (self.consecutive_throttles - 1)
+        self.backoff_until = max(self.backoff_until, time.monotonic() + min(backoff, self.max_backoff))
+        self.updated = max(self.updated, self.backoff_until)
+        # One request may go out when the backoff ends, the rest follow at the reduced rate
+        self.tokens = min(self.tokens, 1.0)
+
+    def on_success(self):
+        self.consecutive_throttles = 0
+        if self.rate < self.base_rate:
+            self.rate = min(self.base_rate, self.rate * 1.1)
+
+    def get_stats(self):
+        return {
+            'requests': self.requests,
+            'throttled': self.throttled,
+            'current_rate': round(self.rate, 3),
+            'total_wait': round(self.total_wait, 2),
+            'avg_wait': round(self.total_wait / self.requests, 3) if self.requests else 0.0,
+            'max_wait': round(self.max_wait, 2),
+        }
+
+
+class DomainRateLimiter:
+    """Async rate limiter shared by every scraper and worker, one token bucket per domain"""
+
+    def __init__(self, requests_per_second=0.5, burst=3, jitter_seconds=0.5, site_limits=None,
+                 backoff_seconds=15, max_backoff_seconds=300):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.jitter_seconds = jitter_seconds
+        self.site_limits = {domain_of(k): v for k, v in (site_limits or {}).items()}
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings_manager):
+        """Build the limiter from the rate_limit setting; the old delay_between_requests is the default pace"""
+        config = settings_manager.get('rate_limit', {}) or {}
+        delay = settings_manager.get('delay_between_requests', 2) or 2
+        return cls(
+            requests_per_second=config.get('requests_per_second') or 1.0 / float(delay),
+            burst=config.get('burst', 3),
+            jitter_seconds=config.get('jitter_seconds', 0.5),
+            site_limits=config.get('sites', {}),
+            backoff_seconds=config.get('backoff_seconds', 15),
+            max_backoff_seconds=config.get('max_backoff_seconds', 300),
+        )
+
+    def _bucket(self, domain: str) -> TokenBucket:
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            limits = self.site_limits.get(domain, {})
+            bucket = TokenBucket(
+                rate=limits.get('requests_per_second', self.requests_per_second),
+                burst=limits.get('burst', self.burst),
+                jitter=limits.get('jitter_seconds', self.jitter_seconds),
+                backoff_seconds=self.backoff_seconds,
+                max_backoff=self.max_backoff_seconds,
+            )
+            self._buckets[domain] = bucket
+        return bucket
+
+    async def acquire(self, url_or_domain: str) -> float:
+        """Wait until a request to this domain is allowed, returns the time waited"""
+        domain = domain_of(url_or_domain)
+        with self._lock:
+            wait = self._bucket(domain).reserve()
+
+        if wait > 0:
+            print(f"DEBUG: Rate limiting {domain} - waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+        return wait
+
+    def report(self, url_or_domain: str, status: Optional[int] = None, captcha: bool = False,
+               retry_after: Optional[str] = None):
+        """Feed a response back so the domain slows down on 429/503/CAPTCHA and recovers otherwise"""
+        domain = domain_of(url_or_domain)
+        with self._lock:
+            bucket = self._bucket(domain)
+            if captcha or status in THROTTLE_STATUSES:
+                try:
+                    retry_seconds = float(retry_after) if retry_after else None
+                except ValueError:
+                    retry_seconds = None
+                bucket.on_throttled(retry_seconds)
+                logger.warning(
+                    f"Throttled by {domain} (status={status}, captcha={captcha}), "
+                    f"rate now {bucket.rate:.3f}/s"
+                )
+            elif status is not None and status < 400:
+                bucket.on_success()
+
+    def get_stats(self):
+        with self._lock:
+            return {domain: bucket.get_stats() for domain, bucket in self._buckets.items()}
@@ -0,0 +1,125 @@
+import importlib
+import logging
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List
+
+logger = logging.getLogger(__name__)
+
+# Capabilities a scraper advertises:
+#   http     - product and listing pages can be read without a browser (supports_http_fetch)
+#   schema   - product pages are read through a declarative product_schema
+#   listing  - partial products can be read from listing pages (fast mode, incremental prices)
+
+
+@dataclass(frozen=True)
+class ScraperSpec:
+    name: str
+    module: str
+    class_name: str
+    currency: str
+    capabilities: FrozenSet[str] = frozenset()
+
+
+def _spec(name, module, class_name, currency, *capabilities):
+    return ScraperSpec(name, module, class_name, currency, frozenset(capabilities))
+
+
+SCRAPERS: Dict[str, ScraperSpec] = {spec.name: spec for spec in [
+    _spec("Amazon.com", "scrapers.amazon_com_scraper", "AmazonComScraper", "USD", "listing"),
+    _spec("Ardes.bg", "scrapers.ardes_scraper", "ArdesScraper", "BGN", "http", "schema", "listing"),
+    _spec("jarcomputers.com", "scrapers.jar_computers_scraper", "JarComputersScraper", "BGN"),
+    _spec("Desktop.bg", "scrapers.desktop_bg_scraper", "DesktopScraper", "BGN", "http", "schema", "listing"),
+    _spec("Plasico.bg", "scrapers.plasico_scraper", "PlasicoScraper", "BGN", "http", "schema"),
+    _spec("PIC.bg", "scrapers.pic_bg_scraper", "PICBgScraper", "BGN"),
+    _spec("Optimal Computers", "scrapers.optimal_computers_scraper", "OptimalComputersScraper", "BGN", "http", "schema"),
+    _spec("Xtreme.bg", "scrapers.xtreme_bg_scraper", "XtremeScraper", "EUR"),
+    _spec("CyberTrade.bg", "scrapers.cyber_trade_scraper", "CyberTradeScraper", "BGN"),
+    _spec("PcTech.bg", "scrapers.pc_tech_scraper", "PcTechBgScraper", "EUR"),
+    _spec("Pro.bg", "scrapers.pro_bg_scraper", "ProBgScraper", "BGN"),
+    _spec("TechnoMall.bg", "scrapers.techno_mall_scraper", "TechnoMallScraper", "BGN"),
+    _spec("TehnikStore.bg", "scrapers.tehnik_store_scraper", "TehnikStoreScraper", "EUR"),
+    _spec("AllStore.bg", "scrapers.all_store_bg_scraper", "AllStoreScraper", "EUR"),
+    _spec("Senetic.bg", "scrapers.senetic_scraper", "SeneticScraper", "BGN"),
+    _spec("Thx.bg", "scrapers.thnx_bg_scraper", "ThxScraper", "EUR"),
+    _spec("GtComputers.bg", "scrapers.gt_computers", "GtComputersScraper", "EUR"),
+    _spec("Ezona.bg", "scrapers.ezona_bg_scraper", "EZonaScraper", "BGN"),
+    _spec("Tova.bg", "scrapers.tova_bg_scraper", "TovaBGScraper", "BGN"),
+    _spec("Hits.bg", "scrapers.hits_bg_scraper", "HitsBGScraper", "EUR"),
+    _spec("Amazon.co.uk", "scrapers.amazon_co_uk_scraper", "AmazonCoUkScraper", "EUR", "listing"),
+    _spec("Amazon.de", "scrapers.amazon_de_scraper", "AmazonDeScraper", "EUR", "listing"),
+]}
+
+_loaded_classes = {}
+
+
+class SharedResources:
+    """One settings manager, currency converter and CPU manager for every scraper, created on first use"""
+
+    def __init__(self):
+        self._settings_manager = None
+        self._converter = None
+        self._cpu_manager = None
+
+    def configure(self, settings_manager=None, converter=None, cpu_manager=None):
+        """Adopt instances the application already created"""
+        if settings_manager is not None:
+            self._settings_manager = settings_manager
+        if converter is not None:
+            self._converter = converter
+        if cpu_manager is not None:
+            self._cpu_manager = cpu_manager
+
+    @property
+    def settings_manager(self):
+        if self._settings_manager is None:
+            from settings_manager import SettingsManager
+            self._settings_manager = SettingsManager()
+        return self._settings_manager
+
+    @property
+    def converter(self):
+        if self._converter is None:
+            from currency_converter import RealCurrencyConverter
+            self._converter = RealCurrencyConverter()
+        return self._converter
+
+    @property
+    def cpu_manager(self):
+        if self._cpu_manager is None:
+            from scrapers.cpu_memory_manager import CPUMemoryManagerClass
+            self._cpu_manager = CPUMemoryManagerClass()
+        return self._cpu_manager
+
+
+shared_resources = SharedResources()
+
+
+def site_names() -> List[str]:
+    return list(SCRAPERS)
+
+
+def get_spec(site_name: str) -> ScraperSpec:
+    try:
+        return SCRAPERS[site_name]
+    except KeyError:
+        raise ValueError(f"Unknown website: {site_name}") from None
+
+
+def sites_with(capability: str) -> List[str]:
+    return [name for name, spec in SCRAPERS.items() if capability in spec.capabilities]
+
+
+def load_scraper_class(site_name: str):
+    """Import the scraper module the first time the site is used"""
+    spec = get_spec(site_name)
+    scraper_class = _loaded_classes.get(site_name)
+    if scraper_class is None:
+        scraper_class = getattr(importlib.import_module(spec.module), spec.class_name)
+        _loaded_classes[site_name] = scraper_class
+        logger.debug(f"Loaded scraper {spec.class_name} for {site_name}")
+    return scraper_class
+
+
+def create_scraper(site_name: str, gui_callback=None):
+    """Instantiate the site's scraper in its own website currency"""
+    return load_scraper_class(site_name)(get_spec(site_name).currency, gui_callback)
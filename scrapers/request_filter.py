@@ -0,0 +1,94 @@
+import logging
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ALLOWED_RESOURCE_TYPES = ["document", "stylesheet", "script", "xhr", "fetch", "other"]
+
+DEFAULT_BLOCKED_DOMAINS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googleadservices.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "facebook.net",
+    "connect.facebook.com",
+    "hotjar.com",
+    "clarity.ms",
+    "criteo.com",
+    "criteo.net",
+    "gemius.pl",
+    "mc.yandex.ru",
+    "analytics.tiktok.com",
+    "smartsupp.com",
+    "onesignal.com",
+]
+
+
+def _domain_matches(host, domains):
+    return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+
+class RequestFilter:
+    """Aborts requests a scraper never needs (images, fonts, media, trackers) via context.route"""
+
+    def __init__(self, site_url, allowed_resource_types=None, blocked_domains=None, allowed_domains=None):
+        self.site_host = (urlparse(site_url).hostname or "") if site_url else ""
+        self.site_domain = self.site_host[4:] if self.site_host.startswith("www.") else self.site_host
+        self.allowed_resource_types = set(allowed_resource_types or DEFAULT_ALLOWED_RESOURCE_TYPES)
+        self.blocked_domains = list(blocked_domains if blocked_domains is not None else DEFAULT_BLOCKED_DOMAINS)
+        self.allowed_domains = list(allowed_domains or [])
+
+        self.allowed_requests = 0
+        self.blocked_requests = 0
+
+    @classmethod
+    def from_settings(cls, settings_manager, website_name, site_url):
+        """Build the filter for one site from the request_filter setting, or None if disabled"""
+        config = settings_manager.get('request_filter', {}) or {}
+        if not config.get('enabled', True):
+            return None
+
+        site_config = (config.get('sites') or {}).get(website_name, {})
+        if site_config.get('enabled') is False:
+            return None
+
+        return cls(
+            site_url,
+            allowed_resource_types=site_config.get('allowed_resource_types', config.get('allowed_resource_types')),
+            blocked_domains=site_config.get('blocked_domains', config.get('blocked_domains')),
+            allowed_domains=site_config.get('allowed_domains', config.get('allowed_domains')),
+        )
+
+    def should_block(self, resource_type, url):
+        if resource_type not in self.allowed_resource_types:
+            return True
+
+        host = urlparse(url).hostname or ""
+        if self.site_domain and _domain_matches(host, [self.site_domain]):
+            return False
+        if _domain_matches(host, self.blocked_domains):
+            return True
+        if self.allowed_domains and not _domain_matches(host, self.allowed_domains):
+            return True
+        return False
+
+    async def handle(self, route):
+        """context.route handler"""
+        request = route.request
+        try:
+            if self.should_block(request.resource_type, request.url):
+                self.blocked_requests += 1
+                await route.abort()
+            else:
+                self.allowed_requests += 1
+                await route.continue_()
+        except Exception as e:
+            logger.debug(f"Route handling failed for {request.url}: {e}")
+
+    def get_stats(self):
+        return {
+            'allowed_requests': self.allowed_requests,
+            'blocked_requests': self.blocked_requests,
+        }
@@ -0,0 +1,210 @@
+import csv
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime
+
+from .product import Product
+
+logger = logging.getLogger(__name__)
+
+# Flat columns for CSV and Parquet; specs vary per site so they travel as one JSON column
+FLAT_FIELDS = ('source', 'title', 'price', 'currency', 'url', 'page', 'scraped_at', 'specs')
+
+
+def flat_row(product: Product):
+    return {
+        'source': product.source,
+        'title': product.title,
+        'price': product.price,
+        'currency': product.currency,
+        'url': product.url,
+        'page': product.page,
+        'scraped_at': product.scraped_at,
+        'specs': json.dumps(dict(product.specs), ensure_ascii=False, default=str),
+    }
+
+
+class NdjsonWriter:
+    """One JSON object per line in the exporters' dict shape"""
+    extension = 'ndjson'
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'a', encoding='utf-8', newline='')
+
+    def write(self, product: Product):
+        self._file.write(json.dumps(product.to_dict(), ensure_ascii=False, default=str) + '\n')
+
+    def flush(self, sync=False):
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        self.flush(sync=True)
+        self._file.close()
+
+
+class CsvWriter(NdjsonWriter):
+    extension = 'csv'
+
+    def __init__(self, path):
+        super().__init__(path)
+        self._writer = csv.DictWriter(self._file, fieldnames=FLAT_FIELDS)
+        if self._file.tell() == 0:
+            self._writer.writeheader()
+
+    def write(self, product: Product):
+        self._writer.writerow(flat_row(product))
+
+
+class ParquetWriter:
+    """Buffered row groups; the file is only readable after close() writes the footer,
+    so pair it with NDJSON or CSV when crash safety matters"""
+    extension = 'parquet'
+
+    def __init__(self, path, row_group_size=500):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.path = path
+        self.row_group_size = row_group_size
+        self._pa = pa
+        self._schema = pa.schema([
+            ('source', pa.string()),
+            ('title', pa.string()),
+            ('price', pa.float64()),
+            ('currency', pa.string()),
+            ('url', pa.string()),
+            ('page', pa.int32()),
+            ('scraped_at', pa.float64()),
+            ('specs', pa.string()),
+        ])
+        self._file = open(path, 'wb')
+        self._writer = pq.ParquetWriter(self._file, self._schema)
+        self._rows = []
+
+    def write(self, product: Product):
+        self._rows.append(flat_row(product))
+        if len(self._rows) >= self.row_group_size:
+            self._write_row_group()
+
+    def _write_row_group(self):
+        if self._rows:
+            self._writer.write_table(self._pa.Table.from_pylist(self._rows, schema=self._schema))
+            self._rows = []
+
+    def flush(self, sync=False):
+        if not sync:
+            return
+        self._write_row_group()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        self._write_row_group()
+        self._writer.close()
+        self._file.close()
+
+
+WRITERS = {writer.extension: writer for writer in (NdjsonWriter, CsvWriter, ParquetWriter)}
+
+
+class ResultSink:
+    """Scrapers push every accepted Product here and it goes straight to disk.
+    Flushes every flush_every products and fsyncs at most every fsync_seconds."""
+
+    def __init__(self, output_dir, run_name, formats=('ndjson',), flush_every=20, fsync_seconds=5.0):
+        os.makedirs(output_dir, exist_ok=True)
+        self.flush_every = max(1, int(flush_every))
+        self.fsync_seconds = float(fsync_seconds)
+
+        self.writers = []
+        for fmt in formats:
+            writer_class = WRITERS.get(str(fmt).lower())
+            if writer_class is None:
+                logger.warning(f"Unknown stream format '{fmt}', expected one of {', '.join(WRITERS)}")
+                continue
+            path = os.path.join(output_dir, f"{run_name}.{writer_class.extension}")
+            try:
+                self.writers.append(writer_class(path))
+            except ImportError as e:
+                logger.warning(f"Skipping {fmt} stream output: {e}")
+
+        self.count = 0
+        self.closed = False
+        self._unflushed = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+        print(f"DEBUG: Streaming results to {', '.join(self.paths) or 'nowhere'}")
+
+    @classmethod
+    def from_settings(cls, settings_manager, search_term):
+        """Sink for one run, or None when stream_results is disabled"""
+        config = settings_manager.get('stream_results', {}) or {}
+        if not config.get('enabled', True):
+            return None
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        slug = re.sub(r'[^\w\-]+', '_', search_term.strip().lower()) or 'results'
+        return cls(
+            config.get('output_dir', './scrape-history/stream'),
+            f"{timestamp}_{slug}",
+            formats=config.get('formats', ['ndjson']),
+            flush_every=config.get('flush_every', 20),
+            fsync_seconds=config.get('fsync_seconds', 5.0),
+        )
+
+    @property
+    def paths(self):
+        return [writer.path for writer in self.writers]
+
+    def push(self, product: Product):
+        with self._lock:
+            if self.closed:
+                return
+            for writer in self.writers:
+                try:
+                    writer.write(product)
+                except Exception as e:
+                    logger.error(f"Could not stream product to {writer.path}: {e}")
+            self.count += 1
+            self._unflushed += 1
+
+            sync_due = time.monotonic() - self._last_sync >= self.fsync_seconds
+            if sync_due or self._unflushed >= self.flush_every:
+                self._flush(sync=sync_due)
+
+    def _flush(self, sync):
+        for writer in self.writers:
+            try:
+                writer.flush(sync=sync)
+            except Exception as e:
+                logger.error(f"Could not flush {writer.path}: {e}")
+        self._unflushed = 0
+        if sync:
+            self._last_sync = time.monotonic()
+
+    def flush(self):
+        with self._lock:
+            if not self.closed:
+                self._flush(sync=True)
+
+    def close(self):
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            for writer in self.writers:
+                try:
+                    writer.close()
+                except Exception as e:
+                    logger.error(f"Could not close {writer.path}: {e}")
+        logger.info(f"Streamed {self.count} products to {', '.join(self.paths)}")
+
+    def get_stats(self):
+        return {'products': self.count, 'files': self.paths}
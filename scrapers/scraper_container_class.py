@@ -1,14 +1,332 @@
 from .base_scraper import AsyncPlaywrightBaseScraper
+from .http_fetcher import AsyncHttpFetcher
+from .request_filter import RequestFilter
+from .page_cache import PageCache
+from .rate_limiter import DomainRateLimiter
+from .product import Product
+from .result_sink import ResultSink
+from .session_journal import SessionJournal
 import asyncio
 from typing import List, Dict, Any, Optional
 import logging
+import os
 import random
 from collections import defaultdict
 from playwright.async_api import async_playwright, Browser, BrowserContext
 from settings_manager import SettingsManager
+from product_matcher import ProductMatcher
 
 logger = logging.getLogger(__name__)
 
+# Extra Chromium switches for the "lean" launch profile: skip everything a scraper never uses
+LEAN_CHROMIUM_ARGS = [
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-translate',
+    '--disable-domain-reliability',
+    '--disable-client-side-phishing-detection',
+    '--disable-breakpad',
+    '--metrics-recording-only',
+    '--mute-audio',
+    '--no-pings',
+    '--disable-dev-shm-usage',
+]
+
+
+class BrowserPool:
+    """Long-lived browser with a bounded pool of contexts per site and recycled pages"""
+
+    def __init__(self, settings_manager: SettingsManager, max_contexts_per_site=2,
+                 max_page_uses=50, max_context_uses=500):
+        self.settings_manager = settings_manager
+        self.max_contexts_per_site = max_contexts_per_site
+        self.max_page_uses = max_page_uses
+        self.max_context_uses = max_context_uses
+
+        self.browser: Optional[Browser] = None
+        self._playwright = None
+        self._loop = None
+
+        self.headless_override = None
+        self.launch_profile_override = None
+        self._launch_config = None
+
+        self._site_factories = {}
+        self._site_contexts = defaultdict(dict)
+        self._creating = {}
+        self._context_uses = {}
+        self._pages_in_use = defaultdict(int)
+        self._idle_pages = defaultdict(list)
+        self._page_uses = {}
+
+        self.stats = {
+            'browser_launches': 0,
+            'contexts_created': 0,
+            'contexts_recycled': 0,
+            'pages_created': 0,
+            'pages_reused': 0,
+            'pages_recycled': 0,
+        }
+
+    @property
+    def headless(self) -> bool:
+        """Per-run override, else the headless setting; headless when nothing says otherwise"""
+        if self.headless_override is not None:
+            return bool(self.headless_override)
+        return bool(self.settings_manager.get('headless', True))
+
+    @property
+    def launch_profile(self) -> str:
+        return self.launch_profile_override or self.settings_manager.get('launch_profile', 'default')
+
+    def _requested_config(self):
+        return (self.settings_manager.get('preferred_browser', 'Chrome'), self.headless, self.launch_profile)
+
+    def is_healthy(self) -> bool:
+        """Browser still connected, bound to the running event loop and launched with the requested options"""
+        try:
+            return (
+                self.browser is not None
+                and self.browser.is_connected()
+                and self._loop is asyncio.get_running_loop()
+                and self._launch_config == self._requested_config()
+            )
+        except Exception:
+            return False
+
+    async def ensure_browser(self) -> Browser:
+        """Return the warm browser, launching a new one only if it is missing or unhealthy"""
+        if self.is_healthy():
+            return self.browser
+
+        if self.browser is not None:
+            logger.info("Pooled browser is unhealthy or from a previous event loop, relaunching")
+            if self._loop is asyncio.get_running_loop():
+                await self.close()
+            else:
+                self._forget_all()
+
+        await self._launch()
+        return self.browser
+
+    async def _launch(self):
+        preferred_browser, headless, launch_profile = self._requested_config()
+        logger.info(f"Starting shared browser (headless={headless}, profile={launch_profile})...")
+
+        window_height = 200
+
+        browser_args = [
+            '--disable-blink-features=AutomationControlled',
+            '--no-first-run',
+            '--no-default-browser-check',
+            '--disable-popup-blocking',
+            '--force-device-scale-factor=1',
+            '--disable-notifications',
+            '--disable-infobars',
+            '--disable-session-crashed-bubble',
+            '--noerrdialogs',
+            '--disable-gpu',
+        ]
+        if not headless:
+            browser_args += [
+                f'--window-size=400,{window_height}',
+                '--disable-features=UseOzonePlatform',
+                '--ozone-platform-hint=x11',
+                '--start-maximized=false',
+            ]
+        if launch_profile == 'lean':
+            cache_dir = os.path.abspath(self.settings_manager.get('browser_cache_dir', './cache/chromium'))
+            os.makedirs(cache_dir, exist_ok=True)
+            browser_args += LEAN_CHROMIUM_ARGS + [f'--disk-cache-dir={cache_dir}']
+
+        self._playwright = await async_playwright().start()
+        self._loop = asyncio.get_running_loop()
+
+        launch_kwargs = {
+            'headless': headless,
+            'args': browser_args
+        }
+
+        if preferred_browser == 'Firefox':
+            launch_kwargs['args'] = [] if headless else [
+                '--new-window',
+                f'--width=400',
+                f'--height={window_height}',
+            ]
+            self.browser = await asyncio.shield(self._playwright.firefox.launch(**launch_kwargs))
+        elif preferred_browser == 'Safari':
+            self.browser = await asyncio.shield(self._playwright.webkit.launch(**launch_kwargs))
+        else:
+            if preferred_browser == 'Edge':
+                launch_kwargs['channel'] = 'msedge'
+            self.browser = await asyncio.shield(self._playwright.chromium.launch(**launch_kwargs))
+
+        self._launch_config = (preferred_browser, headless, launch_profile)
+        self.stats['browser_launches'] += 1
+        logger.info("Shared browser started successfully.")
+
+    def register_site(self, site_key: str, context_factory):
+        """context_factory is an async callable creating a configured context for the site"""
+        self._site_factories[site_key] = context_factory
+
+    async def get_context(self, site_key: str, slot: int = 0) -> BrowserContext:
+        """Context for one of the site's slots, created on first use and recycled after max_context_uses pages"""
+        slot = slot % max(1, self.max_contexts_per_site)
+        contexts = self._site_contexts[site_key]
+        context = contexts.get(slot)
+
+        if context is not None:
+            worn_out = self._context_uses.get(id(context), 0) >= self.max_context_uses
+            if worn_out and self._pages_in_use[id(context)] == 0:
+                self.stats['contexts_recycled'] += 1
+                await self._close_context(context)
+                context = None
+            elif not self._context_alive(context):
+                self._forget_context(context)
+                context = None
+
+        if context is None:
+            # Workers sharing a slot wait for the same creation instead of racing to make two contexts
+            creating = self._creating.get((site_key, slot))
+            if creating is None:
+                creating = asyncio.ensure_future(self._create_context(site_key, slot))
+                self._creating[(site_key, slot)] = creating
+            try:
+                context = await asyncio.shield(creating)
+            finally:
+                self._creating.pop((site_key, slot), None)
+
+        return context
+
+    async def _create_context(self, site_key: str, slot: int) -> BrowserContext:
+        await self.ensure_browser()
+        context = await self._site_factories[site_key]()
+        self._site_contexts[site_key][slot] = context
+        self._context_uses[id(context)] = 0
+        self.stats['contexts_created'] += 1
+        return context
+
+    def _context_alive(self, context) -> bool:
+        try:
+            context.pages
+            return self.browser is not None and self.browser.is_connected()
+        except Exception:
+            return False
+
+    async def acquire_page(self, context):
+        """Hand out an idle page of this context, or open a new one"""
+        idle = self._idle_pages[id(context)]
+        page = None
+        while idle:
+            candidate = idle.pop()
+            if not candidate.is_closed():
+                page = candidate
+                self.stats['pages_reused'] += 1
+                break
+            self._page_uses.pop(id(candidate), None)
+
+        if page is None:
+            page = await context.new_page()
+            self._page_uses[id(page)] = 0
+            self.stats['pages_created'] += 1
+
+        page.set_default_timeout(60000)
+        self._pages_in_use[id(context)] += 1
+        self._context_uses[id(context)] = self._context_uses.get(id(context), 0) + 1
+        return page
+
+    async def release_page(self, context, page):
+        """Reset a page to about:blank and return it to the pool, or close it once it is worn out"""
+        self._pages_in_use[id(context)] = max(0, self._pages_in_use[id(context)] - 1)
+        uses = self._page_uses.get(id(page), 0) + 1
+        self._page_uses[id(page)] = uses
+
+        if page.is_closed():
+            self._page_uses.pop(id(page), None)
+            return
+
+        if uses >= self.max_page_uses:
+            self.stats['pages_recycled'] += 1
+            await self._close_page(page)
+            return
+
+        try:
+            await asyncio.wait_for(page.goto('about:blank'), timeout=5.0)
+            self._idle_pages[id(context)].append(page)
+        except Exception as e:
+            logger.debug(f"Could not reset page, closing it: {e}")
+            await self._close_page(page)
+
+    async def _close_page(self, page):
+        self._page_uses.pop(id(page), None)
+        try:
+            await asyncio.wait_for(page.close(), timeout=2.0)
+        except Exception as e:
+            logger.warning(f"Error closing page: {e}")
+
+    async def _close_context(self, context):
+        self._forget_context(context)
+        try:
+            await asyncio.wait_for(context.close(), timeout=5.0)
+        except Exception as e:
+            logger.warning(f"Error closing context: {e}")
+
+    def _forget_context(self, context):
+        for contexts in self._site_contexts.values():
+            for slot, pooled in list(contexts.items()):
+                if pooled is context:
+                    del contexts[slot]
+        for page in self._idle_pages.pop(id(context), []):
+            self._page_uses.pop(id(page), None)
+        self._pages_in_use.pop(id(context), None)
+        self._context_uses.pop(id(context), None)
+
+    def _forget_all(self):
+        """Drop references to objects owned by an event loop that is gone"""
+        self._site_contexts.clear()
+        self._creating.clear()
+        self._idle_pages.clear()
+        self._pages_in_use.clear()
+        self._context_uses.clear()
+        self._page_uses.clear()
+        self.browser = None
+        self._playwright = None
+        self._loop = None
+        self._launch_config = None
+
+    def get_stats(self):
+        return dict(
+            self.stats,
+            contexts_open=sum(len(contexts) for contexts in self._site_contexts.values()),
+            idle_pages=sum(len(pages) for pages in self._idle_pages.values()),
+        )
+
+    async def close(self):
+        """Tear down every context, the browser and Playwright"""
+        for contexts in list(self._site_contexts.values()):
+            for context in list(contexts.values()):
+                await self._close_context(context)
+
+        try:
+            if self.browser:
+                await asyncio.wait_for(self.browser.close(), timeout=5.0)
+                logger.info("Browser closed.")
+        except Exception as e:
+            logger.error(f"Error closing browser: {e}")
+
+        try:
+            if self._playwright:
+                await asyncio.wait_for(self._playwright.stop(), timeout=5.0)
+                logger.info("Playwright stopped.")
+        except Exception as e:
+            logger.error(f"Error stopping playwright: {e}")
+
+        self._forget_all()
+
+
 class ScraperContainer:
     def __init__(self, scraper_list: List[AsyncPlaywrightBaseScraper], settings_manager: SettingsManager):
         self.scraper_list = scraper_list
@@ -16,9 +334,19 @@ class ScraperContainer:
         self._active_scrapers = {}
         self._all_results = {}  
         self.browser = None
-        self._playwright = None  
-        self._contexts = {}
-        self.context = None
+        self.browser_pool = BrowserPool(
+            settings_manager,
+            max_contexts_per_site=settings_manager.get('max_contexts_per_site', 2),
+            max_page_uses=settings_manager.get('max_page_uses', 50),
+        )
+        self._loop = None
+        self.http_fetcher = None
+        self.rate_limiter = None
+        self.result_sink = None
+        self.session_journal = None
+        self.session_id = None
+        self._run_stopped = False
+        self._request_filters = {}
         self.total_products_discovered = 0
         self.total_products_collected = 0
         self.total_expected_products = 0
@@ -37,55 +365,9 @@ class ScraperContainer:
                 self.total_expected_products += getattr(scraper, 'total_expected_products', 0)
     
     async def start_shared_browser(self):
-        """Start shared browser instances for all scrapers"""
-        logger.info("Starting shared browsers for all scrapers...")
+        """Make sure the pooled browser is running; it stays warm between runs"""
         try:
-            preferred_browser = self.settings_manager.get('preferred_browser', 'Chrome')
-        
-            window_height = 200   
-        
-            browser_args = [
-                '--disable-blink-features=AutomationControlled',
-                '--no-first-run',      
-                '--no-default-browser-check',  
-                '--disable-popup-blocking', 
-                f'--window-size=400,{window_height}', 
-                '--disable-features=UseOzonePlatform',
-                '--ozone-platform-hint=x11',
-                '--force-device-scale-factor=1',
-                '--start-maximized=false',
-                '--disable-notifications',
-                '--disable-infobars',
-                '--disable-session-crashed-bubble',
-                '--noerrdialogs',
-                '--disable-gpu', 
-            ]
-
-            self._playwright = await async_playwright().start()
-        
-            launch_kwargs = {
-                'headless': False,
-                'args': browser_args
-            }
-
-            if preferred_browser == 'Chrome':
-                self.browser = await asyncio.shield(self._playwright.chromium.launch(**launch_kwargs))
-            elif preferred_browser == 'Firefox':
-                firefox_args = [
-                    '--new-window',
-                    f'--width=400',
-                    f'--height={window_height}',
-                ]
-                launch_kwargs['args'] = firefox_args
-                self.browser = await asyncio.shield(self._playwright.firefox.launch(**launch_kwargs))
-            elif preferred_browser == 'Safari':
-                self.browser = await asyncio.shield(self._playwright.webkit.launch(**launch_kwargs))
-            elif preferred_browser == 'Edge':
-                launch_kwargs['channel'] = 'msedge'
-                self.browser = await asyncio.shield(self._playwright.chromium.launch(**launch_kwargs))
-
-            self.context = await self.browser.new_context()
-            logger.info("Shared browser and context started successfully.")
+            self.browser = await self.browser_pool.ensure_browser()
         except Exception as e:
             logger.error(f"Error starting shared browser: {e}")
             await self._cleanup_resources()
@@ -94,7 +376,7 @@ class ScraperContainer:
         """Create a unique context for each scraper with windows at bottom"""
         user_agent = await self._get_random_user_agent()
 
-        context = await self.browser.new_context(
+        context = await self.browser_pool.browser.new_context(
             user_agent=user_agent,
             viewport={'width': 400, 'height': 200},  
             locale='bg-BG',
@@ -103,8 +385,19 @@ class ScraperContainer:
             reduced_motion='no-preference',
             java_script_enabled=True,
         )
+
+        website_key = getattr(scraper, 'website_that_is_scraped', scraper.__class__.__name__)
+        site_url = getattr(scraper, 'base_url', None) or getattr(scraper, 'base_domain', None)
+        request_filter = RequestFilter.from_settings(self.settings_manager, website_key, site_url)
+        if request_filter:
+            await context.route("**/*", request_filter.handle)
+            self._request_filters[id(scraper)] = request_filter
     
-        page = await context.new_page()
+        if self.browser_pool.headless:
+            return context
+
+        # Headed runs: park the window at the bottom of the screen
+        page = await self.browser_pool.acquire_page(context)
     
         await page.evaluate("""() => {
                 // Get screen dimensions
@@ -130,30 +423,62 @@ class ScraperContainer:
         except:
             pass
     
-        self._contexts[id(scraper)] = context
+        await self.browser_pool.release_page(context, page)
         return context
     
-    async def start_all_scrapers_async(self, search_term: str, max_pages: int = 3) -> Dict[str, List[Dict[str, Any]]]:
+    async def start_all_scrapers_async(self, search_term: str, max_pages: int = 3,
+                                       headless: Optional[bool] = None,
+                                       launch_profile: Optional[str] = None,
+                                       session_id: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
         """
         Start all scrapers concurrently using asyncio.
+        headless / launch_profile ('default' or 'lean') override the settings for this run.
+        session_id continues a journaled session instead of starting a new one (see resume).
         Returns: Dictionary with website names as keys and lists of products as values.
         """
-        if self.browser:
-            logger.info("Cleaning up existing browser before starting new one")
-            await self._cleanup_resources()
-            self.browser = None
-            self._playwright = None
-            self.context = None
-    
+        self.browser_pool.headless_override = headless
+        self.browser_pool.launch_profile_override = launch_profile
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not None and self._loop is not loop:
+            # Sessions from a previous event loop cannot be reused; the browser pool handles its own
+            if self.http_fetcher and self.http_fetcher.page_cache:
+                self.http_fetcher.page_cache.close()
+            self.http_fetcher = None
+        self._loop = loop
+
         await self.start_shared_browser()
+        await self._prefetch_currency_rates()
         
         self._all_results = {}
         scraper_tasks = []
 
+        if self.http_fetcher is None:
+            self.http_fetcher = AsyncHttpFetcher(page_cache=PageCache.from_settings(self.settings_manager))
+        if self.rate_limiter is None:
+            self.rate_limiter = DomainRateLimiter.from_settings(self.settings_manager)
+        self.result_sink = ResultSink.from_settings(self.settings_manager, search_term)
+        if not session_id:
+            max_pages = self.settings_manager.get('max_pages', max_pages)
+        self._start_session(search_term, max_pages, session_id)
+        self._run_stopped = False
+        run_completed = False
+        self.http_fetcher.rate_limiter = self.rate_limiter
+
         for scraper in self.scraper_list:
-            context = await self._create_scraper_context(scraper)
+            website_key = getattr(scraper, 'website_that_is_scraped', scraper.__class__.__name__)
+            self.browser_pool.register_site(
+                website_key, lambda scraper=scraper: self._create_scraper_context(scraper)
+            )
+            context = await self.browser_pool.get_context(website_key)
             scraper.browser = self.browser
             scraper.context = context
+            scraper.browser_pool = self.browser_pool
+            scraper.http_fetcher = self.http_fetcher
+            scraper.rate_limiter = self.rate_limiter
+            scraper.result_sink = self.result_sink
+            scraper.session_journal = self.session_journal
+            scraper.session_id = self.session_id
             
             if hasattr(scraper, 'website_that_is_scraped'):
                 website_key = scraper.website_that_is_scraped
@@ -162,8 +487,8 @@ class ScraperContainer:
             self._all_results[website_key] = []
             
             task = asyncio.create_task(
-                self._run_single_scraper(scraper, search_term, self.settings_manager.get('max_pages', max_pages)
-            ))
+                self._run_single_scraper(scraper, search_term, max_pages)
+            )
             scraper_tasks.append(task)
             self._active_scrapers[id(scraper)] = {
                 'scraper': scraper,
@@ -186,12 +511,15 @@ class ScraperContainer:
                     logger.error(f"Scraper {scraper.__class__.__name__} failed: {result}")
                     self._all_results[website_key] = []
                 elif result:
+                    website_currency = getattr(scraper, 'website_currency', None)
+                    records = []
                     for product in result:
                         if product:
                             product['source_scraper'] = scraper.__class__.__name__
-                            if hasattr(scraper, 'website_currency'):
-                                product['source_currency'] = scraper.website_currency
-                    self._all_results[website_key] = result
+                            if website_currency:
+                                product['source_currency'] = website_currency
+                            records.append(Product.from_dict(product, source=website_key, currency=website_currency))
+                    self._all_results[website_key] = records
                 else:
                     self._all_results[website_key] = []
             
@@ -201,110 +529,93 @@ class ScraperContainer:
             for website, products in self._all_results.items():
                 logger.info(f"  - {website}: {len(products)} products")
             
-            return self._all_results
+            run_completed = True
+            return self.get_results_as_dicts()
             
         except Exception as e:
             logger.error(f"Error running scrapers: {e}")
-            return self._all_results
+            return self.get_results_as_dicts()
+        finally:
+            if self.result_sink is not None:
+                self.result_sink.close()
+            if self.session_journal is not None and self.session_id:
+                status = 'completed' if run_completed and not self._run_stopped else 'interrupted'
+                self.session_journal.finish_session(self.session_id, status)
+                logger.info(f"Session {self.session_id} {status}")
     
-    async def _cleanup_contexts(self):
-        logger.info(f"Cleaning up {len(self._contexts)} contexts")
+    def _site_keys(self) -> List[str]:
+        return [getattr(scraper, 'website_that_is_scraped', scraper.__class__.__name__) for scraper in self.scraper_list]
+
+    def _start_session(self, search_term: str, max_pages: int, session_id: Optional[str] = None):
+        """Open the journal and start a new session, or continue session_id"""
+        if self.session_journal is None:
+            self.session_journal = SessionJournal.from_settings(self.settings_manager)
+        if self.session_journal is None:
+            self.session_id = None
+        elif session_id:
+            self.session_id = session_id
+        else:
+            self.session_id = self.session_journal.start_session(search_term, max_pages, self._site_keys())
+            logger.info(f"Started session {self.session_id}")
+
+    async def resume(self, session_id: Optional[str] = None, headless: Optional[bool] = None,
+                     launch_profile: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Continue an interrupted session, by default the latest one that did not complete.
+        Completed pages and finished products come from the journal; everything else is scraped again.
+        """
+        if self.session_journal is None:
+            self.session_journal = SessionJournal.from_settings(self.settings_manager)
+        if self.session_journal is None:
+            raise RuntimeError("Session journal is disabled, nothing to resume")
+
+        session = self.session_journal.get_session(session_id)
+        if session is None:
+            raise ValueError(f"No session to resume: {session_id or 'no unfinished sessions'}")
+
+        missing = set(session['sites']) - set(self._site_keys())
+        if missing:
+            logger.warning(f"Session {session['id']} also covered {', '.join(sorted(missing))}, not resumed here")
+
+        logger.info(f"Resuming session {session['id']} ('{session['search_term']}', {session['max_pages']} pages)")
+        return await self.start_all_scrapers_async(
+            session['search_term'], session['max_pages'],
+            headless=headless, launch_profile=launch_profile, session_id=session['id'],
+        )
     
-        for scraper_id, context in list(self._contexts.items()):
+    async def _prefetch_currency_rates(self):
+        """Load every rate this run needs in one batch, off the event loop"""
+        currencies = {getattr(scraper, 'website_currency', None) for scraper in self.scraper_list}
+        currencies |= {"EUR", self.settings_manager.get('preferred_currency', 'EUR')}
+        converters = {id(scraper.converter): scraper.converter for scraper in self.scraper_list
+                      if hasattr(getattr(scraper, 'converter', None), 'prefetch')}
+        for converter in converters.values():
             try:
-                logger.info(f"Closing context for scraper {scraper_id}")
-            
-                try:
-                    pages = context.pages
-                    logger.info(f"Context has {len(pages)} pages open")
-                
-                    for page in pages:
-                        try:
-                            await asyncio.wait_for(page.close(), timeout=2.0)
-                            logger.info(f"Closed page in context {scraper_id}")
-                        except Exception as e:
-                            logger.warning(f"Error closing page: {e}")
-                except Exception as e:
-                    logger.warning(f"Error getting pages: {e}")
-            
-                try:
-                    await asyncio.wait_for(context.close(), timeout=5.0)
-                    logger.info(f"Closed context for scraper {scraper_id}")
-                except asyncio.TimeoutError:
-                    logger.warning(f"Timeout closing context for scraper {scraper_id}, forcing...")
-                    try:
-                        pass
-                    except:
-                        pass
-                    
+                await asyncio.to_thread(converter.prefetch, currencies)
             except Exception as e:
-                logger.error(f"Error closing context for scraper {scraper_id}: {e}")
-    
-        self._contexts.clear()
-        logger.info("All contexts cleared")
+                logger.error(f"Currency prefetch failed: {e}")
 
     async def _cleanup_resources(self):
         logger.info("=== Starting _cleanup_resources ===")
-    
-        logger.info("Cleaning up contexts...")
-        
-        try:
-            await asyncio.wait_for(self._cleanup_contexts(), timeout=10.0)
-            logger.info("Contexts cleaned up successfully")
-        except asyncio.TimeoutError:
-            logger.error("Timeout cleaning up contexts")
-            self._contexts.clear()
-        except Exception as e:
-            logger.error(f"Error cleaning up contexts: {e}")
-    
-        logger.info(f"Closing context. Context exists: {self.context is not None}")
-        
-        try:
-            if self.context:
-                await asyncio.wait_for(self.context.close(), timeout=5.0)
-                self.context = None
-                logger.info("Browser context closed.")
-            else:
-                logger.info("No context to close")
-        except asyncio.TimeoutError:
-            logger.error("Timeout closing context")
-            self.context = None
-        except Exception as e:
-            logger.error(f"Error closing context: {e}")
-            self.context = None
-    
-        logger.info(f"Closing browser. Browser exists: {self.browser is not None}")
-        
-        try:
-            if self.browser:
-                await asyncio.wait_for(self.browser.close(), timeout=5.0)
-                self.browser = None
-                logger.info("Browser closed.")
-            else:
-                logger.info("No browser to close")
-        except asyncio.TimeoutError:
-            logger.error("Timeout closing browser")
-            self.browser = None
-        except Exception as e:
-            logger.error(f"Error closing browser: {e}")
-            self.browser = None
-    
-        logger.info(f"Stopping playwright. Playwright exists: {self._playwright is not None}")
-        
+
+        if self.http_fetcher:
+            await self.http_fetcher.close()
+            self.http_fetcher = None
+
         try:
-            if self._playwright:
-                await asyncio.wait_for(self._playwright.stop(), timeout=5.0)
-                self._playwright = None
-                logger.info("Playwright stopped.")
-            else:
-                logger.info("No playwright to stop")
+            await asyncio.wait_for(self.browser_pool.close(), timeout=20.0)
         except asyncio.TimeoutError:
-            logger.error("Timeout stopping playwright")
-            self._playwright = None
+            logger.error("Timeout closing browser pool")
+            self.browser_pool._forget_all()
         except Exception as e:
-            logger.error(f"Error stopping playwright: {e}")
-            self._playwright = None
-    
+            logger.error(f"Error closing browser pool: {e}")
+            self.browser_pool._forget_all()
+
+        if self.session_journal is not None:
+            self.session_journal.close()
+            self.session_journal = None
+
+        self.browser = None
         logger.info("=== _cleanup_resources completed ===")
 
     async def close_all_resources(self):
@@ -347,6 +658,7 @@ class ScraperContainer:
         """Stop all running scrapers"""
         logger.info("Stopping all scrapers...")
         stopped_count = 0
+        self._run_stopped = True
         
         for scraper_id, scraper_info in self._active_scrapers.items():
             scraper = scraper_info['scraper']
@@ -399,9 +711,17 @@ class ScraperContainer:
                 'website': website_key,
                 'products_collected': len(website_results),
                 'total_products_found': getattr(scraper, 'total_products_found', 0),
-                'products_per_page': getattr(scraper, 'products_per_page', {})
+                'products_per_page': getattr(scraper, 'products_per_page', {}),
+                'request_filter': self._request_filters[id(scraper)].get_stats() if id(scraper) in self._request_filters else None
             }
         return status
+
+    def get_browser_pool_stats(self) -> Dict[str, Any]:
+        return self.browser_pool.get_stats()
+
+    def get_rate_limit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-domain request counts, throttling and wait times"""
+        return self.rate_limiter.get_stats() if self.rate_limiter else {}
         
     def set_filter_for_all(self, min_price=None, max_price=None, exclude_keywords=""):
         """Apply filters to all scrapers"""
@@ -411,18 +731,24 @@ class ScraperContainer:
             scraper.exclude_keywords = exclude_keywords
         logger.info(f"Filters applied to {len(self.scraper_list)} scrapers")
     
+    def get_all_products(self) -> List[Product]:
+        """All results as compact Product records"""
+        return [product for products in self._all_results.values() for product in products]
+
+    def get_results_as_dicts(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Results per website in the dict shape the exporters use"""
+        return {website: [product.to_dict() for product in products]
+                for website, products in self._all_results.items()}
+
     def get_all_results_flat(self) -> List[Dict[str, Any]]:
         """
         Get all results as a flat list (backward compatibility).
         """
-        flat_results = []
-        for website, products in self._all_results.items():
-            flat_results.extend(products)
-        return flat_results
+        return [product.to_dict() for product in self.get_all_products()]
     
     def get_results_by_website(self, website_name: str) -> List[Dict[str, Any]]:
         """Get results for a specific website"""
-        return self._all_results.get(website_name, [])
+        return [product.to_dict() for product in self._all_results.get(website_name, [])]
     
     def get_results_summary(self) -> Dict[str, Any]:
         """Get summary of all results"""
@@ -439,8 +765,8 @@ class ScraperContainer:
             summary['total_products'] += product_count
             
             for product in products:
-                currency = product.get('currency') or product.get('source_currency')
-                scraper = product.get('source_scraper')
+                currency = product.currency
+                scraper = dict(product.specs).get('source_scraper')
                 
                 if currency:
                     summary['by_currency'][currency] += 1
@@ -474,24 +800,35 @@ class ScraperContainer:
                     logger.warning(f"deduplicate_results received non-list: {type(results)}")
                     return []
 
-            flat_results = self.get_all_results_flat()
+            all_products = self.get_all_products()
             seen_urls = set()
             deduplicated = []
         
-            for product in flat_results:
-                if product and isinstance(product, dict) and 'url' in product:
-                    url = product['url']
-                    if url and url not in seen_urls:
-                        seen_urls.add(url)
-                        deduplicated.append(product)
+            for product in all_products:
+                if product.url and product.url not in seen_urls:
+                    seen_urls.add(product.url)
+                    deduplicated.append(product.to_dict())
         
-            logger.info(f"Deduplicated internal: {len(flat_results)} -> {len(deduplicated)} products")
+            logger.info(f"Deduplicated internal: {len(all_products)} -> {len(deduplicated)} products")
             return deduplicated
         
         except Exception as e:
             logger.error(f"Error in deduplicate_results: {e}")
             return []
     
+    def get_best_deals(self, results: List[Dict[str, Any]] = None, min_stores: int = 2) -> List[Dict[str, Any]]:
+        """
+        Match the same product across stores and return its best price and price spread.
+        Pass the converted results to compare in one currency; defaults to the internal results.
+        """
+        matcher = ProductMatcher.from_settings(self.settings_manager)
+        if matcher is None:
+            return []
+        products = results if results is not None else self.get_all_results_flat()
+        deals = matcher.match(products, min_stores=min_stores)
+        logger.info(f"Matched {len(deals)} products sold by {min_stores}+ stores out of {len(products)} offers")
+        return deals
+
     def get_scraper_by_name(self, scraper_name: str) -> Optional[AsyncPlaywrightBaseScraper]:
         """Get a scraper instance by its class name"""
         for scraper in self.scraper_list:
@@ -6,7 +6,6 @@ class SeneticScraper(AsyncPlaywrightBaseScraper):
     def __init__(self, website_currency, update_gui_callback=None):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://www.senetic.bg/"
-        self.current_page = 1
         self.update_gui_callback = update_gui_callback
         self.website_that_is_scraped = "Senetic.bg"
         
@@ -66,7 +65,9 @@ class SeneticScraper(AsyncPlaywrightBaseScraper):
         encoded_term = quote(search_term)
         return f"{self.base_url}search/?q={encoded_term}"
 
-    def _construct_page_url(self, base_url, search_term):
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num > 1:
+            return None
         return base_url
 
     async def _extract_product_links(self, page, page_url):
@@ -74,8 +75,6 @@ class SeneticScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-            
             await page.wait_for_selector('div.listing-products__container div.product-block', timeout=10000)
 
             product_elements = await page.query_selector_all('div.listing-products__container div.product-block')
@@ -120,8 +119,6 @@ class SeneticScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Parsing Senetic product: {product_url}")
     
         try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-        
             await page.wait_for_selector('div.top-info__main h1.top-info__title', timeout=10000)
 
             title_element = await page.query_selector('div.top-info__main h1.top-info__title')
@@ -135,7 +132,6 @@ class SeneticScraper(AsyncPlaywrightBaseScraper):
                 price_text = price_text.strip()
             price = self._extract_and_convert_price(price_text)
 
-            price = self.convert_where_necessary(price)
             product_data = {
                 'title': title,
                 'price': price,
@@ -143,7 +139,6 @@ class SeneticScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': 'Senetic.bg',
                 'source_currency': self.website_currency,
-                'page': self.current_page
             }
 
             print(f"DEBUG: Extracted Senetic product: {title} - {price}")
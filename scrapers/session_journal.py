@@ -0,0 +1,241 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Product statuses: 'queued' when listed, then 'done' (with its record), 'filtered' or 'failed'
+UNFINISHED_STATUSES = ('queued', 'failed')
+
+
+class SessionJournal:
+    """SQLite journal of scrape sessions: per site, the pages completed and every product URL
+    queued, done (with its record), filtered or failed, so an interrupted run can pick up where it stopped.
+    Product rows are committed in batches; pages and session status are committed at once."""
+
+    def __init__(self, path="./scrape-history/sessions.sqlite3", keep_days=14, commit_every=50, commit_seconds=2.0):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.commit_every = commit_every
+        self.commit_seconds = commit_seconds
+        self._pending = 0
+        self._last_commit = time.monotonic()
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                id TEXT PRIMARY KEY,
+                search_term TEXT,
+                max_pages INTEGER,
+                sites TEXT,
+                status TEXT,
+                started_at REAL,
+                updated_at REAL
+            );
+            CREATE TABLE IF NOT EXISTS pages (
+                session_id TEXT,
+                site TEXT,
+                page_num INTEGER,
+                product_count INTEGER,
+                completed_at REAL,
+                PRIMARY KEY (session_id, site, page_num)
+            );
+            CREATE TABLE IF NOT EXISTS products (
+                session_id TEXT,
+                site TEXT,
+                url TEXT,
+                page_num INTEGER,
+                status TEXT,
+                record TEXT,
+                updated_at REAL,
+                PRIMARY KEY (session_id, site, url)
+            );
+        """)
+        self._db.commit()
+        self._prune(keep_days)
+
+    @classmethod
+    def from_settings(cls, settings_manager):
+        """Journal from the session_journal setting, or None when it is disabled"""
+        config = settings_manager.get('session_journal', {}) or {}
+        if not config.get('enabled', True):
+            return None
+        try:
+            return cls(
+                path=config.get('path', "./scrape-history/sessions.sqlite3"),
+                keep_days=config.get('keep_days', 14),
+                commit_every=config.get('commit_every', 50),
+                commit_seconds=config.get('commit_seconds', 2.0),
+            )
+        except Exception as e:
+            logger.error(f"Could not open session journal: {e}")
+            return None
+
+    def _prune(self, keep_days):
+        cutoff = time.time() - float(keep_days) * 86400
+        with self._lock:
+            old = [row[0] for row in self._db.execute(
+                "SELECT id FROM sessions WHERE updated_at < ?", (cutoff,)
+            )]
+            for session_id in old:
+                self._delete_session(session_id)
+            self._db.commit()
+
+    def _delete_session(self, session_id):
+        for table, column in (('products', 'session_id'), ('pages', 'session_id'), ('sessions', 'id')):
+            self._db.execute(f"DELETE FROM {table} WHERE {column} = ?", (session_id,))
+
+    def _touch(self, session_id):
+        self._db.execute("UPDATE sessions SET updated_at = ? WHERE id = ?", (time.time(), session_id))
+
+    def _commit(self):
+        self._db.commit()
+        self._pending = 0
+        self._last_commit = time.monotonic()
+
+    def _commit_soon(self, rows=1):
+        """Product rows are frequent: commit every commit_every rows or commit_seconds, whichever comes first.
+        A crash loses at most that window, and those products are simply scraped again on resume."""
+        self._pending += rows
+        if self._pending >= self.commit_every or time.monotonic() - self._last_commit >= self.commit_seconds:
+            self._commit()
+
+    def flush(self):
+        with self._lock:
+            self._commit()
+
+    def start_session(self, search_term: str, max_pages: int, sites: List[str]) -> str:
+        session_id = time.strftime("%Y%m%d_%H%M%S") + "_" + uuid.uuid4().hex[:6]
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO sessions VALUES (?, ?, ?, ?, 'running', ?, ?)",
+                (session_id, search_term, max_pages, json.dumps(sites, ensure_ascii=False), now, now),
+            )
+            self._commit()
+        return session_id
+
+    def finish_session(self, session_id: str, status: str):
+        """'completed' or 'interrupted'; a session left 'running' was killed mid-run"""
+        with self._lock:
+            self._db.execute("UPDATE sessions SET status = ?, updated_at = ? WHERE id = ?",
+                             (status, time.time(), session_id))
+            self._commit()
+
+    def get_session(self, session_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """The given session, or the most recent one that did not complete"""
+        with self._lock:
+            if session_id:
+                row = self._db.execute(
+                    "SELECT id, search_term, max_pages, sites, status, started_at FROM sessions WHERE id = ?",
+                    (session_id,),
+                ).fetchone()
+            else:
+                row = self._db.execute(
+                    "SELECT id, search_term, max_pages, sites, status, started_at FROM sessions "
+                    "WHERE status != 'completed' ORDER BY started_at DESC LIMIT 1"
+                ).fetchone()
+        if row is None:
+            return None
+        return {
+            'id': row[0],
+            'search_term': row[1],
+            'max_pages': row[2],
+            'sites': json.loads(row[3] or '[]'),
+            'status': row[4],
+            'started_at': row[5],
+        }
+
+    def queue_products(self, session_id: str, site: str, urls: List[str], page_num: int):
+        now = time.time()
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO products VALUES (?, ?, ?, ?, 'queued', NULL, ?)",
+                [(session_id, site, url, page_num, now) for url in urls],
+            )
+            self._commit_soon(len(urls))
+
+    def product_done(self, session_id: str, site: str, url: str, record: Dict[str, Any], page_num: Optional[int] = None):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?, 'done', ?, ?)",
+                (session_id, site, url, page_num,
+                 json.dumps(record, ensure_ascii=False, default=str), time.time()),
+            )
+            self._commit_soon()
+
+    def product_filtered(self, session_id: str, site: str, url: str, page_num: Optional[int] = None):
+        """Opened but dropped by the price/keyword filters: final, never retried"""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?, 'filtered', NULL, ?)",
+                (session_id, site, url, page_num, time.time()),
+            )
+            self._commit_soon()
+
+    def products_failed(self, session_id: str, site: str, urls: List[str]):
+        """Products that are still queued after their page finished could not be scraped"""
+        now = time.time()
+        with self._lock:
+            self._db.executemany(
+                "UPDATE products SET status = 'failed', updated_at = ? "
+                "WHERE session_id = ? AND site = ? AND url = ? AND status = 'queued'",
+                [(now, session_id, site, url) for url in urls],
+            )
+            self._commit_soon(len(urls))
+
+    def page_done(self, session_id: str, site: str, page_num: int, product_count: int):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+                (session_id, site, page_num, product_count, time.time()),
+            )
+            self._touch(session_id)
+            self._commit()
+
+    def site_progress(self, session_id: str, site: str) -> Dict[str, Any]:
+        """Completed pages ({page: product count}), the records of every product already done and the
+        filtered URLs. A page with queued or failed products is left out so the resumed run reopens it."""
+        with self._lock:
+            pages = dict(self._db.execute(
+                "SELECT page_num, product_count FROM pages WHERE session_id = ? AND site = ?",
+                (session_id, site),
+            ))
+            records = [json.loads(row[0]) for row in self._db.execute(
+                "SELECT record FROM products WHERE session_id = ? AND site = ? AND status = 'done'",
+                (session_id, site),
+            )]
+            filtered = [row[0] for row in self._db.execute(
+                "SELECT url FROM products WHERE session_id = ? AND site = ? AND status = 'filtered'",
+                (session_id, site),
+            )]
+            unfinished = self._db.execute(
+                f"SELECT page_num, COUNT(*) FROM products WHERE session_id = ? AND site = ? "
+                f"AND status IN ({','.join('?' * len(UNFINISHED_STATUSES))}) GROUP BY page_num",
+                (session_id, site, *UNFINISHED_STATUSES),
+            ).fetchall()
+
+        reopened = [page_num for page_num, _ in unfinished if page_num in pages]
+        for page_num in reopened:
+            del pages[page_num]
+        return {
+            'pages': pages,
+            'records': records,
+            'filtered': filtered,
+            'unfinished': sum(count for _, count in unfinished),
+            'reopened_pages': reopened,
+        }
+
+    def close(self):
+        with self._lock:
+            self._commit()
+            self._db.close()
@@ -6,7 +6,6 @@ class TehnikStoreScraper(AsyncPlaywrightBaseScraper):
     def __init__(self, website_currency, update_gui_callback=None):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://tehnik.store/"
-        self.current_page = 1
         self.update_gui_callback = update_gui_callback
         self.website_that_is_scraped = "TehnikStore.bg"
 
@@ -14,9 +13,9 @@ class TehnikStoreScraper(AsyncPlaywrightBaseScraper):
         encoded_term = quote(search_term)
         return f"{self.base_url}?s={encoded_term}&product_cat=0&post_type=product"
 
-    def _construct_page_url(self, base_url, search_term):
-        if self.current_page > 1:
-            item_from = (self.current_page - 1) * 30
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num > 1:
+            item_from = (page_num - 1) * 30
             return f"{self.base_url}?s={quote(search_term)}&product_cat=0&post_type=product&orderby=relevance&app={item_from}"
         return base_url
 
@@ -55,8 +54,6 @@ class TehnikStoreScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-            
             await page.wait_for_selector('div.products', timeout=10000)
 
             product_elements = await page.query_selector_all('div.products div.product')
@@ -101,8 +98,6 @@ class TehnikStoreScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Parsing TehnikStore product: {product_url}")
 
         try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-    
             await page.wait_for_selector('div.single-product-header h1.product_title', timeout=10000)
 
             title_element = await page.query_selector('div.single-product-header h1.product_title')
@@ -121,7 +116,6 @@ class TehnikStoreScraper(AsyncPlaywrightBaseScraper):
             
             price = self._extract_and_convert_price(price_text)
 
-            price = self.convert_where_necessary(price)
             product_data = {
                 'title': title,
                 'price': price,
@@ -129,7 +123,6 @@ class TehnikStoreScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': self.website_that_is_scraped,
                 'source_currency': self.website_currency,
-                'page': self.current_page
             }
 
             print(f"DEBUG: Extracted TehnikStore product: {title} - {price}")
@@ -3,10 +3,11 @@ from urllib.parse import quote, urljoin
 from .base_scraper import AsyncPlaywrightBaseScraper
 
 class ThxScraper(AsyncPlaywrightBaseScraper):
+    product_wait_until = 'load'
+
     def __init__(self, website_currency, update_gui_callback=None):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://thx.bg/"
-        self.current_page = 1
         self.update_gui_callback = update_gui_callback
         self.website_that_is_scraped = "Thx.bg"
 
@@ -14,9 +15,9 @@ class ThxScraper(AsyncPlaywrightBaseScraper):
         encoded_term = quote(search_term)
         return f"{self.base_url}bg/search?search_text={encoded_term}"
 
-    def _construct_page_url(self, base_url, search_term):
-        if self.current_page > 1:
-            return f"{self.base_url}bg/search?search_text={quote(search_term)}&page={self.current_page}"
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num > 1:
+            return f"{self.base_url}bg/search?search_text={quote(search_term)}&page={page_num}"
         return base_url
 
     def _extract_and_convert_price(self, price_text):
@@ -81,8 +82,6 @@ class ThxScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-            
             await page.wait_for_selector('div.catalog-grid div.grid-item', timeout=10000)
 
             product_elements = await page.query_selector_all('div.catalog-grid div.grid-item')
@@ -126,8 +125,6 @@ class ThxScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Parsing Thx.bg product: {product_url}")
     
         try:
-            await page.goto(product_url, wait_until='load', timeout=30000)
-        
             await page.wait_for_selector('div.d-none h1.product-title', timeout=10000)
 
             title_element = await page.query_selector('div.d-none h1.product-title')
@@ -176,7 +173,6 @@ class ThxScraper(AsyncPlaywrightBaseScraper):
                         except ValueError:
                             pass
             
-            price = self.convert_where_necessary(price)
             product_data = {
                 'title': title,
                 'price': price,
@@ -184,7 +180,6 @@ class ThxScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': self.website_that_is_scraped,
                 'source_currency': self.website_currency,
-                'page': self.current_page
             }
 
             print(f"DEBUG: Extracted Thx.bg product: {title} - {price}")
@@ -6,7 +6,6 @@ class TovaBGScraper(AsyncPlaywrightBaseScraper):
     def __init__(self, website_currency, update_gui_callback=None):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://tova.bg/"
-        self.current_page = 1
         self.update_gui_callback = update_gui_callback
         self.website_that_is_scraped = "Tova.bg"
 
@@ -14,8 +13,8 @@ class TovaBGScraper(AsyncPlaywrightBaseScraper):
         encoded_term = quote(search_term)
         return f"{self.base_url}search.html?phrase={encoded_term}"
 
-    def _construct_page_url(self, base_url, search_term):
-        if self.current_page > 1:
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num > 1:
             return None
         return base_url
 
@@ -81,8 +80,6 @@ class TovaBGScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-            
             await page.wait_for_selector('ul.c-search-grid-page__product-grid li.twig', timeout=10000)
 
             product_elements = await page.query_selector_all('ul.c-search-grid-page__product-grid li.twig')
@@ -126,8 +123,6 @@ class TovaBGScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Parsing TovaBG product: {product_url}")
     
         try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-        
             await page.wait_for_selector('div.c-product-page__product-name-title-wrapper h1.c-product-page__product-name', timeout=10000)
 
             title_element = await page.query_selector('div.c-product-page__product-name-title-wrapper h1.c-product-page__product-name')
@@ -145,7 +140,6 @@ class TovaBGScraper(AsyncPlaywrightBaseScraper):
             if price is None:
                 price = self._extract_and_convert_price(price_text)
 
-            price = self.convert_where_necessary(price)
             product_data = {
                 'title': title,
                 'price': price,
@@ -153,7 +147,6 @@ class TovaBGScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': self.website_that_is_scraped,
                 'source_currency': self.website_currency,
-                'page': self.current_page
             }
 
             print(f"DEBUG: Extracted TovaBG product: {title} - {price}")
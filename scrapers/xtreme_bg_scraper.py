@@ -6,7 +6,6 @@ class XtremeScraper(AsyncPlaywrightBaseScraper):
     def __init__(self, website_currency, update_gui_callback=None):
         super().__init__(website_currency, update_gui_callback)
         self.base_url = "https://xtreme.bg/"
-        self.current_page = 1
         self.update_gui_callback = update_gui_callback
         self.website_that_is_scraped = "Xtreme.bg"
 
@@ -14,9 +13,9 @@ class XtremeScraper(AsyncPlaywrightBaseScraper):
         encoded_term = quote(search_term)
         return f"{self.base_url}shop/search.php?search_query={encoded_term}"
 
-    def _construct_page_url(self, base_url, search_term):
-        if self.current_page > 1:
-            return f"{self.base_url}shop/search.php?search_query={quote(search_term)}&p={self.current_page}"
+    def _construct_page_url(self, base_url, search_term, page_num):
+        if page_num > 1:
+            return f"{self.base_url}shop/search.php?search_query={quote(search_term)}&p={page_num}"
         return base_url
 
     def _extract_and_convert_price(self, price_text):
@@ -54,8 +53,6 @@ class XtremeScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Extracting product links from: {page_url}")
 
         try:
-            await page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-            
             await page.wait_for_selector('div.search_container', timeout=10000)
 
             product_elements = await page.query_selector_all('div.search_container article.product')
@@ -99,8 +96,6 @@ class XtremeScraper(AsyncPlaywrightBaseScraper):
         print(f"DEBUG: Parsing Xtreme product: {product_url}")
     
         try:
-            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
-        
             await page.wait_for_selector('div.breadcrumb_title h1#main_name', timeout=10000)
 
             title_element = await page.query_selector('div.breadcrumb_title h1#main_name')
@@ -123,7 +118,6 @@ class XtremeScraper(AsyncPlaywrightBaseScraper):
                     print(f"DEBUG: Error parsing Xtreme price: {e}, trying alternative method")
                     price = self._extract_and_convert_price(price_text)
 
-            price = self.convert_where_necessary(price)
             product_data = {
                 'title': title,
                 'price': price,
@@ -131,7 +125,6 @@ class XtremeScraper(AsyncPlaywrightBaseScraper):
                 'currency': self.website_currency,
                 'source': self.website_that_is_scraped,
                 'source_currency': self.website_currency,
-                'page': self.current_page
             }
 
             print(f"DEBUG: Extracted Xtreme product: {title} - {price}")
@@ -15,9 +15,62 @@ class SettingsManager:
             "price_format": "0.00",
             "preferred_browser": "Chrome",
             "headless": False,
+            "launch_profile": "default",
+            "browser_cache_dir": "./cache/chromium",
             "max_pages": 10,
             "delay_between_requests": 2.0,
             "random_delay_multiplier": 1.5,
+            "http_fetch_enabled": True,
+            "scrape_mode": "full",
+            "fast_mode_fetch_specs": False,
+            "incremental_mode": False,
+            "incremental_max_age_hours": 72,
+            "no_cache": False,
+            "page_cache": {
+                "enabled": True,
+                "max_size_mb": 512,
+                "default_ttl_seconds": 21600,
+                "listing_ttl_seconds": 0,
+                "site_ttl_seconds": {}
+            },
+            "max_contexts_per_site": 2,
+            "max_page_uses": 50,
+            "rate_limit": {
+                "requests_per_second": None,
+                "burst": 3,
+                "jitter_seconds": 0.5,
+                "backoff_seconds": 15,
+                "max_backoff_seconds": 300,
+                "sites": {}
+            },
+            "request_filter": {
+                "enabled": True,
+                "sites": {}
+            },
+            "stream_results": {
+                "enabled": True,
+                "formats": ["ndjson"],
+                "output_dir": "./scrape-history/stream",
+                "flush_every": 20,
+                "fsync_seconds": 5.0
+            },
+            "session_journal": {
+                "enabled": True,
+                "path": "./scrape-history/sessions.sqlite3",
+                "keep_days": 14,
+                "commit_every": 50,
+                "commit_seconds": 2.0
+            },
+            "price_history": {
+                "enabled": True,
+                "path": "./scrape-history/history.sqlite3",
+                "keep_file_copies": False
+            },
+            "product_matching": {
+                "enabled": True,
+                "min_similarity": 0.6,
+                "max_block_size": 200
+            },
             "min_price": "",
             "max_price": "",
             "exclude_keywords": "",
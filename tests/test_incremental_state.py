@@ -0,0 +1,46 @@
+import time
+
+from scrapers.incremental_state import IncrementalState
+
+URL = "https://ardes.bg/product/rtx-4070"
+RECORD = {'title': 'ASUS Dual RTX 4070', 'price': '1199.00', 'url': URL}
+
+
+def remembered_state(tmp_path, listing_price=1199.0, **kwargs):
+    state = IncrementalState("Ardes.bg", "rtx 4070", state_dir=str(tmp_path), **kwargs)
+    state.remember(URL, dict(RECORD), listing_price)
+    return state
+
+
+def test_unknown_url_is_new(tmp_path):
+    state = IncrementalState("Ardes.bg", "rtx 4070", state_dir=str(tmp_path))
+    assert state.refresh_reason(URL, 1199.0) == 'new'
+
+
+def test_same_listing_price_reuses_record(tmp_path):
+    state = remembered_state(tmp_path)
+    assert state.refresh_reason(URL, 1199.0) is None
+    assert state.cached_record(URL) == RECORD
+
+
+def test_changed_listing_price_refreshes(tmp_path):
+    state = remembered_state(tmp_path)
+    assert state.refresh_reason(URL, 1149.0) == 'price_changed'
+
+
+def test_missing_listing_price_refreshes(tmp_path):
+    # Sites whose listings carry no price cannot tell a repriced product from an unchanged one
+    assert remembered_state(tmp_path).refresh_reason(URL, None) == 'no_listing_price'
+    assert remembered_state(tmp_path, listing_price=None).refresh_reason(URL, 1199.0) == 'no_listing_price'
+
+
+def test_old_record_is_stale(tmp_path):
+    state = remembered_state(tmp_path, max_age_hours=1)
+    state.entries[URL]['fetched_at'] = time.time() - 2 * 3600
+    assert state.refresh_reason(URL, 1199.0) == 'stale'
+
+
+def test_state_survives_save_and_load(tmp_path):
+    remembered_state(tmp_path).save()
+    loaded = IncrementalState.load("Ardes.bg", "rtx 4070", state_dir=str(tmp_path))
+    assert loaded.refresh_reason(URL, 1199.0) is None
@@ -0,0 +1,47 @@
+import pytest
+
+from scrapers.keyword_filter import KeywordFilter, normalize_keyword_text
+
+
+def test_empty_keywords_match_nothing():
+    assert not KeywordFilter("")
+    assert not KeywordFilter(None)
+    assert KeywordFilter([]).match("Лаптоп Asus") is None
+
+
+@pytest.mark.parametrize("keywords", ["Лаптоп, HP Victus", ["Лаптоп", "HP Victus", ""]])
+def test_comma_string_and_list_are_equivalent(keywords):
+    keyword_filter = KeywordFilter(keywords)
+    assert keyword_filter.keywords == ["лаптоп", "hp victus"]
+    assert keyword_filter.match("ЛАПТОП Lenovo") == "лаптоп"
+    assert keyword_filter.match("Видеокарта", "hp victus 15 gaming") == "hp victus"
+    assert keyword_filter.match("AMD Ryzen 5 7600") is None
+
+
+def test_normalized_match_ignores_trademarks_and_hyphens():
+    keyword_filter = KeywordFilter("i7-13700")
+    assert keyword_filter.match("Intel® Core™ i7 13700K") == "i7-13700"
+
+
+def test_keyword_that_normalizes_to_nothing_only_matches_raw():
+    keyword_filter = KeywordFilter("intel")
+    assert keyword_filter.match("AMD Ryzen 7 7800X3D") is None
+    assert keyword_filter.match("Intel Core i5-14400F") == "intel"
+
+
+def test_longest_keyword_is_reported():
+    assert KeywordFilter("rtx, rtx 4090").match("ASUS ROG RTX 4090") == "rtx 4090"
+
+
+def test_regex_characters_are_literal():
+    keyword_filter = KeywordFilter("a+b, (refurb)")
+    assert keyword_filter.match("SSD a+b 1TB") == "a+b"
+    assert keyword_filter.match("aab") is None
+    assert keyword_filter.match("Monitor (Refurb) 27") == "(refurb)"
+
+
+def test_normalization_is_cached():
+    normalize_keyword_text.cache_clear()
+    normalize_keyword_text("ASUS TUF RTX 4070")
+    normalize_keyword_text("ASUS TUF RTX 4070")
+    assert normalize_keyword_text.cache_info().hits == 1
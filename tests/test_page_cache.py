@@ -0,0 +1,96 @@
+from scrapers import page_cache as page_cache_module
+from scrapers.page_cache import PageCache
+
+
+def make_cache(tmp_path, **kwargs):
+    return PageCache(cache_dir=str(tmp_path / "http"), **kwargs)
+
+
+def test_store_and_fresh_lookup(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.store("https://ardes.bg/p/1", "<html>one</html>", {"ETag": '"abc"'})
+
+    body, is_fresh, validators = cache.lookup("https://ardes.bg/p/1")
+    assert body == "<html>one</html>"
+    assert is_fresh
+    assert validators['etag'] == '"abc"'
+    assert cache.lookup("https://ardes.bg/p/2") is None
+    assert cache.get_stats() == {'hits': 1, 'misses': 1, 'stale': 0, 'revalidated': 0}
+
+
+def test_ttl_override_and_site_ttls(tmp_path, monkeypatch):
+    cache = make_cache(tmp_path, default_ttl=100, site_ttls={'pic.bg': 10})
+    cache.store("https://www.pic.bg/p/1", "pic")
+    cache.store("https://ardes.bg/p/1", "ardes")
+
+    later = page_cache_module.time.time() + 50
+    monkeypatch.setattr(page_cache_module.time, 'time', lambda: later)
+    assert not cache.lookup("https://www.pic.bg/p/1")[1]
+    assert cache.lookup("https://ardes.bg/p/1")[1]
+    assert not cache.lookup("https://ardes.bg/p/1", ttl=0)[1]
+    assert cache.get_stats() == {'hits': 1, 'misses': 0, 'stale': 2, 'revalidated': 0}
+
+
+def test_lookups_defer_last_access_writes(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.store("https://ardes.bg/p/1", "one")
+    stored_access = cache._db.execute("SELECT last_access FROM pages").fetchone()[0]
+
+    cache.lookup("https://ardes.bg/p/1")
+    assert cache._db.execute("SELECT last_access FROM pages").fetchone()[0] == stored_access
+    assert "https://ardes.bg/p/1" in cache._pending_access
+
+    cache.store("https://ardes.bg/p/2", "two")
+    assert not cache._pending_access
+
+
+def test_listing_pages_bypass_cache_by_default(tmp_path):
+    assert make_cache(tmp_path).listing_ttl == 0
+
+
+def test_running_total_tracks_replacements_and_clear(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.store("https://ardes.bg/p/1", "a" * 1000)
+    first = cache._total_size
+    cache.store("https://ardes.bg/p/1", "b" * 1000)
+    assert cache._total_size == first
+    cache.store("https://ardes.bg/p/2", "c" * 1000)
+    assert cache._total_size == cache._db.execute("SELECT SUM(size) FROM pages").fetchone()[0]
+
+    cache.clear()
+    assert cache._total_size == 0
+
+
+def test_shared_body_is_counted_once(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.store("https://ardes.bg/p/1", "same page" * 100)
+    one_body = cache._total_size
+    cache.store("https://ardes.bg/p/1?utm=x", "same page" * 100)
+    assert cache._total_size == one_body
+
+    # Replacing the only URL that used a body deletes that body
+    cache.store("https://ardes.bg/p/1", "other page" * 100)
+    cache.store("https://ardes.bg/p/1?utm=x", "other page" * 100)
+    assert len(list((tmp_path / "http" / "bodies").rglob("*.z"))) == 1
+    assert cache._total_size == cache._db.execute("SELECT MAX(size) FROM pages").fetchone()[0]
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    cache = make_cache(tmp_path, max_size_mb=0)
+    cache.max_size_bytes = 60
+    for i in range(5):
+        # Incompressible-ish bodies so each entry has a distinct, non-trivial size
+        cache.store(f"https://ardes.bg/p/{i}", "".join(chr(65 + (i * 7 + j * 13) % 50) for j in range(40)))
+
+    assert cache._total_size <= cache.max_size_bytes
+    assert cache.lookup("https://ardes.bg/p/4") is not None
+    assert cache.lookup("https://ardes.bg/p/0") is None
+    assert cache._total_size == cache._db.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+
+
+def test_total_is_restored_when_reopened(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.store("https://ardes.bg/p/1", "x" * 500)
+    total = cache._total_size
+    cache.close()
+    assert make_cache(tmp_path)._total_size == total
@@ -0,0 +1,145 @@
+import pytest
+
+pytest.importorskip("playwright")
+pytest.importorskip("requests")
+pytest.importorskip("psutil")
+pytest.importorskip("bs4")
+
+from scrapers import registry
+
+MAX_PAGES = 5
+SEARCH_TERMS = ("rtx 4070", "ryzen 7 7800x3d")
+
+# Sites whose search results are a single page: every page after the first has no URL
+SINGLE_PAGE_SITES = {"Optimal Computers", "Ezona.bg", "Tova.bg", "Senetic.bg"}
+
+# Page 1 and page 2 for "rtx 4070" - catches a page number put into the wrong parameter or path segment
+EXPECTED_URLS = {
+    "Amazon.com": (
+        "https://www.amazon.com/s?k=rtx%204070&crid=2J0PCSZU19ONB&sprefix=rtx%204070%2Caps%2C153&ref=nb_sb_noss_2",
+        "https://www.amazon.com/s?k=rtx+4070&crid=2J0PCSZU19ONB&sprefix=rtx+4070%2Caps%2C153&ref=nb_sb_noss_2&page=2",
+    ),
+    "Amazon.co.uk": (
+        "https://www.amazon.co.uk/s?k=rtx%204070&page=1",
+        "https://www.amazon.co.uk/s?k=rtx%204070&page=2",
+    ),
+    "Amazon.de": (
+        "https://www.amazon.de/s?k=rtx%204070&crid=2J0PCSZU19ONB&sprefix=rtx%204070%2Caps%2C153&ref=nb_sb_noss_2",
+        "https://www.amazon.de/s?k=rtx%204070&page=2&xpid=L1vzNrANz4x19&crid=2J0PCSZU19ONB&qid=1760797196"
+        "&sprefix=rtx%204070%2Caps%2C153&ref=sr_pg_2",
+    ),
+    "Ardes.bg": (
+        "https://www.ardes.bg/products?q=rtx%204070",
+        "https://www.ardes.bg/products/page/2?q=rtx%204070",
+    ),
+    "jarcomputers.com": (
+        "https://www.jarcomputers.com/search?q=rtx%204070",
+        "https://www.jarcomputers.com/search?q=rtx%204070&ref=&page=2",
+    ),
+    "Desktop.bg": (
+        "https://desktop.bg/search?q=rtx%204070",
+        "https://desktop.bg/search?q=rtx+4070&page=2",
+    ),
+    "Plasico.bg": (
+        "https://plasico.bg/tyrsene/rtx%204070",
+        "https://plasico.bg/tyrsene/rtx%204070/p2",
+    ),
+    "PIC.bg": (
+        "https://www.pic.bg/search/rtx%204070",
+        "https://www.pic.bg/search/rtx%204070/filter/page/2",
+    ),
+    "Optimal Computers": ("https://optimal-computers.bg/products/search?s=rtx%204070", None),
+    "Xtreme.bg": (
+        "https://xtreme.bg/shop/search.php?search_query=rtx%204070",
+        "https://xtreme.bg/shop/search.php?search_query=rtx%204070&p=2",
+    ),
+    "CyberTrade.bg": (
+        "https://cybertrade.bg/product/search?search=rtx%204070",
+        "https://cybertrade.bg/product/search?search=rtx%204070&page=2",
+    ),
+    "PcTech.bg": (
+        "https://www.pctech.bg/index.php?route=product/search&search=rtx%204070",
+        "https://www.pctech.bg/index.php?route=product/search&search=rtx%204070&page=2",
+    ),
+    "Pro.bg": (
+        "https://www.pro-bg.com/product/index.php?search_text=rtx%204070&category_id=0",
+        "https://www.pro-bg.com/product/index.php?category_id=0&search_text=rtx%204070&item_from=30",
+    ),
+    "TechnoMall.bg": (
+        "https://www.technomall.bg/search.html?phrase=rtx%204070",
+        "https://www.technomall.bg/search.html?phrase=rtx%204070&action=dmExecAdvancedSearch&page=2",
+    ),
+    "TehnikStore.bg": (
+        "https://tehnik.store/?s=rtx%204070&product_cat=0&post_type=product",
+        "https://tehnik.store/?s=rtx%204070&product_cat=0&post_type=product&orderby=relevance&app=30",
+    ),
+    "AllStore.bg": (
+        "https://allstore.bg/search.html?phrase=rtx%204070&action=dmExecAdvancedSearch&page=1",
+        "https://allstore.bg/search.html?phrase=rtx%204070&action=dmExecAdvancedSearch&page=2",
+    ),
+    "Senetic.bg": ("https://www.senetic.bg/search/?q=rtx%204070", None),
+    "Thx.bg": (
+        "https://thx.bg/bg/search?search_text=rtx%204070",
+        "https://thx.bg/bg/search?search_text=rtx%204070&page=2",
+    ),
+    "GtComputers.bg": (
+        "https://gtcomputers.bg/search_tags/?s=rtx%204070&pg=1",
+        "https://gtcomputers.bg/search_tags/?s=rtx%204070&pg=2",
+    ),
+    "Ezona.bg": ("https://ezona.net/products/search?s=rtx%204070", None),
+    "Tova.bg": ("https://tova.bg/search.html?phrase=rtx%204070", None),
+    "Hits.bg": (
+        "https://hits.bg/bg/search?search_text=rtx%204070",
+        "https://hits.bg/bg/search?search_text=rtx%204070&page=2",
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def scrapers():
+    return {}
+
+
+def get_scraper(scrapers, site):
+    if site not in scrapers:
+        scrapers[site] = registry.create_scraper(site)
+    return scrapers[site]
+
+
+def page_urls(scraper, term):
+    base_url = scraper._get_base_url(term)
+    return [scraper._construct_page_url(base_url, term, page_num) for page_num in range(1, MAX_PAGES + 1)]
+
+
+def test_registry_lists_every_site():
+    assert len(registry.site_names()) == 22
+    assert set(EXPECTED_URLS) == set(registry.site_names())
+
+
+@pytest.mark.parametrize("site", sorted(EXPECTED_URLS))
+def test_expected_page_urls(scrapers, site):
+    urls = page_urls(get_scraper(scrapers, site), "rtx 4070")
+    assert tuple(urls[:2]) == EXPECTED_URLS[site]
+
+
+@pytest.mark.parametrize("term", SEARCH_TERMS)
+@pytest.mark.parametrize("site", registry.site_names())
+def test_page_urls(scrapers, site, term):
+    scraper = get_scraper(scrapers, site)
+    urls = page_urls(scraper, term)
+
+    # Pure function of page_num: asking again (in any order) gives the same URLs
+    assert urls == page_urls(scraper, term)
+    assert list(reversed(urls)) == [
+        scraper._construct_page_url(scraper._get_base_url(term), term, page_num)
+        for page_num in range(MAX_PAGES, 0, -1)
+    ]
+
+    assert urls[0], f"{site} has no URL for page 1"
+    if site in SINGLE_PAGE_SITES:
+        assert urls[1:] == [None] * (MAX_PAGES - 1)
+        return
+
+    assert all(urls), f"{site} stopped paginating early: {urls}"
+    assert len(set(urls)) == MAX_PAGES, f"{site} repeats a page URL: {urls}"
+    assert all(" " not in url for url in urls), f"{site} does not encode the search term: {urls}"
@@ -0,0 +1,68 @@
+import math
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("numpy")
+
+from price_normalizer import normalize_prices, parse_price, parse_prices
+
+
+class StaticRates:
+    """Converter stand-in with fixed rates to BGN"""
+
+    def __init__(self, rates):
+        self.rates = rates
+        self.prefetched = None
+        self.lookups = []
+
+    def prefetch(self, currencies):
+        self.prefetched = list(currencies)
+
+    def get_real_time_rate(self, from_currency, to_currency):
+        self.lookups.append(from_currency)
+        return self.rates.get(from_currency)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("лв123.00", 123.0),
+    ("€12.00 / лв23.47", 12.0),
+    ("1,299.00", 1299.0),
+    ("1.299,00 Ft", 1299.0),
+    ("12,5", 12.5),
+    (42, 42.0),
+    ("N/A", None),
+    (None, None),
+])
+def test_parse_price_formats(text, expected):
+    assert parse_price(text) == expected
+
+
+def test_parse_prices_matches_scalar_parser():
+    values = ["лв123.00", "€12.00 / лв23.47", "1,299.00", "1.299,00 Ft", "12,5", "N/A", None]
+    parsed = parse_prices(values).tolist()
+    for value, price in zip(values, parsed):
+        scalar = parse_price(value)
+        assert (scalar is None and math.isnan(price)) or scalar == price
+
+
+def test_normalize_prices_converts_with_one_lookup_per_currency():
+    products = [
+        {'title': 'a', 'price': '€10.00', 'currency': 'EUR'},
+        {'title': 'b', 'price': '€20.00', 'currency': 'eur'},
+        {'title': 'c', 'price': 'лв15.00', 'currency': 'BGN'},
+        {'title': 'd', 'price': '$5', 'currency': 'XYZ'},
+        {'title': 'e', 'price': 'N/A', 'currency': 'EUR'},
+    ]
+    converter = StaticRates({'EUR': 1.95583, 'BGN': 1.0})
+
+    stats = normalize_prices(products, converter, 'BGN')
+
+    assert sorted(converter.lookups) == ['BGN', 'EUR', 'XYZ']
+    assert stats == {'total': 5, 'converted': 3, 'failed': 1, 'by_currency': {'EUR': 2, 'BGN': 1, 'XYZ': 1}}
+    assert products[0]['converted_price'] == 19.56
+    assert products[0]['target_currency'] == 'BGN'
+    assert products[0]['original_price'] == 10.0
+    assert products[2]['price'] == 15.0 and 'converted_price' not in products[2]
+    assert products[3]['conversion_failed'] is True and products[3]['price'] == 5.0
+    assert products[4]['price'] == 'N/A'
@@ -0,0 +1,98 @@
+import pytest
+
+pytest.importorskip("pandas")
+
+from product_matcher import ProductMatcher, model_codes, product_identifiers, title_tokens
+
+
+def offer(title, price, source, **specs):
+    return dict(title=title, converted_price=price, target_currency="BGN", source=source,
+                url=f"https://{source}/{title}", **specs)
+
+
+def same_cluster(*products):
+    clusters = ProductMatcher().cluster(list(products))
+    return len(clusters) == 1
+
+
+def test_same_cpu_across_stores_is_one_cluster():
+    assert same_cluster(
+        offer("Процесор AMD Ryzen 7 7800X3D", 700.0, "Ardes.bg"),
+        offer("AMD Ryzen 7 7800X3D 4.2GHz 96MB AM5 BOX", 689.9, "Desktop.bg"),
+        offer("CPU AMD RYZEN 7 7800X3D", 720.0, "PIC.bg"),
+    )
+
+
+def test_same_gpu_model_from_same_maker_matches():
+    assert same_cluster(
+        offer("MSI GeForce RTX 4070 Ventus 2X 12GB GDDR6X", 1200.0, "Ardes.bg"),
+        offer("Видеокарта MSI RTX 4070 Ventus 2X 12G", 1180.0, "PIC.bg"),
+    )
+
+
+def test_board_partner_cards_of_one_chip_stay_apart():
+    clusters = ProductMatcher().cluster([
+        offer("ASUS Dual RTX 4070 12GB", 1150.0, "Ardes.bg"),
+        offer("MSI RTX 4070 Ventus 2X 12GB", 1250.0, "Desktop.bg"),
+        offer("Gigabyte RTX 4070 Windforce OC 12GB", 1350.0, "PIC.bg"),
+    ])
+    assert len(clusters) == 3
+
+
+def test_different_series_of_one_maker_stay_apart():
+    assert not same_cluster(
+        offer("ASUS Dual RTX 4070 12GB", 1150.0, "Ardes.bg"),
+        offer("ASUS TUF Gaming RTX 4070 12GB", 1400.0, "PIC.bg"),
+    )
+
+
+def test_generic_title_does_not_chain_two_series():
+    matcher = ProductMatcher()
+    products = [
+        offer("ASUS Dual RTX 4070 12GB", 1150.0, "Ardes.bg"),
+        offer("ASUS RTX 4070 12GB GDDR6X", 1200.0, "Desktop.bg"),
+        offer("ASUS TUF Gaming RTX 4070 12GB", 1400.0, "PIC.bg"),
+    ]
+    for cluster in matcher.cluster(products):
+        titles = {product['title'] for product in cluster}
+        assert not {"ASUS Dual RTX 4070 12GB", "ASUS TUF Gaming RTX 4070 12GB"} <= titles
+    assert all(deal['price_spread'] < 250.0 for deal in matcher.match(products))
+
+
+def test_variant_words_split_models():
+    assert not same_cluster(
+        offer("ASUS TUF RTX 4080 16GB", 2400.0, "Ardes.bg"),
+        offer("ASUS TUF RTX 4080 Super 16GB", 2500.0, "PIC.bg"),
+    )
+
+
+def test_memory_type_is_not_a_model_code():
+    assert model_codes(title_tokens("Kingston Fury Beast 32GB DDR5 GDDR6X PCIe4 AM5")) == frozenset()
+    assert not same_cluster(
+        offer("Kingston Fury Beast 32GB DDR5", 220.0, "Ardes.bg"),
+        offer("Corsair Vengeance 32GB DDR5", 240.0, "PIC.bg"),
+    )
+
+
+def test_shared_part_number_matches_across_titles():
+    assert same_cluster(
+        offer("AMD Ryzen 7 7800X3D", 700.0, "Ardes.bg", MPN="100-100000910WOF"),
+        offer("Ryzen 7 7800X3D Tray", 650.0, "PIC.bg", **{"Part Number": "100100000910WOF"}),
+    )
+
+
+def test_only_exact_identifier_labels_are_used():
+    assert product_identifiers({'Chipset model': 'RTX 4070', 'Модел': 'Dual RTX 4070'}) == set()
+    assert product_identifiers({'EAN:': '4711081914935'}) == {'4711081914935'}
+
+
+def test_match_reports_best_price_and_spread():
+    deals = ProductMatcher().match([
+        offer("AMD Ryzen 7 7800X3D", 700.0, "Ardes.bg"),
+        offer("AMD Ryzen 7 7800X3D BOX", 650.0, "PIC.bg"),
+        offer("ASUS Dual RTX 4070 12GB", 1150.0, "Ardes.bg"),
+    ])
+    assert len(deals) == 1
+    assert deals[0]['best_store'] == "PIC.bg"
+    assert deals[0]['best_price'] == 650.0
+    assert deals[0]['price_spread'] == 50.0
@@ -0,0 +1,108 @@
+import pytest
+
+from scrapers import rate_limiter
+from scrapers.rate_limiter import DomainRateLimiter, TokenBucket, domain_of, looks_like_captcha
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, 'monotonic', fake)
+    return fake
+
+
+def test_burst_then_steady_rate(clock):
+    bucket = TokenBucket(rate=0.5, burst=3)
+    waits = [bucket.reserve() for _ in range(5)]
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(2.0)
+    assert waits[4] == pytest.approx(4.0)
+
+
+def test_tokens_refill_over_time(clock):
+    bucket = TokenBucket(rate=1.0, burst=2)
+    bucket.reserve()
+    bucket.reserve()
+    clock.now += 1.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_throttle_spreads_queued_requests_after_backoff(clock):
+    bucket = TokenBucket(rate=1.0, burst=3, backoff_seconds=10)
+    bucket.on_throttled()
+    assert bucket.rate == pytest.approx(0.5)
+
+    clock.now += 1.0
+    waits = [bucket.reserve() for _ in range(3)]
+    # First request right at the end of the backoff, the rest one token apart at the halved rate
+    assert waits == [pytest.approx(9.0), pytest.approx(11.0), pytest.approx(13.0)]
+
+
+def test_backoff_grows_and_respects_retry_after(clock):
+    bucket = TokenBucket(rate=1.0, burst=1, backoff_seconds=10, max_backoff=25)
+    bucket.on_throttled()
+    bucket.on_throttled()
+    assert bucket.backoff_until == pytest.approx(clock.now + 20)
+    bucket.on_throttled()
+    assert bucket.backoff_until == pytest.approx(clock.now + 25)
+
+    other = TokenBucket(rate=1.0, burst=1)
+    other.on_throttled(retry_after=3)
+    assert other.backoff_until == pytest.approx(clock.now + 3)
+
+
+def test_success_recovers_rate(clock):
+    bucket = TokenBucket(rate=1.0, burst=1)
+    bucket.on_throttled()
+    for _ in range(20):
+        bucket.on_success()
+    assert bucket.rate == pytest.approx(1.0)
+    assert bucket.consecutive_throttles == 0
+
+
+def test_limiter_shares_bucket_per_domain_and_site_limits():
+    limiter = DomainRateLimiter(requests_per_second=1.0, site_limits={'https://www.ardes.bg': {'burst': 7}})
+    assert limiter._bucket(domain_of('https://www.ardes.bg/search?q=x')).burst == 7
+    assert limiter._bucket(domain_of('pic.bg')) is limiter._bucket(domain_of('https://pic.bg/a'))
+
+
+def test_domain_of():
+    assert domain_of('https://www.Ardes.bg/x?y=1') == 'ardes.bg'
+    assert domain_of('desktop.bg') == 'desktop.bg'
+
+
+def test_cloudflare_fronted_page_is_not_a_captcha():
+    page = ('<html><head><title>Видеокарти | PIC.bg</title>'
+            '<script src="/cdn-cgi/challenge-platform/h/b/scripts/jsd/main.js"></script></head>'
+            '<body><div class="product">RTX 4070</div></body></html>')
+    assert not looks_like_captcha(page)
+
+
+def test_cloudflare_interstitial_is_a_captcha():
+    page = ('<html><head><title>Just a moment...</title></head><body>'
+            '<script>window._cf_chl_opt={cvId: "3"};</script>'
+            '<form id="challenge-form" action="/?__cf_chl_f_tk=abc"></form></body></html>')
+    assert looks_like_captcha(page)
+
+
+@pytest.mark.parametrize('page', [
+    '<form action="/errors/validateCaptcha">Type the characters you see in this image</form>',
+    '<script src="https://ct.captcha-delivery.com/c.js"></script>',
+])
+def test_known_captcha_pages(page):
+    assert looks_like_captcha(page)
+
+
+def test_empty_or_huge_text_is_not_a_captcha():
+    assert not looks_like_captcha(None)
+    assert not looks_like_captcha('')
+    assert not looks_like_captcha('are you a robot' + 'x' * 200_001)
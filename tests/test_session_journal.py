@@ -0,0 +1,98 @@
+import sqlite3
+
+from scrapers.session_journal import SessionJournal
+
+SITE = "Ardes.bg"
+
+
+def open_journal(tmp_path, **kwargs):
+    return SessionJournal(path=str(tmp_path / "sessions.sqlite3"), **kwargs)
+
+
+def committed_statuses(tmp_path):
+    """What another connection (or the next process) sees on disk"""
+    db = sqlite3.connect(str(tmp_path / "sessions.sqlite3"))
+    try:
+        return dict(db.execute("SELECT url, status FROM products"))
+    finally:
+        db.close()
+
+
+def test_latest_unfinished_session(tmp_path):
+    journal = open_journal(tmp_path)
+    first = journal.start_session("rtx 4070", 3, [SITE])
+    journal.finish_session(first, 'completed')
+    second = journal.start_session("ryzen 7", 2, [SITE, "PIC.bg"])
+
+    session = journal.get_session()
+    assert session['id'] == second
+    assert session['sites'] == [SITE, "PIC.bg"]
+    assert journal.get_session(first)['status'] == 'completed'
+
+
+def test_product_rows_are_committed_in_batches(tmp_path):
+    journal = open_journal(tmp_path, commit_every=3, commit_seconds=3600)
+    session_id = journal.start_session("rtx 4070", 1, [SITE])
+
+    journal.queue_products(session_id, SITE, ["u1", "u2"], 1)
+    assert committed_statuses(tmp_path) == {}
+
+    journal.product_done(session_id, SITE, "u1", {'title': 'x', 'url': 'u1'}, 1)
+    assert committed_statuses(tmp_path) == {'u1': 'done', 'u2': 'queued'}
+
+    journal.product_done(session_id, SITE, "u2", {'title': 'y', 'url': 'u2'}, 1)
+    journal.close()
+    assert committed_statuses(tmp_path) == {'u1': 'done', 'u2': 'done'}
+
+
+def test_page_done_commits_immediately(tmp_path):
+    journal = open_journal(tmp_path, commit_every=1000, commit_seconds=3600)
+    session_id = journal.start_session("rtx 4070", 1, [SITE])
+    journal.queue_products(session_id, SITE, ["u1"], 1)
+    journal.page_done(session_id, SITE, 1, 1)
+    assert committed_statuses(tmp_path) == {'u1': 'queued'}
+
+
+def test_resume_reopens_pages_with_unfinished_products(tmp_path):
+    journal = open_journal(tmp_path)
+    session_id = journal.start_session("rtx 4070", 3, [SITE])
+
+    journal.queue_products(session_id, SITE, ["a1", "a2", "a3"], 1)
+    journal.product_done(session_id, SITE, "a1", {'title': 'A1', 'url': 'a1'}, 1)
+    journal.product_filtered(session_id, SITE, "a2", 1)
+    journal.products_failed(session_id, SITE, ["a2", "a3"])
+    journal.page_done(session_id, SITE, 1, 3)
+
+    journal.queue_products(session_id, SITE, ["b1"], 2)
+    journal.product_done(session_id, SITE, "b1", {'title': 'B1', 'url': 'b1'}, 2)
+    journal.page_done(session_id, SITE, 2, 1)
+
+    journal.page_done(session_id, SITE, 3, 0)
+
+    progress = journal.site_progress(session_id, SITE)
+    # Page 1 still has a failed product, so it is not completed; the filtered one stays filtered
+    assert progress['pages'] == {2: 1, 3: 0}
+    assert progress['reopened_pages'] == [1]
+    assert progress['unfinished'] == 1
+    assert progress['filtered'] == ["a2"]
+    assert sorted(record['url'] for record in progress['records']) == ["a1", "b1"]
+
+
+def test_failed_does_not_overwrite_done_or_filtered(tmp_path):
+    journal = open_journal(tmp_path)
+    session_id = journal.start_session("rtx 4070", 1, [SITE])
+    journal.queue_products(session_id, SITE, ["u1", "u2"], 1)
+    journal.product_done(session_id, SITE, "u1", {'url': 'u1'}, 1)
+    journal.product_filtered(session_id, SITE, "u2", 1)
+    journal.products_failed(session_id, SITE, ["u1", "u2"])
+    journal.close()
+    assert committed_statuses(tmp_path) == {'u1': 'done', 'u2': 'filtered'}
+
+
+def test_old_sessions_are_pruned(tmp_path):
+    journal = open_journal(tmp_path)
+    session_id = journal.start_session("rtx 4070", 1, [SITE])
+    journal._db.execute("UPDATE sessions SET updated_at = 0 WHERE id = ?", (session_id,))
+    journal.close()
+
+    assert open_journal(tmp_path, keep_days=1).get_session(session_id) is None
@@ -85,6 +85,30 @@ class ScraperOptionsWindow(ctk.CTkToplevel):
         )
         self.headless_switch.pack(anchor="w", padx=5, pady=(10, 15))
 
+        self.lean_profile_switch = ctk.CTkSwitch(
+            self.scroll_frame, text="Lean browser profile (no extensions or background services)", onvalue=True, offvalue=False,
+            text_color=("black", "white"),
+            button_color=("#F5DBBD", "#1A1A1A"),
+            button_hover_color=("#E0CFAF", "#2D2D2D")
+        )
+        self.lean_profile_switch.pack(anchor="w", padx=5, pady=(0, 15))
+
+        self.fast_mode_switch = ctk.CTkSwitch(
+            self.scroll_frame, text="Fast mode (read prices from search pages only)", onvalue=True, offvalue=False,
+            text_color=("black", "white"),
+            button_color=("#F5DBBD", "#1A1A1A"),
+            button_hover_color=("#E0CFAF", "#2D2D2D")
+        )
+        self.fast_mode_switch.pack(anchor="w", padx=5, pady=(0, 15))
+
+        self.incremental_switch = ctk.CTkSwitch(
+            self.scroll_frame, text="Incremental (only reopen new or changed products)", onvalue=True, offvalue=False,
+            text_color=("black", "white"),
+            button_color=("#F5DBBD", "#1A1A1A"),
+            button_hover_color=("#E0CFAF", "#2D2D2D")
+        )
+        self.incremental_switch.pack(anchor="w", padx=5, pady=(0, 15))
+
         ctk.CTkLabel(self.scroll_frame, text="Max Pages to Scrape:").pack(anchor="w", padx=5)
         value_frame = ctk.CTkFrame(self.scroll_frame)
         value_frame.pack(fill="x", padx=5, pady=(0, 5))
@@ -337,7 +361,7 @@ class ScraperOptionsWindow(ctk.CTkToplevel):
         ctk.CTkLabel(self.scroll_frame, text="Save Results As:").pack(anchor="w", padx=5)
         self.output_format_var = ctk.StringVar(value="JSON")
         self.output_format_menu = ctk.CTkOptionMenu(
-            self.scroll_frame, variable=self.output_format_var, values=["JSON", "CSV", "Excel"]
+            self.scroll_frame, variable=self.output_format_var, values=["JSON", "CSV", "Excel", "Parquet"]
         )
         self.output_format_menu.pack(padx=5, pady=5, fill="x")
 
@@ -497,6 +521,9 @@ class ScraperOptionsWindow(ctk.CTkToplevel):
         
         self.browser_menu.set(getattr(first_scraper, 'preferred_browser', 'Chrome'))
         self.headless_switch.select() if getattr(first_scraper, 'headless', False) else self.headless_switch.deselect()
+        self.lean_profile_switch.select() if getattr(first_scraper, 'launch_profile', 'default') == 'lean' else self.lean_profile_switch.deselect()
+        self.fast_mode_switch.select() if getattr(first_scraper, 'scrape_mode', 'full') == 'fast' else self.fast_mode_switch.deselect()
+        self.incremental_switch.select() if getattr(first_scraper, 'incremental_mode', False) else self.incremental_switch.deselect()
         
         max_pages = getattr(first_scraper, 'max_pages', 10)
         self.max_pages_slider.set(max_pages)
@@ -556,6 +583,9 @@ class ScraperOptionsWindow(ctk.CTkToplevel):
         
         self.browser_menu.set(self.settings_manager.get('preferred_browser', 'Chrome'))
         self.headless_switch.select() if self.settings_manager.get('headless', False) else self.headless_switch.deselect()
+        self.lean_profile_switch.select() if self.settings_manager.get('launch_profile', 'default') == 'lean' else self.lean_profile_switch.deselect()
+        self.fast_mode_switch.select() if self.settings_manager.get('scrape_mode', 'full') == 'fast' else self.fast_mode_switch.deselect()
+        self.incremental_switch.select() if self.settings_manager.get('incremental_mode', False) else self.incremental_switch.deselect()
         
         max_pages = self.settings_manager.get('max_pages', 10)
         self.max_pages_slider.set(max_pages)
@@ -656,6 +686,9 @@ class ScraperOptionsWindow(ctk.CTkToplevel):
             "price_format": price_format,
             "preferred_browser": self.browser_menu.get(),
             "headless": self.headless_switch.get(),
+            "launch_profile": "lean" if self.lean_profile_switch.get() else "default",
+            "scrape_mode": "fast" if self.fast_mode_switch.get() else "full",
+            "incremental_mode": self.incremental_switch.get(),
             "max_pages": int(self.max_pages_slider.get()),
             "delay_between_requests": round(self.delay_slider.get(), 2),
             "random_delay_multiplier": round(self.random_slider.get(), 2),